@@ -0,0 +1,3 @@
+"""
+Micro-benchmarks for MongoDB ORM hot paths.
+"""
@@ -0,0 +1,38 @@
+"""
+Compare per-document validation with batch validation through a TypeAdapter.
+
+Run with::
+
+    python -m benchmarks.bench_batch_validation
+"""
+
+from pymongo_orm.utils.converters import doc_to_model, docs_to_models
+
+from .common import BenchUser, best_of, make_user_docs, report
+
+
+def main(sizes: tuple = (1_000, 10_000, 100_000)) -> None:
+    """Run the benchmark."""
+    for count in sizes:
+        docs = make_user_docs(count)
+        repeat = 5 if count < 100_000 else 3
+
+        def per_document(docs: list = docs) -> None:
+            [doc_to_model(doc, BenchUser, True) for doc in docs]
+
+        def batch(docs: list = docs) -> None:
+            # docs_to_models renames _id in place, so give it fresh documents
+            docs_to_models([dict(doc) for doc in docs], BenchUser, True)
+
+        report(
+            f"Validate {count} documents",
+            {
+                "doc_to_model loop": best_of(per_document, repeat),
+                "docs_to_models (batch)": best_of(batch, repeat),
+            },
+            per=count,
+        )
+
+
+if __name__ == "__main__":
+    main()
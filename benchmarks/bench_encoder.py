@@ -0,0 +1,33 @@
+"""
+Compare model_dump() with the compiled per-model encoder on the save path.
+
+Run with::
+
+    python -m benchmarks.bench_encoder
+"""
+
+from pymongo_orm.utils.encoder import get_encoder
+
+from .common import BenchUser, best_of, make_user_docs, report
+
+
+def main(count: int = 10_000) -> None:
+    """Run the benchmark."""
+    users = [BenchUser.model_validate(doc) for doc in make_user_docs(count)]
+    exclude = {"id"}
+    encode = get_encoder(BenchUser, ("id",))
+
+    report(
+        f"Encode {count} models",
+        {
+            "model_dump(exclude={'id'})": best_of(
+                lambda: [user.model_dump(exclude=exclude) for user in users],
+            ),
+            "compiled encoder": best_of(lambda: [encode(user) for user in users]),
+        },
+        per=count,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Measure the per-call overhead of method instrumentation on a no-op call.
+
+Run with::
+
+    python -m benchmarks.bench_instrumentation
+"""
+
+import time
+from functools import wraps
+from typing import Any, Callable
+
+from pymongo_orm.utils.decorators import instrumented, logger, timing_decorator
+from pymongo_orm.utils.metrics import operation_metrics
+
+from .common import BenchUser, best_of, report
+
+
+def legacy_timing(func: Callable[..., Any]) -> Callable[..., Any]:
+    """The timing decorator the implementations used before instrumentation."""
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start_time = time.time()
+        result = func(*args, **kwargs)
+        end_time = time.time()
+        logger.debug(f"{func.__name__} took {end_time - start_time:.4f}s to execute")
+        return result
+
+    return wrapper
+
+
+class NoOpImplementation:
+    """Implementation-shaped class whose operations do nothing."""
+
+    @classmethod
+    def bare(cls, model_class: Any) -> None:
+        """Undecorated no-op."""
+
+    @classmethod
+    @legacy_timing
+    def legacy(cls, model_class: Any) -> None:
+        """No-op with the previous timing decorator."""
+
+    @classmethod
+    @timing_decorator
+    def logged(cls, model_class: Any) -> None:
+        """No-op with the logging timing decorator."""
+
+    @classmethod
+    @instrumented
+    def measured(cls, model_class: Any) -> None:
+        """No-op with operation metrics."""
+
+
+def main(count: int = 200_000) -> None:
+    """Run the benchmark."""
+    calls = range(count)
+    bare = NoOpImplementation.bare
+    legacy = NoOpImplementation.legacy
+    logged = NoOpImplementation.logged
+    measured = NoOpImplementation.measured
+
+    def run(method: Any) -> None:
+        for _ in calls:
+            method(BenchUser)
+
+    timings = {
+        "undecorated": best_of(lambda: run(bare)),
+        "previous timing_decorator": best_of(lambda: run(legacy)),
+        "timing_decorator (DEBUG off)": best_of(lambda: run(logged)),
+        "instrumented, no subscribers": best_of(lambda: run(measured)),
+    }
+    operation_metrics.enable()
+    try:
+        timings["instrumented, histograms on"] = best_of(lambda: run(measured))
+    finally:
+        operation_metrics.disable()
+        operation_metrics.snapshot(reset=True)
+
+    report(f"{count} no-op calls", timings, per=count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compare per-call metadata lookups with the compiled per-class record.
+
+Run with::
+
+    python -m benchmarks.bench_metadata
+"""
+
+from pymongo import MongoClient
+
+from pymongo_orm.utils.converters import resolve_collection_name
+from pymongo_orm.utils.metadata import build_index_models
+
+from .common import BenchUser, best_of, report
+
+
+def main(count: int = 100_000) -> None:
+    """Run the benchmark."""
+    # No server is contacted: creating collection handles is client-side only
+    client: MongoClient = MongoClient(connect=False)
+    db = client["bench"]
+    meta = BenchUser.__model_meta__
+    calls = range(count)
+
+    report(
+        f"Collection lookup x {count}",
+        {
+            "db[resolve_collection_name]": best_of(
+                lambda: [db[resolve_collection_name(BenchUser)] for _ in calls],
+            ),
+            "get_collection (cached)": best_of(
+                lambda: [BenchUser.get_collection(db) for _ in calls],
+            ),
+        },
+        per=count,
+    )
+
+    index_calls = range(count // 10)
+    report(
+        f"Index models x {len(index_calls)}",
+        {
+            "build from __indexes__": best_of(
+                lambda: [
+                    build_index_models(BenchUser.__indexes__) for _ in index_calls
+                ],
+            ),
+            "compiled index_models": best_of(
+                lambda: [list(meta.index_models) for _ in index_calls],
+            ),
+        },
+        per=len(index_calls),
+    )
+
+    report(
+        f"Field membership check x {count}",
+        {
+            "name in model_fields": best_of(
+                lambda: ["age" in BenchUser.model_fields for _ in calls],
+            ),
+            "name in field_names": best_of(
+                lambda: ["age" in BenchUser.__model_meta__.field_names for _ in calls],
+            ),
+        },
+        per=count,
+    )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
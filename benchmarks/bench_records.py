@@ -0,0 +1,71 @@
+"""
+Compare the memory and build time of full models and read-only records.
+
+Run with::
+
+    python -m benchmarks.bench_records
+"""
+
+import gc
+import tracemalloc
+from typing import Any, Callable, List
+
+from pymongo_orm.utils.converters import docs_to_models
+from pymongo_orm.utils.records import get_record_converter
+
+from .common import BenchUser, best_of, make_user_docs, report
+
+
+def measure(build: Callable[[], List[Any]]) -> int:
+    """
+    Measure the memory held by the objects a callable builds.
+
+    Args:
+        build: Callable returning the objects
+
+    Returns:
+        Bytes allocated and still held by the result
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(count: int = 100_000) -> None:
+    """Run the benchmark."""
+    docs = make_user_docs(count)
+    convert = get_record_converter(BenchUser)
+
+    def build_models() -> List[Any]:
+        # docs_to_models renames _id in place, so give it fresh documents
+        return docs_to_models([dict(doc) for doc in docs], BenchUser, False)
+
+    def build_records() -> List[Any]:
+        return [convert(doc) for doc in docs]
+
+    # Documents are kept alive by both, so only the results are counted
+    print(f"Memory for {count} results")
+    model_bytes = measure(build_models)
+    record_bytes = measure(build_records)
+    for label, size in (("models", model_bytes), ("records", record_bytes)):
+        print(
+            f"  {label:<28} {size / 2**20:9.2f} MiB"
+            f"  {size / count:8.0f} B/item  {model_bytes / size:5.2f}x",
+        )
+
+    report(
+        f"Build {count} results (no validation)",
+        {
+            "models": best_of(build_models, 3),
+            "records": best_of(build_records, 3),
+        },
+        per=count,
+    )
+
+
+if __name__ == "__main__":
+    main()
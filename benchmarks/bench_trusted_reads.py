@@ -0,0 +1,30 @@
+"""
+Compare validating and trusted (validation-free) document conversion.
+
+Run with::
+
+    python -m benchmarks.bench_trusted_reads
+"""
+
+from pymongo_orm.utils.converters import doc_to_model
+
+from .common import BenchUser, best_of, make_user_docs, report
+
+
+def main(count: int = 10_000) -> None:
+    """Run the benchmark."""
+    docs = make_user_docs(count)
+
+    results = {
+        "validate=True": best_of(
+            lambda: [doc_to_model(doc, BenchUser, validate=True) for doc in docs],
+        ),
+        "validate=False": best_of(
+            lambda: [doc_to_model(doc, BenchUser, validate=False) for doc in docs],
+        ),
+    }
+    report(f"doc_to_model over {count} documents", results, per=count)
+
+
+if __name__ == "__main__":
+    main()
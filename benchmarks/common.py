@@ -0,0 +1,102 @@
+"""
+Shared fixtures and timing helpers for the benchmarks.
+
+The benchmarks work on in-memory documents shaped like the ones returned by
+PyMongo, so they measure ORM overhead without needing a running server.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from bson import ObjectId
+from pydantic import Field
+
+from pymongo_orm.sync_model.model import SyncMongoModel
+
+
+class BenchUser(SyncMongoModel):
+    """User-like model with a mix of scalar, list and dict fields."""
+
+    __collection__ = "bench_users"
+    __indexes__ = [
+        {"fields": ["email"], "unique": True},
+        {"fields": [("age", -1), "name"]},
+    ]
+
+    name: str = Field(..., min_length=2, max_length=100)
+    email: str = Field(..., min_length=5, max_length=100)
+    age: int = Field(..., ge=0, le=120)
+    bio: Optional[str] = None
+    roles: List[str] = Field(default_factory=list)
+    is_active: bool = True
+    last_login: Optional[datetime] = None
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+def make_user_docs(count: int) -> List[Dict[str, Any]]:
+    """
+    Build raw documents as they would come back from a find() cursor.
+
+    Args:
+        count: Number of documents
+
+    Returns:
+        List of documents
+    """
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "_id": ObjectId(),
+            "name": f"User {i}",
+            "email": f"user{i}@example.com",
+            "age": 20 + i % 50,
+            "bio": "Lorem ipsum dolor sit amet",
+            "roles": ["user", "reader"],
+            "is_active": i % 7 != 0,
+            "last_login": now,
+            "metadata": {"source": "bench", "score": i},
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(count)
+    ]
+
+
+def best_of(func: Callable[[], Any], repeat: int = 5) -> float:
+    """
+    Run a callable several times and return the fastest wall time.
+
+    Args:
+        func: Callable to time
+        repeat: Number of runs
+
+    Returns:
+        Best time in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(title: str, results: Dict[str, float], per: int = 1) -> None:
+    """
+    Print timings relative to the first (baseline) entry.
+
+    Args:
+        title: Benchmark title
+        results: Mapping of label to best time in seconds
+        per: Number of items processed per run, for per-item timings
+    """
+    print(title)
+    baseline = next(iter(results.values()))
+    for label, seconds in results.items():
+        per_item_us = seconds / per * 1e6
+        speedup = baseline / seconds if seconds else float("inf")
+        print(
+            f"  {label:<28} {seconds * 1e3:9.2f} ms"
+            f"  {per_item_us:8.2f} us/item  {speedup:5.2f}x",
+        )
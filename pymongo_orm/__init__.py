@@ -20,6 +20,7 @@ from .exceptions import (
 )
 from .sync_model.connection import SyncMongoConnection
 from .sync_model.model import SyncMongoModel
+from .utils.ids import ObjectIdField
 from .utils.logging import setup_logging
 
 # Then, executable code
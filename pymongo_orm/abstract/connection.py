@@ -2,21 +2,73 @@
 Abstract connection class for MongoDB.
 """
 
+import os
 import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, Dict
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Type
+
+from ..config import DEFAULT_MAX_CLIENTS, DEFAULT_WARM_UP_TIMEOUT
+from ..utils.cache import set_cache_scope
+from ..utils.connections import (
+    ClientStats,
+    ConnectionKey,
+    PoolUsage,
+    connection_key,
+    pick_evictions,
+    redact_uri,
+    with_listeners,
+)
+from ..utils.logging import get_logger
+from ..utils.metrics import MetricsRegistry, MetricsSnapshot
+
+logger = get_logger("connection")
+
+# Incremented in forked children; connections created under an older
+# generation rebuild their client before it is used
+_fork_generation = 0
+
+
+def _reset_after_fork() -> None:
+    """Invalidate inherited clients and registry locks in a forked child."""
+    global _fork_generation
+    _fork_generation += 1
+
+    # A lock held by another parent thread at fork time is never released
+    pending = [AbstractMongoConnection]
+    while pending:
+        conn_class = pending.pop()
+        if "_lock" in conn_class.__dict__:
+            conn_class._lock = threading.Lock()
+        pending.extend(conn_class.__subclasses__())
 
 
 class AbstractMongoConnection(ABC):
     """
     Abstract base class for MongoDB connections.
 
-    This class implements the singleton pattern to ensure only one connection
-    is created for each URI.
+    Connections are registered per URI and client options, so callers asking
+    for the same configuration share one client while different pool sizes
+    or read preferences get their own. At most ``max_clients`` clients are
+    registered; creating another evicts the least recently used idle one
+    and closes its client. A held connection that was evicted builds a new
+    client and registers again the next time it is used, but databases and
+    clients taken from it before the eviction can no longer be used.
+
+    Clients inherited through ``os.fork()`` (e.g. gunicorn pre-fork workers)
+    are never used in the child: each connection builds a new client the
+    first time it is used after the fork.
+
+    Pass ``metrics=True`` to collect command latency, pool and heartbeat
+    metrics through PyMongo monitoring listeners, read with ``stats()``.
+    Connections with and without metrics do not share a client.
     """
 
-    _instances: ClassVar[Dict[str, Any]] = {}
+    _instances: ClassVar[Dict[ConnectionKey, Any]] = {}
+    # Evicted connections whose client is closed once it is idle
+    _retiring: ClassVar[List[Any]] = []
     _lock: ClassVar[threading.Lock] = threading.Lock()
+    max_clients: ClassVar[int] = DEFAULT_MAX_CLIENTS
 
     @abstractmethod
     def __new__(cls, uri: str, **kwargs: Any) -> "AbstractMongoConnection":
@@ -31,6 +83,214 @@ class AbstractMongoConnection(ABC):
             Connection instance
         """
 
+    @classmethod
+    def _get_or_create(
+        cls,
+        uri: str,
+        options: Dict[str, Any],
+        client_factory: Callable[..., Any],
+    ) -> Any:
+        """
+        Return the registered connection for a configuration, creating it if needed.
+
+        Args:
+            uri: MongoDB connection URI
+            options: Client keyword options, defaults included
+            client_factory: Client class
+
+        Returns:
+            Connection instance
+        """
+        key = cls._registry_key(uri, options)
+        with cls._lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                cls._make_room()
+                instance = object.__new__(cls)
+                instance._uri = uri
+                instance._key = key
+                instance._options = {k: v for k, v in options.items() if k != "metrics"}
+                instance._metrics_enabled = bool(options.get("metrics"))
+                instance._client_factory = client_factory
+                instance._max_pool_size = options.get("maxPoolSize")
+                instance._evicted = False
+                instance._build_client()
+                cls._instances[key] = instance
+                logger.info(f"Created new {cls.__name__} to {redact_uri(uri)}")
+            instance._last_used = time.monotonic()
+        return instance
+
+    @classmethod
+    def _make_room(cls) -> None:
+        """
+        Evict idle connections so one more fits ``max_clients``.
+
+        Must be called with the registry lock held. Only connections with no
+        checked-out sockets are chosen, and their clients are closed; one
+        that got busy in the meantime is closed once it is idle again.
+        """
+        cls._close_retired()
+        for conn in pick_evictions(cls._instances, cls.max_clients):
+            del cls._instances[conn._key]
+            logger.info(
+                f"Evicting idle {cls.__name__} to {redact_uri(conn._uri)} "
+                f"(max_clients={cls.max_clients})",
+            )
+            conn._retire()
+
+    def _retire(self) -> None:
+        """
+        Close the client of a connection that left the registry.
+
+        Must be called with the registry lock held. A client with sockets
+        still checked out is closed by a later ``_close_retired()``.
+        """
+        self._evicted = True
+        if self._usage.idle:
+            self._close_client()
+        else:
+            self._retiring.append(self)
+
+    @classmethod
+    def _close_retired(cls) -> None:
+        """Close the clients of evicted connections that are now idle."""
+        for conn in list(cls._retiring):
+            if conn._usage.idle:
+                cls._retiring.remove(conn)
+                conn._close_client()
+
+    def _register_again(self) -> None:
+        """Reopen an evicted connection that is used again and register it."""
+        with self._lock:
+            if not self._evicted:
+                return
+            self._evicted = False
+            if self in self._retiring:
+                # Its client was never closed
+                self._retiring.remove(self)
+            else:
+                logger.info(
+                    f"Reopening evicted {type(self).__name__} to "
+                    f"{redact_uri(self._uri)}",
+                )
+                self._build_client()
+            if self._key not in self._instances:
+                self._make_room()
+                self._instances[self._key] = self
+
+    @classmethod
+    def _registry_key(cls, uri: str, options: Dict[str, Any]) -> Any:
+        """
+        Build the key a connection is registered under.
+
+        Args:
+            uri: MongoDB connection URI
+            options: Client keyword options
+
+        Returns:
+            Hashable key
+        """
+        return connection_key(uri, options)
+
+    def _build_client(self) -> None:
+        """Create the client for the current process."""
+        self._metrics: Optional[MetricsRegistry] = None
+        listeners: List[Any]
+        if self._metrics_enabled:
+            self._metrics = MetricsRegistry(self._max_pool_size)
+            listeners = self._metrics.listeners()
+            # The metrics pool listener keeps the usage counts too
+            self._usage: PoolUsage = self._metrics.pool
+        else:
+            self._usage = PoolUsage()
+            listeners = [self._usage]
+        self._client = self._client_factory(
+            self._uri,
+            **with_listeners(self._options, *listeners),
+        )
+        set_cache_scope(self._client, self._key)
+        self._generation = _fork_generation
+        self._client_open = True
+
+    def _current_client(self) -> Any:
+        """
+        Get the client, rebuilding it first if it was inherited through a fork.
+
+        Also marks the connection as used, for least-recently-used eviction,
+        and reopens and registers it again if it was evicted.
+
+        Returns:
+            MongoDB client instance
+        """
+        self._last_used = time.monotonic()
+        if self._evicted:
+            self._register_again()
+        if self._generation != _fork_generation:
+            with self._lock:
+                if self._generation != _fork_generation:
+                    logger.info(
+                        f"Rebuilding {type(self).__name__} to "
+                        f"{redact_uri(self._uri)} after fork",
+                    )
+                    self._build_client()
+        return self._client
+
+    def _close_client(self) -> None:
+        """Close the client once, unless it belongs to the parent of a fork."""
+        if self._client_open and self._generation == _fork_generation:
+            self._client.close()
+        self._client_open = False
+
+    @classmethod
+    def pool_stats(cls) -> List[ClientStats]:
+        """
+        Report the pool usage of every registered client.
+
+        Returns:
+            One entry per client, most recently used first
+        """
+        now = time.monotonic()
+        with cls._lock:
+            instances = list(cls._instances.values())
+        instances.sort(key=lambda conn: conn._last_used, reverse=True)
+        return [
+            ClientStats(
+                uri=redact_uri(conn._uri),
+                max_pool_size=conn._max_pool_size,
+                open_connections=conn._usage.open_connections,
+                checked_out=conn._usage.checked_out,
+                idle_seconds=now - conn._last_used,
+            )
+            for conn in instances
+        ]
+
+    def stats(self, reset: bool = False) -> Optional[MetricsSnapshot]:
+        """
+        Get the command, pool and heartbeat metrics of this connection.
+
+        Metrics are collected only for connections created with
+        ``metrics=True``, and cover the current process.
+
+        Args:
+            reset: Whether to clear the latency histograms and counters after
+                taking the snapshot
+
+        Returns:
+            Metrics snapshot, or None if metrics are not enabled
+        """
+        self._current_client()
+        if self._metrics is None:
+            return None
+        return self._metrics.snapshot(reset=reset)
+
+    def _unregister(self) -> None:
+        """Remove this connection from the registry."""
+        with self._lock:
+            if self._instances.get(self._key) is self:
+                del self._instances[self._key]
+            if self in self._retiring:
+                self._retiring.remove(self)
+
     @abstractmethod
     def get_db(self, *, db_name: str) -> Any:
         """
@@ -52,8 +312,34 @@ class AbstractMongoConnection(ABC):
             MongoDB client instance
         """
 
+    @abstractmethod
+    def warm_up(
+        self,
+        timeout: float = DEFAULT_WARM_UP_TIMEOUT,
+        min_connections: Optional[int] = None,
+        models: Iterable[Type[Any]] = (),
+        db_name: Optional[str] = None,
+    ) -> Any:
+        """
+        Open the connection ahead of the first request and report readiness.
+
+        Args:
+            timeout: Seconds the whole warm-up may take
+            min_connections: Pooled connections to open (None uses the
+                ``minPoolSize`` option, or 1)
+            models: Model classes whose collections to touch
+            db_name: Database of the models (required with ``models``)
+
+        Returns:
+            Warm-up report (awaitable in async implementations)
+        """
+
     @abstractmethod
     def close(self) -> None:
         """
         Close the MongoDB connection and clean up resources.
         """
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -3,7 +3,21 @@ Abstract MongoDB implementation interface.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from bson import ObjectId
 
 # Type variables
 T = TypeVar("T")
@@ -35,6 +49,56 @@ class AbstractMongoImplementation(ABC):
             The saved model instance
         """
 
+    @classmethod
+    @abstractmethod
+    def save_many(
+        cls,
+        model_class: Type[T],
+        db: D,
+        models: Iterable[Any],
+        ordered: bool = False,
+        chunk_size: int = 0,
+    ) -> Any:
+        """
+        Save many models using batched bulk writes.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            models: Model instances to save
+            ordered: Stop at the first failure instead of continuing
+            chunk_size: Maximum number of operations per bulk write
+
+        Returns:
+            Result listing the saved models and the per-model errors
+        """
+
+    @classmethod
+    @abstractmethod
+    def execute_writes(
+        cls,
+        model_class: Type[T],
+        db: D,
+        writes: List[Any],
+        ordered: bool = False,
+        chunk_size: int = 0,
+        result: Optional[Any] = None,
+    ) -> Any:
+        """
+        Send planned writes as chunked bulk writes and record the outcome.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            writes: Planned writes
+            ordered: Stop at the first failure instead of continuing
+            chunk_size: Maximum number of operations per bulk write
+            result: Result to record into (a new one is created if None)
+
+        Returns:
+            Result listing the saved models and the per-model errors
+        """
+
     @classmethod
     @abstractmethod
     def find_one(
@@ -43,6 +107,8 @@ class AbstractMongoImplementation(ABC):
         db: D,
         query: QueryType,
         projection: Optional[ProjectionType] = None,
+        validate: Optional[bool] = None,
+        as_: str = "model",
     ) -> Optional[T]:
         """
         Find a single document matching the query.
@@ -52,9 +118,11 @@ class AbstractMongoImplementation(ABC):
             db: Database instance
             query: MongoDB query
             projection: Fields to include/exclude
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            as_: Result type: "model", "dict", "record" or "bson" (``RawBSONDocument``)
 
         Returns:
-            Model instance or None if not found
+            Result in the requested form, or None if not found
         """
 
     @classmethod
@@ -68,6 +136,8 @@ class AbstractMongoImplementation(ABC):
         sort: Optional[SortType] = None,
         skip: int = 0,
         limit: int = 0,
+        validate: Optional[bool] = None,
+        as_: str = "model",
     ) -> List[T]:
         """
         Find documents matching the query.
@@ -80,9 +150,167 @@ class AbstractMongoImplementation(ABC):
             sort: Sort specification
             skip: Number of documents to skip
             limit: Maximum number of documents to return
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            as_: Result type: "model", "dict", "record" or "bson" (``RawBSONDocument``)
+
+        Returns:
+            List of results in the requested form
+        """
+
+    @classmethod
+    @abstractmethod
+    def find_by_ids(
+        cls,
+        model_class: Type[T],
+        db: D,
+        ids: Iterable[Union[str, ObjectId]],
+        chunk_size: int = 0,
+        preserve_order: bool = True,
+        missing: str = "skip",
+        projection: Optional[ProjectionType] = None,
+        validate: Optional[bool] = None,
+    ) -> List[Optional[T]]:
+        """
+        Find documents by a list of ids.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            ids: Document ids (strings or ObjectIds)
+            chunk_size: Maximum ids per ``$in`` query
+            preserve_order: Return results in the order of ``ids``
+            missing: Policy for ids that are not found: "skip", "none" or "raise"
+            projection: Fields to include/exclude
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
 
         Returns:
-            List of model instances
+            Model instances (None for missing ids when ``missing="none"``)
+        """
+
+    @classmethod
+    @abstractmethod
+    def iter_find(
+        cls,
+        model_class: Type[T],
+        db: D,
+        query: Optional[QueryType] = None,
+        projection: Optional[ProjectionType] = None,
+        sort: Optional[SortType] = None,
+        skip: int = 0,
+        limit: int = 0,
+        batch_size: int = 0,
+        validate: Optional[bool] = None,
+    ) -> Iterator[T]:
+        """
+        Lazily iterate over documents matching the query.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            query: MongoDB query
+            projection: Fields to include/exclude
+            sort: Sort specification
+            skip: Number of documents to skip
+            limit: Maximum number of documents to return
+            batch_size: Number of documents fetched per server round trip
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+
+        Yields:
+            Model instances
+        """
+
+    @classmethod
+    @abstractmethod
+    def parallel_scan(
+        cls,
+        model_class: Type[T],
+        db: D,
+        query: Optional[QueryType] = None,
+        partitions: int = 0,
+        projection: Optional[ProjectionType] = None,
+        batch_size: int = 0,
+        validate: Optional[bool] = None,
+        split: str = "sample",
+    ) -> Iterator[T]:
+        """
+        Iterate over documents matching the query, scanning ranges in parallel.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            query: MongoDB query
+            partitions: Number of ranges scanned at the same time
+            projection: Fields to include/exclude
+            batch_size: Number of documents fetched per server round trip
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            split: How to choose range boundaries: "sample" (``$sample`` of
+                the matching ids) or "timestamp" (even ObjectId time ranges)
+
+        Yields:
+            Model instances
+        """
+
+    @classmethod
+    @abstractmethod
+    def parallel_scan_each(
+        cls,
+        model_class: Type[T],
+        db: D,
+        callback: Callable[[int, T], Any],
+        query: Optional[QueryType] = None,
+        partitions: int = 0,
+        projection: Optional[ProjectionType] = None,
+        batch_size: int = 0,
+        validate: Optional[bool] = None,
+        split: str = "sample",
+    ) -> int:
+        """
+        Scan documents matching the query, one worker per ``_id`` range.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            callback: Function called for every document
+            query: MongoDB query
+            partitions: Number of ranges scanned at the same time
+            projection: Fields to include/exclude
+            batch_size: Number of documents fetched per server round trip
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            split: How to choose range boundaries: "sample" (``$sample`` of
+                the matching ids) or "timestamp" (even ObjectId time ranges)
+
+        Returns:
+            Number of documents scanned
+        """
+
+    @classmethod
+    @abstractmethod
+    def paginate(
+        cls,
+        model_class: Type[T],
+        db: D,
+        query: Optional[QueryType] = None,
+        sort: Optional[SortType] = None,
+        limit: int = 0,
+        token: Optional[str] = None,
+        projection: Optional[ProjectionType] = None,
+        validate: Optional[bool] = None,
+    ) -> Any:
+        """
+        Fetch one page of documents using keyset pagination.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            query: MongoDB query
+            sort: Sort specification
+            limit: Maximum number of documents per page
+            token: Continuation token from the previous page
+            projection: Fields to include/exclude
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+
+        Returns:
+            Page of model instances
         """
 
     @classmethod
@@ -143,6 +371,8 @@ class AbstractMongoImplementation(ABC):
         model_class: Type[T],
         db: D,
         query: Optional[QueryType] = None,
+        limit: int = 0,
+        approximate: Optional[bool] = None,
     ) -> int:
         """
         Count documents matching the query.
@@ -151,6 +381,9 @@ class AbstractMongoImplementation(ABC):
             model_class: Model class
             db: Database instance
             query: MongoDB query
+            limit: Stop counting at this many documents (0 counts them all)
+            approximate: Use the collection metadata count (None uses it
+                when the query is empty)
 
         Returns:
             Document count
@@ -167,6 +400,40 @@ class AbstractMongoImplementation(ABC):
             db: Database instance
         """
 
+    @classmethod
+    @abstractmethod
+    def aggregate_iter(
+        cls,
+        model_class: Type[T],
+        db: D,
+        pipeline: List[Dict[str, Any]],
+        allow_disk_use: Optional[bool] = None,
+        batch_size: int = 0,
+        max_time_ms: Optional[int] = None,
+        hint: Optional[Union[str, List[tuple]]] = None,
+        output_model: Optional[Type[Any]] = None,
+        as_: str = "dict",
+        validate: Optional[bool] = None,
+    ) -> Iterator[Any]:
+        """
+        Lazily iterate over the results of an aggregation pipeline.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            pipeline: Aggregation pipeline
+            allow_disk_use: Let stages spill to temporary files past the memory limit
+            batch_size: Number of rows fetched per server round trip
+            max_time_ms: Server-side time limit in milliseconds
+            hint: Index name or specification to use
+            output_model: Pydantic model to build from each row
+            as_: Result type without an output model: "dict" or "bson"
+            validate: Whether to validate rows built into ``output_model``
+
+        Yields:
+            Pipeline results
+        """
+
     @classmethod
     @abstractmethod
     def aggregate(
@@ -174,6 +441,7 @@ class AbstractMongoImplementation(ABC):
         model_class: Type[T],
         db: D,
         pipeline: List[Dict[str, Any]],
+        as_: str = "dict",
     ) -> List[Dict[str, Any]]:
         """
         Run an aggregation pipeline.
@@ -182,6 +450,7 @@ class AbstractMongoImplementation(ABC):
             model_class: Model class
             db: Database instance
             pipeline: Aggregation pipeline
+            as_: Result type: "dict" or "bson" (``RawBSONDocument``)
 
         Returns:
             Pipeline results
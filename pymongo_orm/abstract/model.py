@@ -4,11 +4,45 @@ Abstract model base class for MongoDB ORM.
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
+from bson import ObjectId
 from pydantic import BaseModel, Field
 
-from ..utils.converters import resolve_collection_name
+from ..config import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_BUFFER_MAX_AGE,
+    DEFAULT_BUFFER_MAX_SIZE,
+    DEFAULT_BULK_CHUNK_SIZE,
+    DEFAULT_ID_CHUNK_SIZE,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_SCAN_PARTITIONS,
+)
+from ..utils.bulk import SaveManyResult
+from ..utils.cache import (
+    CacheStats,
+    get_count_cache,
+    get_query_cache,
+    invalidate_query_cache,
+)
+from ..utils.handles import get_model_collection
+from ..utils.metadata import ModelMeta, compile_model_meta
+from ..utils.pagination import Page
 from .implementation import (
     AbstractMongoImplementation,
     ProjectionType,
@@ -40,11 +74,26 @@ class AbstractMongoModel(BaseModel, Generic[D, C], ABC):
     _pre_delete_hooks: List[Callable] = []
     _post_delete_hooks: List[Callable] = []
 
+    # Change tracking: persisted state and fields assigned since then
+    _snapshot: Optional[Dict[str, Any]] = None
+    _assigned_fields: Optional[Set[str]] = None
+
     # Collection configuration
     __collection__: str = ""
     __indexes__: List[Dict[str, Any]] = []
-    __write_concern__: Dict[str, Any] = {"w": 1}
-    __read_preference__: str = "primary"
+    # None inherits the database's setting
+    __write_concern__: Optional[Dict[str, Any]] = None
+    __read_preference__: Optional[str] = None
+    __read_concern__: Optional[str] = None
+    __trusted_reads__: bool = False
+    # Keep id as the stored _id value (declare the id field's type, e.g.
+    # ``id: Optional[ObjectIdField] = None``) instead of converting it
+    __native_id__: bool = False
+    __cache__: Optional[Dict[str, Any]] = None
+    __count_cache__: Optional[Dict[str, Any]] = None
+
+    # Compiled from the settings above when a subclass is created
+    __model_meta__: ClassVar[ModelMeta]
 
     class Config:
         """Pydantic configuration."""
@@ -52,21 +101,54 @@ class AbstractMongoModel(BaseModel, Generic[D, C], ABC):
         arbitrary_types_allowed = True
         validate_assignment = True
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Compile the class metadata once pydantic has built the fields."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__model_meta__ = compile_model_meta(cls)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute and record field assignments for change tracking."""
+        super().__setattr__(name, value)
+        if self._snapshot is not None and name in type(self).__model_meta__.field_names:
+            if self._assigned_fields is None:
+                self._assigned_fields = set()
+            self._assigned_fields.add(name)
+
     @classmethod
     def get_collection(cls, db: D) -> C:
         """
         Get the MongoDB collection for this model.
 
+        ``__read_preference__``, ``__write_concern__`` and ``__read_concern__``
+        are applied to the collection, and the handle is cached per database.
+
         Args:
             db: Database instance
 
         Returns:
             Collection instance
         """
+        return cast(C, get_model_collection(cls, db))
 
-        collection_name = resolve_collection_name(cls)
+    @classmethod
+    def cache_stats(cls) -> Optional[CacheStats]:
+        """
+        Get the hit/miss/eviction counters of this model's query cache.
+
+        Returns:
+            Cache statistics, or None if ``__cache__`` is not configured
+        """
+        cache = get_query_cache(cls)
+        return cache.stats() if cache is not None else None
 
-        return cast(C, db[collection_name])
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every cached query result and count for this model."""
+        invalidate_query_cache(cls)
+        count_cache = get_count_cache(cls)
+        if count_cache is not None:
+            count_cache.clear()
 
     @abstractmethod
     def save(self, db: D) -> T:
@@ -80,6 +162,65 @@ class AbstractMongoModel(BaseModel, Generic[D, C], ABC):
             Saved model instance
         """
 
+    @classmethod
+    @abstractmethod
+    def save_many(
+        cls: Type[T],
+        db: D,
+        models: Iterable[T],
+        ordered: bool = False,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> SaveManyResult[T]:
+        """
+        Save many models using batched bulk writes.
+
+        Args:
+            db: Database instance
+            models: Model instances to save
+            ordered: Stop at the first failure instead of continuing
+            chunk_size: Maximum number of operations per bulk write
+
+        Returns:
+            Result listing the saved models and the per-model errors
+        """
+
+    @classmethod
+    @abstractmethod
+    def write_buffer(
+        cls: Type[T],
+        db: D,
+        max_size: int = DEFAULT_BUFFER_MAX_SIZE,
+        max_age: float = DEFAULT_BUFFER_MAX_AGE,
+        ordered: bool = False,
+        on_error: Optional[Callable[[SaveManyResult], None]] = None,
+    ) -> Any:
+        """
+        Create a write-behind buffer for this model.
+
+        Args:
+            db: Database instance
+            max_size: Pending documents that trigger a flush
+            max_age: Seconds a write may stay pending before it is flushed
+            ordered: Stop each flush at the first failure
+            on_error: Called with the result of a flush that had failures
+
+        Returns:
+            Write buffer (use it as a context manager to drain on exit)
+        """
+
+    @classmethod
+    @abstractmethod
+    def objects(cls: Type[T], db: D) -> Any:
+        """
+        Start a lazy, chainable query on this model.
+
+        Args:
+            db: Database instance
+
+        Returns:
+            Query set matching every document
+        """
+
     @classmethod
     @abstractmethod
     def find_one(
@@ -87,6 +228,8 @@ class AbstractMongoModel(BaseModel, Generic[D, C], ABC):
         db: D,
         query: QueryType,
         projection: Optional[ProjectionType] = None,
+        validate: Optional[bool] = None,
+        as_: str = "model",
     ) -> Optional[T]:
         """
         Find a single document matching the query.
@@ -95,9 +238,11 @@ class AbstractMongoModel(BaseModel, Generic[D, C], ABC):
             db: Database instance
             query: MongoDB query
             projection: Fields to include/exclude
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            as_: Result type: "model", "dict", "record" or "bson" (``RawBSONDocument``)
 
         Returns:
-            Model instance or None if not found
+            Result in the requested form, or None if not found
         """
 
     @classmethod
@@ -110,6 +255,8 @@ class AbstractMongoModel(BaseModel, Generic[D, C], ABC):
         sort: Optional[SortType] = None,
         skip: int = 0,
         limit: int = 0,
+        validate: Optional[bool] = None,
+        as_: str = "model",
     ) -> List[T]:
         """
         Find documents matching the query.
@@ -121,9 +268,157 @@ class AbstractMongoModel(BaseModel, Generic[D, C], ABC):
             sort: Sort specification
             skip: Number of documents to skip
             limit: Maximum number of documents to return
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            as_: Result type: "model", "dict", "record" or "bson" (``RawBSONDocument``)
+
+        Returns:
+            List of results in the requested form
+        """
+
+    @classmethod
+    @abstractmethod
+    def find_by_ids(
+        cls: Type[T],
+        db: D,
+        ids: Iterable[Union[str, ObjectId]],
+        chunk_size: int = DEFAULT_ID_CHUNK_SIZE,
+        preserve_order: bool = True,
+        missing: str = "skip",
+        projection: Optional[ProjectionType] = None,
+        validate: Optional[bool] = None,
+    ) -> List[Optional[T]]:
+        """
+        Find documents by a list of ids.
+
+        Args:
+            db: Database instance
+            ids: Document ids (strings or ObjectIds)
+            chunk_size: Maximum ids per ``$in`` query
+            preserve_order: Return results in the order of ``ids``
+            missing: Policy for ids that are not found: "skip", "none" or "raise"
+            projection: Fields to include/exclude
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+
+        Returns:
+            Model instances (None for missing ids when ``missing="none"``)
+        """
+
+    @classmethod
+    @abstractmethod
+    def iter_find(
+        cls: Type[T],
+        db: D,
+        query: Optional[QueryType] = None,
+        projection: Optional[ProjectionType] = None,
+        sort: Optional[SortType] = None,
+        skip: int = 0,
+        limit: int = 0,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        validate: Optional[bool] = None,
+    ) -> Iterator[T]:
+        """
+        Lazily iterate over documents matching the query.
+
+        Args:
+            db: Database instance
+            query: MongoDB query
+            projection: Fields to include/exclude
+            sort: Sort specification
+            skip: Number of documents to skip
+            limit: Maximum number of documents to return
+            batch_size: Number of documents fetched per server round trip
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+
+        Yields:
+            Model instances
+        """
+
+    @classmethod
+    @abstractmethod
+    def parallel_scan(
+        cls: Type[T],
+        db: D,
+        query: Optional[QueryType] = None,
+        partitions: int = DEFAULT_SCAN_PARTITIONS,
+        projection: Optional[ProjectionType] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        validate: Optional[bool] = None,
+        split: str = "sample",
+    ) -> Iterator[T]:
+        """
+        Iterate over documents matching the query, scanning ranges in parallel.
+
+        Args:
+            db: Database instance
+            query: MongoDB query
+            partitions: Number of ranges scanned at the same time
+            projection: Fields to include/exclude
+            batch_size: Number of documents fetched per server round trip
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            split: How to choose range boundaries: "sample" (``$sample`` of
+                the matching ids) or "timestamp" (even ObjectId time ranges)
+
+        Yields:
+            Model instances
+        """
+
+    @classmethod
+    @abstractmethod
+    def parallel_scan_each(
+        cls: Type[T],
+        db: D,
+        callback: Callable[[int, T], Any],
+        query: Optional[QueryType] = None,
+        partitions: int = DEFAULT_SCAN_PARTITIONS,
+        projection: Optional[ProjectionType] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        validate: Optional[bool] = None,
+        split: str = "sample",
+    ) -> int:
+        """
+        Scan documents matching the query, one worker per ``_id`` range.
+
+        Args:
+            db: Database instance
+            callback: Function called for every document
+            query: MongoDB query
+            partitions: Number of ranges scanned at the same time
+            projection: Fields to include/exclude
+            batch_size: Number of documents fetched per server round trip
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            split: How to choose range boundaries: "sample" (``$sample`` of
+                the matching ids) or "timestamp" (even ObjectId time ranges)
+
+        Returns:
+            Number of documents scanned
+        """
+
+    @classmethod
+    @abstractmethod
+    def paginate(
+        cls: Type[T],
+        db: D,
+        query: Optional[QueryType] = None,
+        sort: Optional[SortType] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        token: Optional[str] = None,
+        projection: Optional[ProjectionType] = None,
+        validate: Optional[bool] = None,
+    ) -> Page[T]:
+        """
+        Fetch one page of documents using keyset pagination.
+
+        Args:
+            db: Database instance
+            query: MongoDB query
+            sort: Sort specification
+            limit: Maximum number of documents per page
+            token: Continuation token from the previous page's ``next_token``
+            projection: Fields to include/exclude
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
 
         Returns:
-            List of model instances
+            Page of model instances
         """
 
     @abstractmethod
@@ -169,13 +464,22 @@ class AbstractMongoModel(BaseModel, Generic[D, C], ABC):
 
     @classmethod
     @abstractmethod
-    def count(cls, db: D, query: Optional[QueryType] = None) -> int:
+    def count(
+        cls,
+        db: D,
+        query: Optional[QueryType] = None,
+        limit: int = 0,
+        approximate: Optional[bool] = None,
+    ) -> int:
         """
         Count documents matching the query.
 
         Args:
             db: Database instance
             query: MongoDB query
+            limit: Stop counting at this many documents (0 counts them all)
+            approximate: Use the collection metadata count (None uses it
+                when the query is empty)
 
         Returns:
             Document count
@@ -193,18 +497,56 @@ class AbstractMongoModel(BaseModel, Generic[D, C], ABC):
 
     @classmethod
     @abstractmethod
-    def aggregate(cls, db: D, pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def aggregate(
+        cls,
+        db: D,
+        pipeline: List[Dict[str, Any]],
+        as_: str = "dict",
+    ) -> List[Dict[str, Any]]:
         """
         Run an aggregation pipeline.
 
         Args:
             db: Database instance
             pipeline: Aggregation pipeline
+            as_: Result type: "dict" or "bson" (``RawBSONDocument``)
 
         Returns:
             Pipeline results
         """
 
+    @classmethod
+    @abstractmethod
+    def aggregate_iter(
+        cls,
+        db: D,
+        pipeline: List[Dict[str, Any]],
+        allow_disk_use: Optional[bool] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_time_ms: Optional[int] = None,
+        hint: Optional[Union[str, List[tuple]]] = None,
+        output_model: Optional[Type[Any]] = None,
+        as_: str = "dict",
+        validate: Optional[bool] = None,
+    ) -> Iterator[Any]:
+        """
+        Lazily iterate over the results of an aggregation pipeline.
+
+        Args:
+            db: Database instance
+            pipeline: Aggregation pipeline
+            allow_disk_use: Let stages spill to temporary files past the memory limit
+            batch_size: Number of rows fetched per server round trip
+            max_time_ms: Server-side time limit in milliseconds
+            hint: Index name or specification to use
+            output_model: Pydantic model to build from each row
+            as_: Result type without an output model: "dict" or "bson"
+            validate: Whether to validate rows built into ``output_model``
+
+        Yields:
+            Pipeline results
+        """
+
     @classmethod
     @abstractmethod
     def bulk_write(cls, db: D, operations: List[Dict[str, Any]]) -> Any:
@@ -229,7 +571,7 @@ class AbstractMongoModel(BaseModel, Generic[D, C], ABC):
             MongoDB implementation
         """
 
-    def _run_hooks(self, hooks: List[Callable]) -> None:
+    def _run_hooks(self, hooks: Iterable[Callable]) -> None:
         """
         Run hooks on the model.
 
@@ -243,7 +585,113 @@ class AbstractMongoModel(BaseModel, Generic[D, C], ABC):
         """
         Prepare the model for saving.
 
-        This method updates the updated_at timestamp and runs pre-save hooks.
+        This method runs pre-save hooks. New documents get their updated_at
+        timestamp here; existing ones are stamped by _get_changes() only when
+        something actually changed.
         """
-        self.updated_at = datetime.now(timezone.utc)
+        if self.id is None:
+            self.updated_at = datetime.now(timezone.utc)
         self._run_hooks(self._pre_save_hooks)
+
+    def _mark_loaded(self, doc: Dict[str, Any]) -> None:
+        """
+        Snapshot the document this instance was loaded from.
+
+        Args:
+            doc: Stored document (``id`` is ignored)
+        """
+        snapshot = {
+            k: _copy_value(v) if type(v) in _CONTAINER_TYPES else v
+            for k, v in doc.items()
+        }
+        snapshot.pop("id", None)
+
+        # Write private state directly; this runs for every loaded document
+        private = self.__pydantic_private__
+        private["_snapshot"] = snapshot
+        private["_assigned_fields"] = None
+
+    def _mark_saved(self, update: Dict[str, Any]) -> None:
+        """
+        Apply a successfully written update to the snapshot.
+
+        Args:
+            update: Update document returned by _get_changes()
+        """
+        snapshot = dict(self._snapshot or {})
+        snapshot.update(update.get("$set", {}))
+        for field in update.get("$unset", {}):
+            snapshot.pop(field, None)
+        self._snapshot = snapshot
+        self._assigned_fields = None
+
+    def _mark_unsaved(self, inserted: bool) -> None:
+        """
+        Roll back a buffered write that failed.
+
+        The snapshot is dropped so the next save() sends every field, and a
+        failed insert gets its client-side id cleared so it is inserted again.
+
+        Args:
+            inserted: Whether the failed write was an insert
+        """
+        self._snapshot = None
+        self._assigned_fields = None
+        if inserted:
+            self.id = None
+
+    def _get_changes(self) -> Dict[str, Any]:
+        """
+        Build a minimal update document for the changes since the last load or save.
+
+        Fields are compared against the snapshot, so in-place mutations of
+        lists and dicts are detected too. Models without a snapshot (e.g.
+        constructed with an explicit id) fall back to setting every field.
+
+        Returns:
+            Update with ``$set``/``$unset`` keys, or an empty dict if nothing
+            changed
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.updated_at = datetime.now(timezone.utc)
+            return {"$set": type(self).__model_meta__.encode(self)}
+
+        assigned = self._assigned_fields or ()
+        current = type(self).__model_meta__.encode(self)
+        current.pop("updated_at", None)
+        changed = {
+            field: value
+            for field, value in current.items()
+            if (snapshot[field] != value if field in snapshot else field in assigned)
+        }
+        removed = {}
+        if type(self).__model_meta__.allows_extra:
+            removed = {
+                field: ""
+                for field in snapshot
+                if field not in current and field != "updated_at"
+            }
+
+        if not changed and not removed:
+            return {}
+
+        self.updated_at = datetime.now(timezone.utc)
+        changed["updated_at"] = self.updated_at
+
+        update: Dict[str, Any] = {"$set": changed}
+        if removed:
+            update["$unset"] = removed
+        return update
+
+
+_CONTAINER_TYPES = (list, dict)
+
+
+def _copy_value(value: Any) -> Any:
+    """Copy nested lists and dicts so snapshots are not shared with the model."""
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _copy_value(item) for key, item in value.items()}
+    return value
@@ -0,0 +1,207 @@
+"""
+Asynchronous write-behind buffer.
+"""
+
+import asyncio
+from types import TracebackType
+from typing import Callable, Generic, Optional, Type, TypeVar
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ..config import (
+    DEFAULT_BUFFER_MAX_AGE,
+    DEFAULT_BUFFER_MAX_SIZE,
+    DEFAULT_BULK_CHUNK_SIZE,
+)
+from ..utils.buffer import PendingWrites, rollback_unsent
+from ..utils.bulk import SaveManyResult
+from ..utils.logging import get_logger
+from .implementation import AsyncMongoImplementation
+
+# Type variables
+T = TypeVar("T")
+ErrorHandler = Callable[[SaveManyResult], None]
+
+logger = get_logger("async.buffer")
+
+
+class AsyncWriteBuffer(Generic[T]):
+    """
+    Write-behind buffer that coalesces saves into periodic bulk writes.
+
+    ``save()`` only records the write; repeated saves of the same document
+    are merged. Pending writes are flushed when ``max_size`` documents are
+    buffered (by the saving task) or once the oldest pending write is
+    ``max_age`` seconds old (by a background task). Writes that fail are
+    rolled back on the model and reported to ``on_error``; they are not
+    retried. Use ``async with`` or call ``close()`` before the event loop
+    shuts down so pending writes are drained.
+
+    Example:
+        async with User.write_buffer(db, max_size=500) as buffer:
+            async for event in events:
+                await buffer.save(User(**event))
+    """
+
+    def __init__(
+        self,
+        model_class: Type[T],
+        db: AsyncIOMotorDatabase,
+        max_size: int = DEFAULT_BUFFER_MAX_SIZE,
+        max_age: float = DEFAULT_BUFFER_MAX_AGE,
+        ordered: bool = False,
+        on_error: Optional[ErrorHandler] = None,
+    ) -> None:
+        """
+        Initialize the buffer.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            max_size: Pending documents that trigger a flush
+            max_age: Seconds a write may stay pending before it is flushed
+            ordered: Stop each flush at the first failure
+            on_error: Called with the result of a flush that had failures
+        """
+        self.model_class = model_class
+        self.db = db
+        self.max_size = max_size
+        self.max_age = max_age
+        self.ordered = ordered
+        self.on_error = on_error
+
+        self._pending = PendingWrites()
+        # Created on first use so they bind to the running event loop
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._closed: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        """Number of documents with pending writes."""
+        return len(self._pending)
+
+    async def __aenter__(self) -> "AsyncWriteBuffer[T]":
+        """Start the background flusher."""
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Flush pending writes and stop the background flusher."""
+        await self.close()
+
+    def start(self) -> None:
+        """Start the background task that flushes writes by age."""
+        if self._task is not None:
+            return
+        self._closed = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.debug(f"Started write buffer for {self.model_class.__name__}")
+
+    async def save(self, model: T) -> T:
+        """
+        Buffer a save of the model.
+
+        Pre-save hooks run now; post-save hooks run after the flush that
+        writes the document. New models get their id immediately.
+
+        Args:
+            model: Model instance to save
+
+        Returns:
+            The model instance
+        """
+        await model._prepare_for_save()
+        self._pending.add(model)
+
+        if len(self._pending) >= self.max_size:
+            await self._flush_and_report()
+        return model
+
+    async def flush(self) -> SaveManyResult:
+        """
+        Write every pending document now.
+
+        If the flush fails, for example because the server cannot be
+        reached, writes that were not sent are rolled back on their models
+        and the error is raised.
+
+        Returns:
+            Result listing the saved models and the per-model errors
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        # Serializes flushes so writes reach the server in save order
+        async with self._flush_lock:
+            writes = self._pending.drain()
+            if not writes:
+                return SaveManyResult()
+
+            logger.debug(f"Flushing {len(writes)} buffered writes")
+            result = SaveManyResult()
+            try:
+                return await AsyncMongoImplementation.execute_writes(
+                    self.model_class,
+                    self.db,
+                    writes,
+                    self.ordered,
+                    DEFAULT_BULK_CHUNK_SIZE,
+                    result,
+                )
+            except Exception:
+                rollback_unsent(writes, result)
+                raise
+
+    async def close(self) -> SaveManyResult:
+        """
+        Stop the background flusher and drain pending writes.
+
+        Returns:
+            Result of the final flush
+        """
+        if self._task is not None:
+            self._closed.set()
+            await self._task
+            self._task = None
+        return await self._flush_and_report()
+
+    async def _flush_and_report(self) -> SaveManyResult:
+        """Flush and pass failures to the error handler."""
+        result = await self.flush()
+        if not result.ok:
+            if self.on_error is not None:
+                self.on_error(result)
+            else:
+                logger.error(
+                    f"{len(result.errors)} buffered writes failed, "
+                    f"first error: {result.errors[0].message}",
+                )
+        return result
+
+    async def _run(self) -> None:
+        """Flush pending writes once the oldest is ``max_age`` seconds old."""
+        timeout = self.max_age
+        while True:
+            try:
+                await asyncio.wait_for(self._closed.wait(), timeout)
+                return
+            except asyncio.TimeoutError:
+                pass
+
+            age = self._pending.age
+            if age < self.max_age:
+                timeout = self.max_age - age
+                continue
+
+            timeout = self.max_age
+            try:
+                await self._flush_and_report()
+            except Exception:  # noqa: BLE001
+                # Keep flushing: the failed writes were rolled back, and
+                # later saves must not be stranded by one bad flush
+                logger.exception("Background flush failed")
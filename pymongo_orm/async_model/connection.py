@@ -2,13 +2,25 @@
 Asynchronous MongoDB connection implementation.
 """
 
+import asyncio
 import threading
-from typing import Any, Dict
+import time
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.errors import PyMongoError
 
 from ..abstract.connection import AbstractMongoConnection
-from ..config import DEFAULT_CONNECTION_OPTIONS
+from ..config import DEFAULT_CONNECTION_OPTIONS, DEFAULT_WARM_UP_TIMEOUT
+from ..utils.connections import (
+    ConnectionKey,
+    WarmUpReport,
+    connection_key,
+    redact_uri,
+    warm_up_error,
+    warm_up_target,
+)
 from ..utils.logging import get_logger
 
 logger = get_logger("async.connection")
@@ -18,11 +30,16 @@ class AsyncMongoConnection(AbstractMongoConnection):
     """
     Asynchronous MongoDB connection using Motor.
 
-    This class implements the singleton pattern to ensure only one connection
-    is created for each URI.
+    Connections are shared per URI and client options, with at most
+    ``max_clients`` live clients (see ``AbstractMongoConnection``). They are
+    also scoped to the running event loop, since a Motor client is bound to
+    the loop it is first used on: each loop gets its own connection, reused
+    for as long as the loop is alive. Connections created outside a running
+    loop share one registry entry.
     """
 
-    _instances: Dict[str, "AsyncMongoConnection"] = {}
+    _instances: Dict[Tuple[ConnectionKey, Optional[weakref.ref]], Any] = {}
+    _retiring: List[Any] = []
     _lock: threading.Lock = threading.Lock()
 
     def __new__(cls, uri: str, **kwargs: Any) -> "AsyncMongoConnection":
@@ -31,20 +48,64 @@ class AsyncMongoConnection(AbstractMongoConnection):
 
         Args:
             uri: MongoDB connection URI
-            **kwargs: Additional connection options
+            **kwargs: Additional connection options (``metrics=True``
+                enables the metrics returned by ``stats()``)
 
         Returns:
             Connection instance
         """
-        with cls._lock:
-            if uri not in cls._instances:
+        options = {**DEFAULT_CONNECTION_OPTIONS, **kwargs}
+        return cls._get_or_create(uri, options, AsyncIOMotorClient)
+
+    @classmethod
+    def _registry_key(
+        cls,
+        uri: str,
+        options: Dict[str, Any],
+    ) -> Tuple[ConnectionKey, Optional[weakref.ref]]:
+        """
+        Build the key a connection is registered under, scoped to the loop.
 
-                instance = object.__new__(cls)
-                connection_kwargs = {**DEFAULT_CONNECTION_OPTIONS, **kwargs}
-                instance._client = AsyncIOMotorClient(uri, **connection_kwargs)
-                instance._uri = uri
-                cls._instances[uri] = instance
-            return cls._instances[uri]
+        The loop is held by a weak reference: a live loop's references
+        compare equal, and entries of a closed loop never match again, so
+        ``_make_room()`` closes them.
+
+        Args:
+            uri: MongoDB connection URI
+            options: Client keyword options
+
+        Returns:
+            Hashable key
+        """
+        try:
+            loop: Optional[weakref.ref] = weakref.ref(asyncio.get_running_loop())
+        except RuntimeError:
+            loop = None
+        return connection_key(uri, options), loop
+
+    @classmethod
+    def _make_room(cls) -> None:
+        """
+        Close the connections of closed event loops, then evict idle ones.
+
+        Must be called with the registry lock held. A Motor client cannot be
+        used once its loop is closed, so these clients are closed even if
+        sockets are still counted as checked out.
+        """
+        for key, conn in list(cls._instances.items()):
+            loop_ref = key[1]
+            if loop_ref is None:
+                continue
+            loop = loop_ref()
+            if loop is None or loop.is_closed():
+                del cls._instances[key]
+                logger.info(
+                    f"Closing AsyncMongoConnection to {redact_uri(conn._uri)} "
+                    "of a closed event loop",
+                )
+                conn._evicted = True
+                conn._close_client()
+        super()._make_room()
 
     def get_db(self, *, db_name: str) -> AsyncIOMotorDatabase:
         """
@@ -56,7 +117,7 @@ class AsyncMongoConnection(AbstractMongoConnection):
         Returns:
             AsyncIOMotorDatabase instance
         """
-        return self._client[db_name]
+        return self._current_client()[db_name]
 
     def get_client(self) -> AsyncIOMotorClient:
         """
@@ -65,15 +126,99 @@ class AsyncMongoConnection(AbstractMongoConnection):
         Returns:
             AsyncIOMotorClient instance
         """
-        return self._client
+        return self._current_client()
 
     def close(self) -> None:
         """
         Close the MongoDB connection and clean up resources.
         """
         if hasattr(self, "_client"):
-            logger.info(f"Closing AsyncMongoConnection to {self._uri}")
-            self._client.close()
-            with self._lock:
-                if self._uri in self._instances:
-                    del self._instances[self._uri]
+            logger.info(f"Closing AsyncMongoConnection to {redact_uri(self._uri)}")
+            self._close_client()
+            self._unregister()
+
+    async def warm_up(
+        self,
+        timeout: float = DEFAULT_WARM_UP_TIMEOUT,
+        min_connections: Optional[int] = None,
+        models: Iterable[Type[Any]] = (),
+        db_name: Optional[str] = None,
+    ) -> WarmUpReport:
+        """
+        Open the connection ahead of the first request and report readiness.
+
+        Pings the server (server selection, handshake and authentication),
+        then sends ``min_connections`` pings at the same time so the pool
+        opens that many sockets, then touches the collection and indexes of
+        each model. Errors are reported rather than raised.
+
+        Args:
+            timeout: Seconds the whole warm-up may take
+            min_connections: Pooled connections to open (None uses the
+                ``minPoolSize`` option, or 1)
+            models: Model classes whose collections to touch
+            db_name: Database of the models (required with ``models``)
+
+        Returns:
+            Warm-up report, true when the connection is ready
+        """
+        client = self.get_client()
+        start = time.perf_counter()
+        deadline = start + timeout
+        target = warm_up_target(min_connections, self._options)
+        errors: List[str] = []
+
+        def remaining() -> float:
+            return max(deadline - time.perf_counter(), 0.001)
+
+        ping_ms: Optional[float] = None
+        try:
+            await asyncio.wait_for(client.admin.command("ping"), remaining())
+            ping_ms = (time.perf_counter() - start) * 1000
+        except (PyMongoError, asyncio.TimeoutError) as e:
+            errors.append(warm_up_error("ping", e))
+
+        touched = 0
+        if ping_ms is not None:
+            if target > 1:
+                pings = [client.admin.command("ping") for _ in range(target)]
+                try:
+                    results = await asyncio.wait_for(
+                        asyncio.gather(*pings, return_exceptions=True),
+                        remaining(),
+                    )
+                except asyncio.TimeoutError as e:
+                    results = [e]
+                failed = [r for r in results if isinstance(r, BaseException)]
+                if failed:
+                    errors.append(warm_up_error("connections", failed[0]))
+
+            if models and db_name is None:
+                errors.append("models: db_name is required to touch collections")
+            elif models:
+                db = self.get_db(db_name=db_name)
+                for model_class in models:
+                    collection = model_class.get_collection(db)
+                    try:
+                        await asyncio.wait_for(
+                            collection.index_information(),
+                            remaining(),
+                        )
+                        touched += 1
+                    except (PyMongoError, asyncio.TimeoutError) as e:
+                        errors.append(warm_up_error(model_class.__name__, e))
+
+        report = WarmUpReport(
+            ready=ping_ms is not None and not errors,
+            ping_ms=ping_ms,
+            connections=self._usage.open_connections,
+            target_connections=target,
+            models=touched,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            errors=errors,
+        )
+        logger.info(
+            f"Warmed up AsyncMongoConnection to {redact_uri(self._uri)}: "
+            f"ready={report.ready} in {report.elapsed_ms:.1f}ms",
+        )
+        return report
@@ -0,0 +1,147 @@
+"""
+Request-scoped batching loader for asynchronous models.
+"""
+
+import asyncio
+from typing import Any, Dict, Generic, List, Optional, Set, Tuple, Type, TypeVar, Union
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ..config import DEFAULT_LOADER_BATCH_SIZE
+from ..utils.converters import to_doc_id
+from ..utils.logging import get_logger
+from .implementation import AsyncMongoImplementation
+
+# Type variables
+T = TypeVar("T")
+ProjectionType = Dict[str, Any]
+
+logger = get_logger("async.loader")
+
+
+class AsyncModelLoader(Generic[T]):
+    """
+    Batches ``load(id)`` calls made in the same event-loop tick.
+
+    Every id requested before the loop gets back to the loader is fetched
+    with a single ``{"_id": {"$in": [...]}}`` query. Concurrent requests for
+    the same id share one lookup, and results are memoized for the life of
+    the loader, so create one loader per request.
+
+    Example:
+        loader = User.loader(db)
+        alice, bob = await asyncio.gather(loader.load(a_id), loader.load(b_id))
+    """
+
+    def __init__(
+        self,
+        model_class: Type[T],
+        db: AsyncIOMotorDatabase,
+        projection: Optional[ProjectionType] = None,
+        validate: Optional[bool] = None,
+        max_batch_size: int = DEFAULT_LOADER_BATCH_SIZE,
+    ) -> None:
+        """
+        Initialize the loader.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            projection: Fields to include/exclude
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            max_batch_size: Maximum ids per ``$in`` query
+        """
+        self.model_class = model_class
+        self.db = db
+        self.projection = projection
+        self.validate = validate
+        self.max_batch_size = max_batch_size
+
+        self._native_id = model_class.__model_meta__.native_id
+        self._futures: Dict[ObjectId, asyncio.Future] = {}
+        self._queue: List[Tuple[ObjectId, asyncio.Future]] = []
+        # The event loop only keeps weak references to tasks
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, id_value: Union[str, ObjectId]) -> Optional[T]:
+        """
+        Load a model by id, batched with other loads in the same tick.
+
+        Args:
+            id_value: Document id (string or ObjectId)
+
+        Returns:
+            Model instance, or None if not found
+        """
+        object_id = to_doc_id(id_value, self._native_id)
+        future = self._futures.get(object_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[object_id] = future
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append((object_id, future))
+        # Shielded so one cancelled caller does not cancel the shared lookup
+        return await asyncio.shield(future)
+
+    async def load_many(self, ids: List[Union[str, ObjectId]]) -> List[Optional[T]]:
+        """
+        Load several models by id in one batch.
+
+        Args:
+            ids: Document ids
+
+        Returns:
+            Model instances (None where not found), in input order
+        """
+        return list(await asyncio.gather(*(self.load(id_value) for id_value in ids)))
+
+    def clear(self, id_value: Optional[Union[str, ObjectId]] = None) -> None:
+        """
+        Forget memoized results so they are fetched again.
+
+        Args:
+            id_value: Id to forget, or None to forget every id
+        """
+        if id_value is None:
+            self._futures.clear()
+        else:
+            self._futures.pop(to_doc_id(id_value, self._native_id), None)
+
+    def _dispatch(self) -> None:
+        """Send the ids queued during the last tick as batched queries."""
+        queue, self._queue = self._queue, []
+        for start in range(0, len(queue), self.max_batch_size):
+            batch = queue[start : start + self.max_batch_size]
+            task = asyncio.ensure_future(self._load_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, batch: List[Tuple[ObjectId, asyncio.Future]]) -> None:
+        """Fetch one batch and resolve the futures waiting on it."""
+        logger.debug(f"Loading {len(batch)} {self.model_class.__name__} documents")
+        try:
+            models = await AsyncMongoImplementation.find(
+                self.model_class,
+                self.db,
+                {"_id": {"$in": [object_id for object_id, _ in batch]}},
+                self.projection,
+                validate=self.validate,
+            )
+        except Exception as e:  # noqa: BLE001
+            # Every waiter must be resolved, whatever went wrong
+            for object_id, future in batch:
+                # Failed lookups are not memoized so they can be retried
+                if self._futures.get(object_id) is future:
+                    del self._futures[object_id]
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        found = {model.id: model for model in models}
+        for object_id, future in batch:
+            if not future.done():
+                key = object_id if self._native_id else str(object_id)
+                future.set_result(found.get(key))
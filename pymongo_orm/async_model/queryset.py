@@ -0,0 +1,166 @@
+"""
+Lazy query sets for asynchronous models.
+"""
+
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from ..utils.queryset import BaseQuerySet
+from .implementation import AsyncMongoImplementation
+
+# Type variables
+T = TypeVar("T")
+
+
+async def _empty_iterator() -> AsyncIterator[T]:
+    """Async iterator over nothing."""
+    return
+    yield
+
+
+class AsyncQuerySet(BaseQuerySet[T]):
+    """
+    Lazy, chainable query for an asynchronous model.
+
+    Nothing is sent to the server until the query set is iterated with
+    ``async for``, indexed (``await qs[3]``) or asked for ``all()``,
+    ``first()``, ``count()`` or ``exists()``. Slicing returns a new query
+    set with the skip and limit applied.
+
+    Example:
+        adults = User.objects(db).filter(age={"$gte": 18}).order_by("-age")
+        async for user in adults[:10]:
+            ...
+    """
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        """Stream matching models, ``batch_size`` documents at a time."""
+        if self._empty:
+            return _empty_iterator()
+        return AsyncMongoImplementation.iter_find(
+            self.model_class,
+            self.db,
+            self.query,
+            self._projection,
+            self._sort,
+            self._skip,
+            self._limit,
+            self._batch_size,
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> Awaitable[T]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "AsyncQuerySet[T]": ...
+
+    def __getitem__(
+        self,
+        index: Union[int, slice],
+    ) -> Union[Awaitable[T], "AsyncQuerySet[T]"]:
+        """
+        Slice the query set, or fetch the model at a position.
+
+        Args:
+            index: Slice (lazy) or position (returns an awaitable)
+
+        Returns:
+            New query set, or an awaitable resolving to the model
+        """
+        if isinstance(index, slice):
+            return self._slice(index)
+        if index < 0:
+            raise ValueError("Query set slices do not support negative indexes")
+        return self._get(index)
+
+    async def all(self) -> List[T]:
+        """
+        Fetch every matching model.
+
+        Returns:
+            Model instances
+        """
+        if self._empty:
+            return []
+        return await AsyncMongoImplementation.find(
+            self.model_class,
+            self.db,
+            self.query,
+            self._projection,
+            self._sort,
+            self._skip,
+            self._limit,
+        )
+
+    async def first(self) -> Optional[T]:
+        """
+        Fetch the first matching model.
+
+        Returns:
+            Model instance, or None if nothing matches
+        """
+        models = await self.limit(1).all()
+        return models[0] if models else None
+
+    async def count(self) -> int:
+        """
+        Count matching documents, honouring any skip and limit.
+
+        Returns:
+            Number of documents
+        """
+        if self._empty:
+            return 0
+        # Counting stops once it reaches the end of the window
+        limit = self._skip + self._limit if self._limit else 0
+        total = await AsyncMongoImplementation.count(
+            self.model_class,
+            self.db,
+            self.query,
+            limit,
+        )
+        return self._count_window(total)
+
+    async def exists(self) -> bool:
+        """
+        Check whether any document matches, fetching only its ``_id``.
+
+        Returns:
+            True if a document matches
+        """
+        if self._empty:
+            return False
+        if not self._skip:
+            doc = await AsyncMongoImplementation.find_one(
+                self.model_class,
+                self.db,
+                self.query,
+                {"_id": 1},
+                as_="dict",
+            )
+            return doc is not None
+        docs = await AsyncMongoImplementation.find(
+            self.model_class,
+            self.db,
+            self.query,
+            {"_id": 1},
+            None,
+            self._skip,
+            1,
+            as_="dict",
+        )
+        return bool(docs)
+
+    async def _get(self, index: int) -> T:
+        """Fetch the model at a position."""
+        model = await self._slice(slice(index, index + 1)).first()
+        if model is None:
+            raise IndexError("Query set index out of range")
+        return model
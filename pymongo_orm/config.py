@@ -6,6 +6,7 @@ from typing import Any, Dict
 
 # Connection defaults
 DEFAULT_BATCH_SIZE = 100
+DEFAULT_PAGE_SIZE = 20
 DEFAULT_TIMEOUT_MS = 30000  # 30 seconds
 DEFAULT_MAX_POOL_SIZE = 100
 DEFAULT_MIN_POOL_SIZE = 10
@@ -13,6 +14,35 @@ DEFAULT_MAX_IDLE_TIME_MS = 30000
 DEFAULT_RETRY_WRITES = True
 DEFAULT_RETRY_READS = True
 DEFAULT_WRITE_CONCERN = "majority"
+DEFAULT_COLLECTION_CACHE_SIZE = 256  # Cached (database, model) collection handles
+DEFAULT_MAX_CLIENTS = 100  # Live clients kept by each connection registry
+DEFAULT_WARM_UP_TIMEOUT = 10.0  # Seconds warm_up() may take
+
+# Bulk write limits
+DEFAULT_BULK_CHUNK_SIZE = 1000
+MAX_BULK_OPERATIONS = 100_000  # Server maxWriteBatchSize
+MAX_BULK_CHUNK_BYTES = 47_000_000  # Stay under the 48MB maxMessageSizeBytes
+
+# Maximum ids per $in query sent by AsyncModelLoader and find_by_ids()
+DEFAULT_LOADER_BATCH_SIZE = 1000
+DEFAULT_ID_CHUNK_SIZE = 1000
+
+# Parallel scan defaults
+DEFAULT_SCAN_PARTITIONS = 4
+SCAN_SAMPLES_PER_PARTITION = 10  # Sampled _ids per partition boundary
+
+# Write buffer defaults
+DEFAULT_BUFFER_MAX_SIZE = 1000  # Pending documents before a flush
+DEFAULT_BUFFER_MAX_AGE = 1.0  # Seconds before pending writes are flushed
+
+# Query cache defaults
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CACHE_MAX_BYTES = 16 * 1024 * 1024  # 16MB of encoded results
+DEFAULT_CACHE_TTL = 60.0  # Seconds
+
+# Count cache defaults
+DEFAULT_COUNT_CACHE_TTL = 5.0  # Seconds a count is served as fresh
+DEFAULT_COUNT_CACHE_STALE_TTL = 30.0  # Further seconds served while refreshing
 
 # Default connection options
 DEFAULT_CONNECTION_OPTIONS: Dict[str, Any] = {
@@ -3,13 +3,24 @@ Synchronous MongoDB connection implementation.
 """
 
 import threading
-from typing import Any, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Type
 
+import pymongo
 from pymongo import MongoClient
 from pymongo.database import Database
+from pymongo.errors import PyMongoError
 
 from ..abstract.connection import AbstractMongoConnection
-from ..config import DEFAULT_CONNECTION_OPTIONS
+from ..config import DEFAULT_CONNECTION_OPTIONS, DEFAULT_WARM_UP_TIMEOUT
+from ..utils.connections import (
+    ConnectionKey,
+    WarmUpReport,
+    redact_uri,
+    warm_up_error,
+    warm_up_target,
+)
 from ..utils.logging import get_logger
 
 logger = get_logger("sync.connection")
@@ -19,11 +30,12 @@ class SyncMongoConnection(AbstractMongoConnection):
     """
     Synchronous MongoDB connection using PyMongo.
 
-    This class implements the singleton pattern to ensure only one connection
-    is created for each URI.
+    Connections are shared per URI and client options, with at most
+    ``max_clients`` live clients (see ``AbstractMongoConnection``).
     """
 
-    _instances: Dict[str, "SyncMongoConnection"] = {}
+    _instances: Dict[ConnectionKey, "SyncMongoConnection"] = {}
+    _retiring: List["SyncMongoConnection"] = []
     _lock: threading.Lock = threading.Lock()
 
     def __new__(cls, uri: str, **kwargs: Any) -> "SyncMongoConnection":
@@ -32,23 +44,14 @@ class SyncMongoConnection(AbstractMongoConnection):
 
         Args:
             uri: MongoDB connection URI
-            **kwargs: Additional connection options
+            **kwargs: Additional connection options (``metrics=True``
+                enables the metrics returned by ``stats()``)
 
         Returns:
             Connection instance
         """
-
-        with cls._lock:
-            if uri not in cls._instances:
-
-                instance = object.__new__(cls)
-                connection_kwargs = {**DEFAULT_CONNECTION_OPTIONS, **kwargs}
-
-                instance._client = MongoClient(uri, **connection_kwargs)
-                logger.info(f"Created new SyncMongoConnection to {uri}")
-                instance._uri = uri
-                cls._instances[uri] = instance
-            return cls._instances[uri]
+        options = {**DEFAULT_CONNECTION_OPTIONS, **kwargs}
+        return cls._get_or_create(uri, options, MongoClient)
 
     def get_db(self, *, db_name: str) -> Database:
         """
@@ -60,7 +63,7 @@ class SyncMongoConnection(AbstractMongoConnection):
         Returns:
             Database instance
         """
-        return self._client[db_name]
+        return self._current_client()[db_name]
 
     def get_client(self) -> MongoClient:
         """
@@ -69,15 +72,96 @@ class SyncMongoConnection(AbstractMongoConnection):
         Returns:
             MongoClient instance
         """
-        return self._client
+        return self._current_client()
 
     def close(self) -> None:
         """
         Close the MongoDB connection and clean up resources.
         """
         if hasattr(self, "_client"):
-            logger.info(f"Closing SyncMongoConnection to {self._uri}")
-            self._client.close()
-            with self._lock:
-                if self._uri in self._instances:
-                    del self._instances[self._uri]
+            logger.info(f"Closing SyncMongoConnection to {redact_uri(self._uri)}")
+            self._close_client()
+            self._unregister()
+
+    def warm_up(
+        self,
+        timeout: float = DEFAULT_WARM_UP_TIMEOUT,
+        min_connections: Optional[int] = None,
+        models: Iterable[Type[Any]] = (),
+        db_name: Optional[str] = None,
+    ) -> WarmUpReport:
+        """
+        Open the connection ahead of the first request and report readiness.
+
+        Pings the server (server selection, handshake and authentication),
+        then sends ``min_connections`` pings at the same time so the pool
+        opens that many sockets, then touches the collection and indexes of
+        each model. Errors are reported rather than raised.
+
+        Args:
+            timeout: Seconds the whole warm-up may take
+            min_connections: Pooled connections to open (None uses the
+                ``minPoolSize`` option, or 1)
+            models: Model classes whose collections to touch
+            db_name: Database of the models (required with ``models``)
+
+        Returns:
+            Warm-up report, true when the connection is ready
+        """
+        client = self.get_client()
+        start = time.perf_counter()
+        deadline = start + timeout
+        target = warm_up_target(min_connections, self._options)
+        errors: List[str] = []
+
+        def ping() -> None:
+            with pymongo.timeout(max(deadline - time.perf_counter(), 0.001)):
+                client.admin.command("ping")
+
+        ping_ms: Optional[float] = None
+        try:
+            ping()
+            ping_ms = (time.perf_counter() - start) * 1000
+        except PyMongoError as e:
+            errors.append(warm_up_error("ping", e))
+
+        touched = 0
+        if ping_ms is not None:
+            if target > 1:
+                with ThreadPoolExecutor(max_workers=target) as pool:
+                    futures = [pool.submit(ping) for _ in range(target)]
+                    for future in futures:
+                        try:
+                            future.result()
+                        except PyMongoError as e:
+                            errors.append(warm_up_error("connections", e))
+                            break
+
+            if models and db_name is None:
+                errors.append("models: db_name is required to touch collections")
+            elif models:
+                db = self.get_db(db_name=db_name)
+                for model_class in models:
+                    try:
+                        with pymongo.timeout(
+                            max(deadline - time.perf_counter(), 0.001),
+                        ):
+                            model_class.get_collection(db).index_information()
+                        touched += 1
+                    except PyMongoError as e:
+                        errors.append(warm_up_error(model_class.__name__, e))
+
+        report = WarmUpReport(
+            ready=ping_ms is not None and not errors,
+            ping_ms=ping_ms,
+            connections=self._usage.open_connections,
+            target_connections=target,
+            models=touched,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            errors=errors,
+        )
+        logger.info(
+            f"Warmed up SyncMongoConnection to {redact_uri(self._uri)}: "
+            f"ready={report.ready} in {report.elapsed_ms:.1f}ms",
+        )
+        return report
@@ -2,19 +2,91 @@
 Synchronous MongoDB implementation.
 """
 
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from bson import ObjectId
-from pymongo import IndexModel
+from pymongo.collection import Collection
+from pymongo.cursor import Cursor
 from pymongo.database import Database
-from pymongo.errors import DuplicateKeyError, PyMongoError
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
 
 from ..abstract.implementation import AbstractMongoImplementation
+from ..config import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_BULK_CHUNK_SIZE,
+    DEFAULT_ID_CHUNK_SIZE,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_SCAN_PARTITIONS,
+    SCAN_SAMPLES_PER_PARTITION,
+)
 from ..exceptions import IndexError, MongoORMError, QueryError
-from ..utils.converters import doc_to_model, ensure_object_id, process_query
-from ..utils.decorators import timing_decorator
+from ..utils.bulk import (
+    PlannedWrite,
+    SaveManyResult,
+    apply_chunk_result,
+    chunk_writes,
+    plan_save,
+    skip_remaining,
+)
+from ..utils.cache import (
+    CACHE_MISS,
+    get_count_cache,
+    get_query_cache,
+    invalidate_query_cache,
+    make_cache_key,
+)
+from ..utils.converters import (
+    aggregate_options,
+    check_missing_policy,
+    collection_for_result,
+    doc_to_model,
+    docs_to_models,
+    ensure_object_ids,
+    from_doc_id,
+    get_batch_converter,
+    get_result_converter,
+    get_row_converter,
+    normalize_doc_id,
+    order_by_ids,
+    process_query,
+    should_validate,
+    to_doc_id,
+)
+from ..utils.decorators import instrumented
 from ..utils.logging import get_logger
+from ..utils.pagination import (
+    Page,
+    encode_page_token,
+    get_sort_values,
+    include_sort_keys,
+    keyset_page_query,
+    normalize_sort,
+)
+from ..utils.scan import (
+    SCAN_DONE,
+    SCAN_SPLIT_MODES,
+    ScanFailure,
+    ScanStoppedError,
+    partition_queries,
+    sample_boundaries,
+    sample_pipeline,
+    timestamp_boundaries,
+)
 
 # Type variables
 T = TypeVar("T")
@@ -28,7 +100,7 @@ class SyncMongoImplementation(AbstractMongoImplementation):
     """Synchronous MongoDB implementation using PyMongo."""
 
     @classmethod
-    @timing_decorator
+    @instrumented
     def bulk_write(
         cls,
         model_class: Type[T],
@@ -49,14 +121,16 @@ class SyncMongoImplementation(AbstractMongoImplementation):
         collection = model_class.get_collection(db)
 
         try:
-            result = collection.bulk_write(operations)
-            return result
+            return collection.bulk_write(operations)
         except PyMongoError as e:
             logger.error(f"MongoDB error during bulk_write: {e}")
             raise MongoORMError(f"Bulk write error: {e}")
+        finally:
+            # A failed bulk write may still have applied some of its writes
+            invalidate_query_cache(model_class)
 
     @classmethod
-    @timing_decorator
+    @instrumented
     def save(cls, model: Any, db: Database) -> Any:
         """
         Save a model to the database.
@@ -68,25 +142,42 @@ class SyncMongoImplementation(AbstractMongoImplementation):
         Returns:
             The saved model instance
         """
-        # Prepare model and get data
+        # Prepare model
         model._prepare_for_save()
         collection = model.get_collection(db)
-        model_data = model.model_dump(exclude={"id"})
+        native_id = type(model).__model_meta__.native_id
 
         try:
             if model.id is None:
                 # Insert new document
+                model_data = type(model).__model_meta__.encode(model)
                 result = collection.insert_one(model_data)
-                model.id = str(result.inserted_id)
+                invalidate_query_cache(type(model))
+                model.id = from_doc_id(result.inserted_id, native_id)
+                model_data.pop("_id", None)
+                model._mark_saved({"$set": model_data})
                 logger.debug(f"Created document with id: {model.id}")
             else:
-                # Update existing document
+                # Update only the fields that changed since the last load/save
+                update = model._get_changes()
+                if not update:
+                    logger.debug(f"No changes to save for document with id: {model.id}")
+                    return model
+
+                # Natively keyed models built with an id may not be stored yet
                 result = collection.update_one(
-                    {"_id": ensure_object_id(model.id)},
-                    {"$set": model_data},
+                    {"_id": to_doc_id(model.id, native_id)},
+                    update,
+                    upsert=native_id and model._snapshot is None,
                 )
-                if result.matched_count == 0:
+                invalidate_query_cache(type(model))
+                if (
+                    result.acknowledged
+                    and result.matched_count == 0
+                    and result.upserted_id is None
+                ):
                     logger.warning(f"No document found with id: {model.id}")
+                model._mark_saved(update)
                 logger.debug(f"Updated document with id: {model.id}")
 
             # Run post-save hooks
@@ -100,13 +191,125 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             raise MongoORMError(f"Failed to save document: {e}")
 
     @classmethod
-    @timing_decorator
+    @instrumented
+    def save_many(
+        cls,
+        model_class: Type[T],
+        db: Database,
+        models: Iterable[Any],
+        ordered: bool = False,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> SaveManyResult:
+        """
+        Save many models using batched bulk writes.
+
+        Pre-save hooks run for every model first. New models are inserted with
+        client-side ObjectIds and existing ones are updated with their changed
+        fields, in chunks that stay under the server's batch limits. Failures
+        are reported per model instead of aborting the whole batch.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            models: Model instances to save
+            ordered: Stop at the first failure instead of continuing
+            chunk_size: Maximum number of operations per bulk write
+
+        Returns:
+            Result listing the saved models and the per-model errors
+        """
+        result = SaveManyResult()
+
+        writes = []
+        for model in models:
+            model._prepare_for_save()
+            write = plan_save(model)
+            if write is None:
+                result.saved.append(model)
+            else:
+                writes.append(write)
+
+        return cls.execute_writes(
+            model_class,
+            db,
+            writes,
+            ordered,
+            chunk_size,
+            result,
+        )
+
+    @classmethod
+    @instrumented
+    def execute_writes(
+        cls,
+        model_class: Type[T],
+        db: Database,
+        writes: List[PlannedWrite],
+        ordered: bool = False,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        result: Optional[SaveManyResult] = None,
+    ) -> SaveManyResult:
+        """
+        Send planned writes as chunked bulk writes and record the outcome.
+
+        Post-save hooks run for every model written successfully.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            writes: Planned writes
+            ordered: Stop at the first failure instead of continuing
+            chunk_size: Maximum number of operations per bulk write
+            result: Result to record into (a new one is created if None)
+
+        Returns:
+            Result listing the saved models and the per-model errors
+        """
+        collection = model_class.get_collection(db)
+        if result is None:
+            result = SaveManyResult()
+
+        chunks = chunk_writes(writes, chunk_size)
+        for chunk in chunks:
+            write_errors = []
+            try:
+                collection.bulk_write(
+                    [write.operation for write in chunk],
+                    ordered=ordered,
+                )
+            except BulkWriteError as e:
+                write_errors = e.details.get("writeErrors", [])
+                logger.warning(
+                    f"{len(write_errors)} of {len(chunk)} bulk writes failed",
+                )
+            except PyMongoError as e:
+                invalidate_query_cache(model_class)
+                logger.error(f"MongoDB error during execute_writes: {e}")
+                raise MongoORMError(f"Failed to save documents: {e}")
+
+            invalidate_query_cache(model_class)
+            for model in apply_chunk_result(chunk, write_errors, ordered, result):
+                model._run_hooks(model._post_save_hooks)
+
+            if ordered and write_errors:
+                skip_remaining(chunks, result)
+                break
+
+        logger.debug(
+            f"Saved {len(result.saved)} documents, {len(result.errors)} failed",
+        )
+        return result
+
+    @classmethod
+    @instrumented
     def find_one(
         cls,
         model_class: Type[T],
         db: Database,
         query: QueryType,
         projection: Optional[ProjectionType] = None,
+        validate: Optional[bool] = None,
+        as_: str = "model",
     ) -> Optional[T]:
         """
         Find a single document matching the query.
@@ -116,18 +319,35 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             db: Database instance
             query: MongoDB query
             projection: Fields to include/exclude
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            as_: Result type: "model", "dict", "record" or "bson" (``RawBSONDocument``)
 
         Returns:
-            Model instance or None if not found
+            Result in the requested form, or None if not found
         """
-        collection = model_class.get_collection(db)
-        processed_query = process_query(query)
+        collection = collection_for_result(model_class.get_collection(db), as_)
+        processed_query = process_query(query, model_class.__model_meta__.native_id)
+        convert = get_result_converter(model_class, as_, validate)
+
+        cache = get_query_cache(model_class)
+        if cache is not None:
+            key = make_cache_key(db, "find_one", processed_query, projection, as_=as_)
+            docs = cache.get_docs(key, collection.codec_options)
+            if docs is not CACHE_MISS:
+                return convert(docs[0]) if docs else None
+            generation = cache.generation
 
         try:
             doc = collection.find_one(processed_query, projection)
-            if doc:
-
-                return doc_to_model(doc, model_class)
+            if cache is not None:
+                cache.set_docs(
+                    key,
+                    [doc] if doc is not None else [],
+                    collection.codec_options,
+                    generation,
+                )
+            if doc is not None:
+                return convert(doc)
             return None
         except PyMongoError as e:
             logger.error(f"MongoDB error during find_one: {e}")
@@ -138,7 +358,7 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             )
 
     @classmethod
-    @timing_decorator
+    @instrumented
     def find(
         cls,
         model_class: Type[T],
@@ -148,6 +368,8 @@ class SyncMongoImplementation(AbstractMongoImplementation):
         sort: Optional[List[tuple]] = None,
         skip: int = 0,
         limit: int = 0,
+        validate: Optional[bool] = None,
+        as_: str = "model",
     ) -> List[T]:
         """
         Find documents matching the query.
@@ -160,34 +382,273 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             sort: Sort specification
             skip: Number of documents to skip
             limit: Maximum number of documents to return
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            as_: Result type: "model", "dict", "record" or "bson" (``RawBSONDocument``)
 
         Returns:
-            List of model instances
+            List of results in the requested form
         """
         if query is None:
             query = {}
 
+        collection = collection_for_result(model_class.get_collection(db), as_)
+        processed_query = process_query(query, model_class.__model_meta__.native_id)
+        convert = get_batch_converter(model_class, as_, validate)
+
+        cache = get_query_cache(model_class)
+        if cache is not None:
+            key = make_cache_key(
+                db,
+                "find",
+                processed_query,
+                projection,
+                sort,
+                skip,
+                limit,
+                as_,
+            )
+            docs = cache.get_docs(key, collection.codec_options)
+            if docs is not CACHE_MISS:
+                return convert(docs)
+            generation = cache.generation
+
+        try:
+            cursor = cls._build_cursor(
+                collection,
+                processed_query,
+                projection,
+                sort,
+                skip,
+                limit,
+            )
+
+            if cache is None:
+                return convert(list(cursor))
+
+            docs = list(cursor)
+            cache.set_docs(key, docs, collection.codec_options, generation)
+            return convert(docs)
+        except PyMongoError as e:
+            logger.error(f"MongoDB error during find: {e}")
+            raise QueryError(
+                collection=collection.name,
+                query=processed_query,
+                message=str(e),
+            )
+
+    @classmethod
+    @instrumented
+    def find_by_ids(
+        cls,
+        model_class: Type[T],
+        db: Database,
+        ids: Iterable[Union[str, ObjectId]],
+        chunk_size: int = DEFAULT_ID_CHUNK_SIZE,
+        preserve_order: bool = True,
+        missing: str = "skip",
+        projection: Optional[ProjectionType] = None,
+        validate: Optional[bool] = None,
+    ) -> List[Optional[T]]:
+        """
+        Find documents by a list of ids.
+
+        Ids are converted to ObjectIds in bulk, de-duplicated and split into
+        ``$in`` queries of at most ``chunk_size`` ids, fetched one after another.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            ids: Document ids (strings or ObjectIds)
+            chunk_size: Maximum ids per ``$in`` query
+            preserve_order: Return results in the order of ``ids``
+            missing: Policy for ids that are not found: "skip", "none" or "raise"
+            projection: Fields to include/exclude
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+
+        Returns:
+            Model instances (None for missing ids when ``missing="none"``)
+
+        Raises:
+            ValueError: If ``missing`` is unknown, or "none" without
+                ``preserve_order``
+        """
+        check_missing_policy(missing, preserve_order)
+        native_id = model_class.__model_meta__.native_id
+        object_ids = list(ids) if native_id else ensure_object_ids(ids)
+        unique_ids = list(dict.fromkeys(object_ids))
         collection = model_class.get_collection(db)
-        processed_query = process_query(query)
+        chunk_size = max(1, chunk_size)
 
+        found = {}
         try:
-            cursor = collection.find(processed_query, projection)
+            for start in range(0, len(unique_ids), chunk_size):
+                chunk = unique_ids[start : start + chunk_size]
+                docs = list(collection.find({"_id": {"$in": chunk}}, projection))
+                # docs_to_models moves each _id to id, so collect the keys first
+                doc_ids = [doc["_id"] for doc in docs]
+                found.update(zip(doc_ids, docs_to_models(docs, model_class, validate)))
+        except PyMongoError as e:
+            logger.error(f"MongoDB error during find_by_ids: {e}")
+            raise QueryError(
+                collection=collection.name,
+                query={"_id": {"$in": f"<{len(unique_ids)} ids>"}},
+                message=str(e),
+            )
 
-            # Apply sorting, skip, and limit
-            if sort:
-                cursor = cursor.sort(sort)
-            if skip:
-                cursor = cursor.skip(skip)
-            if limit:
-                cursor = cursor.limit(limit)
+        return order_by_ids(
+            object_ids,
+            found,
+            preserve_order,
+            missing,
+            collection.name,
+        )
 
-            results = []
+    @classmethod
+    def iter_find(
+        cls,
+        model_class: Type[T],
+        db: Database,
+        query: Optional[QueryType] = None,
+        projection: Optional[ProjectionType] = None,
+        sort: Optional[List[tuple]] = None,
+        skip: int = 0,
+        limit: int = 0,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        validate: Optional[bool] = None,
+    ) -> Iterator[T]:
+        """
+        Lazily iterate over documents matching the query.
+
+        Documents are fetched from the server ``batch_size`` at a time and
+        converted to models one by one, so memory usage does not grow with
+        the size of the result set. The server cursor is closed when the
+        generator is exhausted, closed or garbage collected.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            query: MongoDB query
+            projection: Fields to include/exclude
+            sort: Sort specification
+            skip: Number of documents to skip
+            limit: Maximum number of documents to return
+            batch_size: Number of documents fetched per server round trip
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+
+        Yields:
+            Model instances
+        """
+        if query is None:
+            query = {}
+
+        collection = model_class.get_collection(db)
+        processed_query = process_query(query, model_class.__model_meta__.native_id)
+        validate = should_validate(model_class, validate)
+        cursor = cls._build_cursor(
+            collection,
+            processed_query,
+            projection,
+            sort,
+            skip,
+            limit,
+            batch_size,
+        )
+
+        try:
             for doc in cursor:
+                yield doc_to_model(doc, model_class, validate)
+        except PyMongoError as e:
+            logger.error(f"MongoDB error during iter_find: {e}")
+            raise QueryError(
+                collection=collection.name,
+                query=processed_query,
+                message=str(e),
+            )
+        finally:
+            cursor.close()
+
+    @classmethod
+    @instrumented
+    def parallel_scan_each(
+        cls,
+        model_class: Type[T],
+        db: Database,
+        callback: Callable[[int, T], Any],
+        query: Optional[QueryType] = None,
+        partitions: int = DEFAULT_SCAN_PARTITIONS,
+        projection: Optional[ProjectionType] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        validate: Optional[bool] = None,
+        split: str = "sample",
+    ) -> int:
+        """
+        Scan documents matching the query with one thread per ``_id`` range.
+
+        The ``_id`` keyspace is split into ``partitions`` ranges and each
+        range is read on its own cursor in a thread pool. ``callback`` is
+        called from the worker threads as ``callback(partition, model)``.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            callback: Function called for every document
+            query: MongoDB query
+            partitions: Number of ranges scanned at the same time
+            projection: Fields to include/exclude
+            batch_size: Number of documents fetched per server round trip
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            split: How to choose range boundaries: "sample" (``$sample`` of
+                the matching ids) or "timestamp" (even ObjectId time ranges)
 
-                results.append(doc_to_model(doc, model_class))
-            return results
+        Returns:
+            Number of documents scanned
+        """
+        collection = model_class.get_collection(db)
+        processed_query = process_query(
+            query or {},
+            model_class.__model_meta__.native_id,
+        )
+        convert = get_result_converter(model_class, "model", validate)
+        stop = threading.Event()
+
+        def scan(index: int, range_query: QueryType) -> int:
+            count = 0
+            cursor = collection.find(range_query, projection, batch_size=batch_size)
+            try:
+                for doc in cursor:
+                    if stop.is_set():
+                        break
+                    callback(index, convert(doc))
+                    count += 1
+            finally:
+                cursor.close()
+            return count
+
+        try:
+            boundaries = cls._scan_boundaries(
+                collection,
+                processed_query,
+                partitions,
+                split,
+            )
+            range_queries = partition_queries(processed_query, boundaries)
+            logger.debug(f"Scanning {collection.name} in {len(range_queries)} ranges")
+
+            with ThreadPoolExecutor(
+                max_workers=len(range_queries),
+                thread_name_prefix=f"{model_class.__name__}Scan",
+            ) as executor:
+                futures = [
+                    executor.submit(scan, index, range_query)
+                    for index, range_query in enumerate(range_queries)
+                ]
+                try:
+                    return sum(future.result() for future in futures)
+                finally:
+                    # Stop the other workers early if one of them failed
+                    stop.set()
         except PyMongoError as e:
-            logger.error(f"MongoDB error during find: {e}")
+            logger.error(f"MongoDB error during parallel_scan: {e}")
             raise QueryError(
                 collection=collection.name,
                 query=processed_query,
@@ -195,7 +656,250 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             )
 
     @classmethod
-    @timing_decorator
+    def parallel_scan(
+        cls,
+        model_class: Type[T],
+        db: Database,
+        query: Optional[QueryType] = None,
+        partitions: int = DEFAULT_SCAN_PARTITIONS,
+        projection: Optional[ProjectionType] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        validate: Optional[bool] = None,
+        split: str = "sample",
+    ) -> Iterator[T]:
+        """
+        Iterate over documents matching the query, scanning ranges in parallel.
+
+        Runs ``parallel_scan_each`` in the background and merges the results
+        of all partitions into one iterator, in no particular order. At most
+        ``partitions * batch_size`` documents are buffered; closing the
+        iterator early stops the scan.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            query: MongoDB query
+            partitions: Number of ranges scanned at the same time
+            projection: Fields to include/exclude
+            batch_size: Number of documents fetched per server round trip
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            split: How to choose range boundaries: "sample" or "timestamp"
+
+        Yields:
+            Model instances
+        """
+        results: queue.Queue = queue.Queue(maxsize=max(partitions, 1) * batch_size)
+        stop = threading.Event()
+
+        def put(item: Any) -> None:
+            # Poll so workers notice when the consumer has gone away
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+            raise ScanStoppedError()
+
+        def run() -> None:
+            try:
+                cls.parallel_scan_each(
+                    model_class,
+                    db,
+                    lambda _, model: put(model),
+                    query,
+                    partitions,
+                    projection,
+                    batch_size,
+                    validate,
+                    split,
+                )
+            except ScanStoppedError:
+                return
+            except BaseException as e:  # noqa: BLE001
+                put(ScanFailure(e))
+            else:
+                put(SCAN_DONE)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = results.get()
+                if item is SCAN_DONE:
+                    return
+                if isinstance(item, ScanFailure):
+                    raise item.error
+                yield item
+        finally:
+            stop.set()
+            thread.join()
+
+    @staticmethod
+    def _scan_boundaries(
+        collection: Collection,
+        query: QueryType,
+        partitions: int,
+        split: str,
+    ) -> List[Any]:
+        """
+        Choose the ``_id`` boundaries that split a scan into partitions.
+
+        Args:
+            collection: Collection to scan
+            query: Processed MongoDB query
+            partitions: Number of partitions wanted
+            split: "sample" or "timestamp"
+
+        Returns:
+            Sorted, distinct boundaries
+        """
+        if split not in SCAN_SPLIT_MODES:
+            raise ValueError(
+                f"Unsupported split mode '{split}', expected one of {SCAN_SPLIT_MODES}",
+            )
+        if partitions < 2:
+            return []
+
+        if split == "sample":
+            pipeline = sample_pipeline(query, partitions * SCAN_SAMPLES_PER_PARTITION)
+            sampled_ids = [doc["_id"] for doc in collection.aggregate(pipeline)]
+            return sample_boundaries(sampled_ids, partitions)
+
+        first = collection.find_one(query, {"_id": 1}, sort=[("_id", 1)])
+        last = collection.find_one(query, {"_id": 1}, sort=[("_id", -1)])
+        return timestamp_boundaries(
+            first["_id"] if first else None,
+            last["_id"] if last else None,
+            partitions,
+        )
+
+    @classmethod
+    @instrumented
+    def paginate(
+        cls,
+        model_class: Type[T],
+        db: Database,
+        query: Optional[QueryType] = None,
+        sort: Optional[List[tuple]] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        token: Optional[str] = None,
+        projection: Optional[ProjectionType] = None,
+        validate: Optional[bool] = None,
+    ) -> Page[T]:
+        """
+        Fetch one page of documents using keyset (range-based) pagination.
+
+        Instead of skipping documents, each page continues from the sort key
+        values of the last document on the previous page (with ``_id`` as a
+        tiebreaker), so every page costs the same regardless of its depth.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            query: MongoDB query
+            sort: Sort specification (compound and mixed directions supported)
+            limit: Maximum number of documents per page
+            token: Continuation token from a previous page's ``next_token``
+            projection: Fields to include/exclude
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+
+        Returns:
+            Page of model instances with the token for the next page
+
+        Raises:
+            ValueError: If ``limit`` is less than 1
+        """
+        if limit < 1:
+            raise ValueError(f"paginate() limit must be at least 1, got {limit}")
+        if query is None:
+            query = {}
+
+        collection = model_class.get_collection(db)
+        processed_query = process_query(query, model_class.__model_meta__.native_id)
+
+        try:
+            sort_spec = normalize_sort(sort)
+            processed_query = keyset_page_query(processed_query, sort_spec, token)
+        except ValueError as e:
+            raise QueryError(
+                collection=collection.name,
+                query=processed_query,
+                message=str(e),
+            )
+
+        try:
+            cursor = cls._build_cursor(
+                collection,
+                processed_query,
+                include_sort_keys(projection, sort_spec),
+                sort_spec,
+                limit=limit + 1,
+            )
+            docs = list(cursor)
+        except PyMongoError as e:
+            logger.error(f"MongoDB error during paginate: {e}")
+            raise QueryError(
+                collection=collection.name,
+                query=processed_query,
+                message=str(e),
+            )
+
+        validate = should_validate(model_class, validate)
+        next_token = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            next_token = encode_page_token(
+                get_sort_values(docs[-1], sort_spec),
+                sort_spec,
+            )
+
+        return Page(
+            items=docs_to_models(docs, model_class, validate),
+            next_token=next_token,
+        )
+
+    @staticmethod
+    def _build_cursor(
+        collection: Collection,
+        query: QueryType,
+        projection: Optional[ProjectionType] = None,
+        sort: Optional[List[tuple]] = None,
+        skip: int = 0,
+        limit: int = 0,
+        batch_size: int = 0,
+    ) -> Cursor:
+        """
+        Create a find cursor with sorting, skip, limit and batch size applied.
+
+        Args:
+            collection: Collection instance
+            query: Processed MongoDB query
+            projection: Fields to include/exclude
+            sort: Sort specification
+            skip: Number of documents to skip
+            limit: Maximum number of documents to return
+            batch_size: Number of documents fetched per round trip (0 = server default)
+
+        Returns:
+            Cursor instance
+        """
+        cursor = collection.find(query, projection)
+
+        # Apply sorting, skip, limit and batch size
+        if sort:
+            cursor = cursor.sort(sort)
+        if skip:
+            cursor = cursor.skip(skip)
+        if limit:
+            cursor = cursor.limit(limit)
+        if batch_size:
+            cursor = cursor.batch_size(batch_size)
+
+        return cursor
+
+    @classmethod
+    @instrumented
     def delete(cls, model: Any, db: Database) -> bool:
         """
         Delete a model from the database.
@@ -215,10 +919,13 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             model._run_hooks(model._pre_delete_hooks)
 
             collection = model.get_collection(db)
-            result = collection.delete_one({"_id": ensure_object_id(model.id)})
+            doc_id = to_doc_id(model.id, type(model).__model_meta__.native_id)
+            result = collection.delete_one({"_id": doc_id})
+            invalidate_query_cache(type(model))
 
-            # Run post-delete hooks if deletion was successful
-            if result.deleted_count > 0:
+            # Run post-delete hooks if deletion was successful (unacknowledged
+            # w=0 deletes are assumed to have succeeded)
+            if not result.acknowledged or result.deleted_count > 0:
                 model._run_hooks(model._post_delete_hooks)
                 logger.debug(f"Deleted document with id: {model.id}")
                 return True
@@ -230,7 +937,7 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             raise MongoORMError(f"Failed to delete document: {e}")
 
     @classmethod
-    @timing_decorator
+    @instrumented
     def delete_many(cls, model_class: Type[T], db: Database, query: QueryType) -> int:
         """
         Delete multiple documents matching the query.
@@ -241,13 +948,17 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             query: MongoDB query
 
         Returns:
-            Number of documents deleted
+            Number of documents deleted (0 for unacknowledged writes)
         """
         collection = model_class.get_collection(db)
-        processed_query = process_query(query)
+        processed_query = process_query(query, model_class.__model_meta__.native_id)
 
         try:
             result = collection.delete_many(processed_query)
+            invalidate_query_cache(model_class)
+            if not result.acknowledged:
+                # Unacknowledged (w=0) writes do not report counts
+                return 0
             logger.debug(f"Deleted {result.deleted_count} documents")
             return result.deleted_count
         except PyMongoError as e:
@@ -259,7 +970,7 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             )
 
     @classmethod
-    @timing_decorator
+    @instrumented
     def update_many(
         cls,
         model_class: Type[T],
@@ -277,10 +988,10 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             update: Update specification
 
         Returns:
-            Number of documents updated
+            Number of documents updated (0 for unacknowledged writes)
         """
         collection = model_class.get_collection(db)
-        processed_query = process_query(query)
+        processed_query = process_query(query, model_class.__model_meta__.native_id)
 
         # Ensure update has proper MongoDB format with $set, $unset, etc.
         if not any(key.startswith("$") for key in update):
@@ -294,6 +1005,10 @@ class SyncMongoImplementation(AbstractMongoImplementation):
 
         try:
             result = collection.update_many(processed_query, update)
+            invalidate_query_cache(model_class)
+            if not result.acknowledged:
+                # Unacknowledged (w=0) writes do not report counts
+                return 0
             logger.debug(f"Updated {result.modified_count} documents")
             return result.modified_count
         except PyMongoError as e:
@@ -305,20 +1020,31 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             )
 
     @classmethod
-    @timing_decorator
+    @instrumented
     def count(
         cls,
         model_class: Type[T],
         db: Database,
         query: Optional[QueryType] = None,
+        limit: int = 0,
+        approximate: Optional[bool] = None,
     ) -> int:
         """
         Count documents matching the query.
 
+        Counting every document with an empty query uses the collection
+        metadata (``estimated_document_count``) instead of scanning.
+        ``limit`` stops an exact count early, for "more than N?" checks.
+        With ``__count_cache__`` configured, counts are cached for a short
+        TTL.
+
         Args:
             model_class: Model class
             db: Database instance
             query: MongoDB query
+            limit: Stop counting at this many documents (0 counts them all)
+            approximate: Use the collection metadata count (None uses it
+                when the query is empty)
 
         Returns:
             Document count
@@ -326,11 +1052,63 @@ class SyncMongoImplementation(AbstractMongoImplementation):
         if query is None:
             query = {}
 
+        processed_query = process_query(query, model_class.__model_meta__.native_id)
+        if approximate is None:
+            approximate = not processed_query
+        elif approximate and processed_query:
+            raise ValueError("Approximate counts cannot apply a query")
+
+        count_cache = get_count_cache(model_class)
+        if count_cache is not None:
+            operation = "estimated_count" if approximate else "count"
+            key = make_cache_key(db, operation, processed_query, limit=limit)
+            count, fresh = count_cache.get(key)
+            if fresh:
+                return count
+
+        count = cls._fetch_count(
+            model_class,
+            db,
+            processed_query,
+            limit,
+            approximate,
+        )
+        if count_cache is not None:
+            count_cache.set(key, count)
+        return count
+
+    @classmethod
+    def _fetch_count(
+        cls,
+        model_class: Type[T],
+        db: Database,
+        processed_query: QueryType,
+        limit: int,
+        approximate: bool,
+    ) -> int:
+        """Count documents on the server, through the query cache."""
         collection = model_class.get_collection(db)
-        processed_query = process_query(query)
+
+        cache = get_query_cache(model_class)
+        if cache is not None:
+            operation = "estimated_count" if approximate else "count"
+            key = make_cache_key(db, operation, processed_query, limit=limit)
+            count = cache.get(key)
+            if count is not CACHE_MISS:
+                return count
+            generation = cache.generation
 
         try:
-            count = collection.count_documents(processed_query)
+            if approximate:
+                count = collection.estimated_document_count()
+                if limit:
+                    count = min(count, limit)
+            elif limit:
+                count = collection.count_documents(processed_query, limit=limit)
+            else:
+                count = collection.count_documents(processed_query)
+            if cache is not None:
+                cache.set(key, count, 0, generation)
             return count
         except PyMongoError as e:
             logger.error(f"MongoDB error during count: {e}")
@@ -341,7 +1119,7 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             )
 
     @classmethod
-    @timing_decorator
+    @instrumented
     def ensure_indexes(cls, model_class: Type[T], db: Database) -> None:
         """
         Create indexes for the model collection.
@@ -351,27 +1129,9 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             db: Database instance
         """
         collection = model_class.get_collection(db)
-        index_configs = getattr(model_class, "__indexes__", [])
+        index_models = list(model_class.__model_meta__.index_models)
 
         try:
-            # Create multiple indexes at once for better performance
-            index_models = []
-
-            for index_config in index_configs:
-                fields = index_config.get("fields", [])
-                kwargs = {k: v for k, v in index_config.items() if k != "fields"}
-
-                # Process field specifications
-                processed_fields = []
-                for field_spec in fields:
-                    if isinstance(field_spec, tuple):
-                        processed_fields.append(field_spec)
-                    else:
-                        processed_fields.append((field_spec, 1))  # Default to ascending
-
-                # Create index model
-                index_models.append(IndexModel(processed_fields, **kwargs))
-
             if index_models:
                 collection.create_indexes(index_models)
                 logger.info(
@@ -386,12 +1146,66 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             )
 
     @classmethod
-    @timing_decorator
+    def aggregate_iter(
+        cls,
+        model_class: Type[T],
+        db: Database,
+        pipeline: List[Dict[str, Any]],
+        allow_disk_use: Optional[bool] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_time_ms: Optional[int] = None,
+        hint: Optional[Union[str, List[tuple]]] = None,
+        output_model: Optional[Type[Any]] = None,
+        as_: str = "dict",
+        validate: Optional[bool] = None,
+    ) -> Iterator[Any]:
+        """
+        Lazily iterate over the results of an aggregation pipeline.
+
+        Rows are fetched from the server ``batch_size`` at a time and
+        converted one by one, so memory usage does not grow with the size
+        of the result set. The server cursor is closed when the
+        generator is exhausted, closed or garbage collected.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+            pipeline: Aggregation pipeline
+            allow_disk_use: Let stages spill to temporary files past the memory limit
+            batch_size: Number of rows fetched per server round trip
+            max_time_ms: Server-side time limit in milliseconds
+            hint: Index name or specification to use
+            output_model: Pydantic model to build from each row
+            as_: Result type without an output model: "dict" or "bson"
+            validate: Whether to validate rows built into ``output_model``
+
+        Yields:
+            Pipeline results
+        """
+        convert = get_row_converter(as_, output_model, validate)
+        options = aggregate_options(allow_disk_use, batch_size, max_time_ms, hint)
+        collection = collection_for_result(model_class.get_collection(db), as_)
+
+        cursor = None
+        try:
+            cursor = collection.aggregate(pipeline, **options)
+            for doc in cursor:
+                yield convert(doc)
+        except PyMongoError as e:
+            logger.error(f"MongoDB error during aggregate: {e}")
+            raise MongoORMError(f"Aggregation pipeline error: {e}")
+        finally:
+            if cursor is not None:
+                cursor.close()
+
+    @classmethod
+    @instrumented
     def aggregate(
         cls,
         model_class: Type[T],
         db: Database,
         pipeline: List[Dict[str, Any]],
+        as_: str = "dict",
     ) -> List[Dict[str, Any]]:
         """
         Run an aggregation pipeline.
@@ -400,19 +1214,24 @@ class SyncMongoImplementation(AbstractMongoImplementation):
             model_class: Model class
             db: Database instance
             pipeline: Aggregation pipeline
+            as_: Result type: "dict" or "bson" (``RawBSONDocument``)
 
         Returns:
             Pipeline results
         """
-        collection = model_class.get_collection(db)
+        if as_ not in ("dict", "bson"):
+            raise ValueError(
+                f"as_ must be 'dict' or 'bson' for aggregate. Got: {as_!r}",
+            )
+        collection = collection_for_result(model_class.get_collection(db), as_)
 
         try:
             result = []
             cursor = collection.aggregate(pipeline)
             for doc in cursor:
                 # Convert ObjectId to string for _id
-                if "_id" in doc and isinstance(doc["_id"], ObjectId):
-                    doc["id"] = str(doc.pop("_id"))
+                if as_ == "dict":
+                    normalize_doc_id(doc)
                 result.append(doc)
             return result
         except PyMongoError as e:
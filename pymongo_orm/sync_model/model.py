@@ -2,15 +2,40 @@
 Synchronous MongoDB model implementation.
 """
 
-from typing import Any, Dict, List, Optional, Type, TypeVar
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from bson import ObjectId
 from pymongo.collection import Collection
 from pymongo.database import Database
 
 from ..abstract.implementation import AbstractMongoImplementation
 from ..abstract.model import AbstractMongoModel
+from ..config import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_BUFFER_MAX_AGE,
+    DEFAULT_BUFFER_MAX_SIZE,
+    DEFAULT_BULK_CHUNK_SIZE,
+    DEFAULT_ID_CHUNK_SIZE,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_SCAN_PARTITIONS,
+)
+from ..utils.bulk import SaveManyResult
 from ..utils.logging import get_logger
+from ..utils.pagination import Page
+from .buffer import SyncWriteBuffer
 from .implementation import SyncMongoImplementation
+from .queryset import SyncQuerySet
 
 # Type variables
 T = TypeVar("T", bound="SyncMongoModel")
@@ -41,12 +66,81 @@ class SyncMongoModel(AbstractMongoModel[Database, Collection]):
         """
         return SyncMongoImplementation.save(self, db)
 
+    @classmethod
+    def save_many(
+        cls: Type[T],
+        db: Database,
+        models: Iterable[T],
+        ordered: bool = False,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> SaveManyResult[T]:
+        """
+        Save many models using batched bulk writes.
+
+        New models are inserted and get their ids assigned; existing models
+        are updated with their changed fields. A failing document does not
+        abort the rest of the batch unless ``ordered`` is True.
+
+        Args:
+            db: Database instance
+            models: Model instances to save
+            ordered: Stop at the first failure instead of continuing
+            chunk_size: Maximum number of operations per bulk write
+
+        Returns:
+            Result listing the saved models and the per-model errors
+        """
+        return SyncMongoImplementation.save_many(cls, db, models, ordered, chunk_size)
+
+    @classmethod
+    def write_buffer(
+        cls: Type[T],
+        db: Database,
+        max_size: int = DEFAULT_BUFFER_MAX_SIZE,
+        max_age: float = DEFAULT_BUFFER_MAX_AGE,
+        ordered: bool = False,
+        on_error: Optional[Callable[[SaveManyResult], None]] = None,
+    ) -> SyncWriteBuffer[T]:
+        """
+        Create a write-behind buffer for this model.
+
+        Saves are merged per document and flushed with bulk writes when
+        ``max_size`` documents are pending or the oldest pending write is
+        ``max_age`` seconds old.
+
+        Args:
+            db: Database instance
+            max_size: Pending documents that trigger a flush
+            max_age: Seconds a write may stay pending before it is flushed
+            ordered: Stop each flush at the first failure
+            on_error: Called with the result of a flush that had failures
+
+        Returns:
+            Write buffer (use it as a context manager to drain on exit)
+        """
+        return SyncWriteBuffer(cls, db, max_size, max_age, ordered, on_error)
+
+    @classmethod
+    def objects(cls: Type[T], db: Database) -> SyncQuerySet[T]:
+        """
+        Start a lazy, chainable query on this model.
+
+        Args:
+            db: Database instance
+
+        Returns:
+            Query set matching every document
+        """
+        return SyncQuerySet(cls, db)
+
     @classmethod
     def find_one(
         cls: Type[T],
         db: Database,
         query: QueryType,
         projection: Optional[ProjectionType] = None,
+        validate: Optional[bool] = None,
+        as_: str = "model",
     ) -> Optional[T]:
         """
         Find a single document matching the query.
@@ -55,11 +149,20 @@ class SyncMongoModel(AbstractMongoModel[Database, Collection]):
             db: Database instance
             query: MongoDB query
             projection: Fields to include/exclude
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            as_: Result type: "model", "dict", "record" or "bson" (``RawBSONDocument``)
 
         Returns:
-            Model instance or None if not found
+            Result in the requested form, or None if not found
         """
-        return SyncMongoImplementation.find_one(cls, db, query, projection)
+        return SyncMongoImplementation.find_one(
+            cls,
+            db,
+            query,
+            projection,
+            validate,
+            as_,
+        )
 
     @classmethod
     def find(
@@ -70,6 +173,8 @@ class SyncMongoModel(AbstractMongoModel[Database, Collection]):
         sort: Optional[SortType] = None,
         skip: int = 0,
         limit: int = 0,
+        validate: Optional[bool] = None,
+        as_: str = "model",
     ) -> List[T]:
         """
         Find documents matching the query.
@@ -81,9 +186,11 @@ class SyncMongoModel(AbstractMongoModel[Database, Collection]):
             sort: Sort specification
             skip: Number of documents to skip
             limit: Maximum number of documents to return
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            as_: Result type: "model", "dict", "record" or "bson" (``RawBSONDocument``)
 
         Returns:
-            List of model instances
+            List of results in the requested form
         """
         return SyncMongoImplementation.find(
             cls,
@@ -93,6 +200,211 @@ class SyncMongoModel(AbstractMongoModel[Database, Collection]):
             sort,
             skip,
             limit,
+            validate,
+            as_,
+        )
+
+    @classmethod
+    def find_by_ids(
+        cls: Type[T],
+        db: Database,
+        ids: Iterable[Union[str, ObjectId]],
+        chunk_size: int = DEFAULT_ID_CHUNK_SIZE,
+        preserve_order: bool = True,
+        missing: str = "skip",
+        projection: Optional[ProjectionType] = None,
+        validate: Optional[bool] = None,
+    ) -> List[Optional[T]]:
+        """
+        Find documents by a list of ids.
+
+        Large id lists are split into ``$in`` chunks of ``chunk_size`` ids.
+
+        Args:
+            db: Database instance
+            ids: Document ids (strings or ObjectIds)
+            chunk_size: Maximum ids per ``$in`` query
+            preserve_order: Return results in the order of ``ids``
+            missing: Policy for ids that are not found: "skip", "none" or "raise"
+            projection: Fields to include/exclude
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+
+        Returns:
+            Model instances (None for missing ids when ``missing="none"``)
+        """
+        return SyncMongoImplementation.find_by_ids(
+            cls,
+            db,
+            ids,
+            chunk_size,
+            preserve_order,
+            missing,
+            projection,
+            validate,
+        )
+
+    @classmethod
+    def iter_find(
+        cls: Type[T],
+        db: Database,
+        query: Optional[QueryType] = None,
+        projection: Optional[ProjectionType] = None,
+        sort: Optional[SortType] = None,
+        skip: int = 0,
+        limit: int = 0,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        validate: Optional[bool] = None,
+    ) -> Iterator[T]:
+        """
+        Lazily iterate over documents matching the query.
+
+        Args:
+            db: Database instance
+            query: MongoDB query
+            projection: Fields to include/exclude
+            sort: Sort specification
+            skip: Number of documents to skip
+            limit: Maximum number of documents to return
+            batch_size: Number of documents fetched per server round trip
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+
+        Returns:
+            Iterator of model instances
+        """
+        return SyncMongoImplementation.iter_find(
+            cls,
+            db,
+            query,
+            projection,
+            sort,
+            skip,
+            limit,
+            batch_size,
+            validate,
+        )
+
+    @classmethod
+    def parallel_scan(
+        cls: Type[T],
+        db: Database,
+        query: Optional[QueryType] = None,
+        partitions: int = DEFAULT_SCAN_PARTITIONS,
+        projection: Optional[ProjectionType] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        validate: Optional[bool] = None,
+        split: str = "sample",
+    ) -> Iterator[T]:
+        """
+        Iterate over documents matching the query, scanning ranges in parallel.
+
+        Results from all partitions are merged in no particular order;
+        closing the iterator early stops the scan.
+
+        Args:
+            db: Database instance
+            query: MongoDB query
+            partitions: Number of ranges scanned at the same time
+            projection: Fields to include/exclude
+            batch_size: Number of documents fetched per server round trip
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            split: How to choose range boundaries: "sample" (``$sample`` of
+                the matching ids) or "timestamp" (even ObjectId time ranges)
+
+        Returns:
+            Iterator of model instances
+        """
+        return SyncMongoImplementation.parallel_scan(
+            cls,
+            db,
+            query,
+            partitions,
+            projection,
+            batch_size,
+            validate,
+            split,
+        )
+
+    @classmethod
+    def parallel_scan_each(
+        cls: Type[T],
+        db: Database,
+        callback: Callable[[int, T], Any],
+        query: Optional[QueryType] = None,
+        partitions: int = DEFAULT_SCAN_PARTITIONS,
+        projection: Optional[ProjectionType] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        validate: Optional[bool] = None,
+        split: str = "sample",
+    ) -> int:
+        """
+        Scan documents matching the query with one thread per ``_id`` range.
+
+        ``callback(partition, model)`` is called from the worker threads.
+
+        Args:
+            db: Database instance
+            callback: Function called for every document
+            query: MongoDB query
+            partitions: Number of ranges scanned at the same time
+            projection: Fields to include/exclude
+            batch_size: Number of documents fetched per server round trip
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+            split: How to choose range boundaries: "sample" (``$sample`` of
+                the matching ids) or "timestamp" (even ObjectId time ranges)
+
+        Returns:
+            Number of documents scanned
+        """
+        return SyncMongoImplementation.parallel_scan_each(
+            cls,
+            db,
+            callback,
+            query,
+            partitions,
+            projection,
+            batch_size,
+            validate,
+            split,
+        )
+
+    @classmethod
+    def paginate(
+        cls: Type[T],
+        db: Database,
+        query: Optional[QueryType] = None,
+        sort: Optional[SortType] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        token: Optional[str] = None,
+        projection: Optional[ProjectionType] = None,
+        validate: Optional[bool] = None,
+    ) -> Page[T]:
+        """
+        Fetch one page of documents using keyset pagination.
+
+        Pass the returned page's ``next_token`` back as ``token`` to fetch
+        the following page. The token is URL-safe and opaque.
+
+        Args:
+            db: Database instance
+            query: MongoDB query
+            sort: Sort specification
+            limit: Maximum number of documents per page
+            token: Continuation token from the previous page's ``next_token``
+            projection: Fields to include/exclude
+            validate: Whether to validate documents (None uses ``__trusted_reads__``)
+
+        Returns:
+            Page of model instances
+        """
+        return SyncMongoImplementation.paginate(
+            cls,
+            db,
+            query,
+            sort,
+            limit,
+            token,
+            projection,
+            validate,
         )
 
     def delete(self, db: Database) -> bool:
@@ -137,18 +449,27 @@ class SyncMongoModel(AbstractMongoModel[Database, Collection]):
         return SyncMongoImplementation.update_many(cls, db, query, update)
 
     @classmethod
-    def count(cls, db: Database, query: Optional[QueryType] = None) -> int:
+    def count(
+        cls,
+        db: Database,
+        query: Optional[QueryType] = None,
+        limit: int = 0,
+        approximate: Optional[bool] = None,
+    ) -> int:
         """
         Count documents matching the query.
 
         Args:
             db: Database instance
             query: MongoDB query
+            limit: Stop counting at this many documents (0 counts them all)
+            approximate: Use the collection metadata count (None uses it
+                when the query is empty)
 
         Returns:
             Document count
         """
-        return SyncMongoImplementation.count(cls, db, query)
+        return SyncMongoImplementation.count(cls, db, query, limit, approximate)
 
     @classmethod
     def ensure_indexes(cls, db: Database) -> None:
@@ -160,11 +481,55 @@ class SyncMongoModel(AbstractMongoModel[Database, Collection]):
         """
         SyncMongoImplementation.ensure_indexes(cls, db)
 
+    @classmethod
+    def aggregate_iter(
+        cls,
+        db: Database,
+        pipeline: List[Dict[str, Any]],
+        allow_disk_use: Optional[bool] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_time_ms: Optional[int] = None,
+        hint: Optional[Union[str, List[tuple]]] = None,
+        output_model: Optional[Type[Any]] = None,
+        as_: str = "dict",
+        validate: Optional[bool] = None,
+    ) -> Iterator[Any]:
+        """
+        Lazily iterate over the results of an aggregation pipeline.
+
+        Args:
+            db: Database instance
+            pipeline: Aggregation pipeline
+            allow_disk_use: Let stages spill to temporary files past the memory limit
+            batch_size: Number of rows fetched per server round trip
+            max_time_ms: Server-side time limit in milliseconds
+            hint: Index name or specification to use
+            output_model: Pydantic model to build from each row
+            as_: Result type without an output model: "dict" or "bson"
+            validate: Whether to validate rows built into ``output_model``
+
+        Returns:
+            Iterator of pipeline results
+        """
+        return SyncMongoImplementation.aggregate_iter(
+            cls,
+            db,
+            pipeline,
+            allow_disk_use,
+            batch_size,
+            max_time_ms,
+            hint,
+            output_model,
+            as_,
+            validate,
+        )
+
     @classmethod
     def aggregate(
         cls,
         db: Database,
         pipeline: List[Dict[str, Any]],
+        as_: str = "dict",
     ) -> List[Dict[str, Any]]:
         """
         Run an aggregation pipeline.
@@ -172,11 +537,12 @@ class SyncMongoModel(AbstractMongoModel[Database, Collection]):
         Args:
             db: Database instance
             pipeline: Aggregation pipeline
+            as_: Result type: "dict" or "bson" (``RawBSONDocument``)
 
         Returns:
             Pipeline results
         """
-        return SyncMongoImplementation.aggregate(cls, db, pipeline)
+        return SyncMongoImplementation.aggregate(cls, db, pipeline, as_)
 
     @classmethod
     def bulk_write(cls, db: Database, operations: List[Dict[str, Any]]) -> Any:
@@ -0,0 +1,144 @@
+"""
+Lazy query sets for synchronous models.
+"""
+
+from typing import Iterator, List, Optional, TypeVar, Union, overload
+
+from ..utils.queryset import BaseQuerySet
+from .implementation import SyncMongoImplementation
+
+# Type variables
+T = TypeVar("T")
+
+
+class SyncQuerySet(BaseQuerySet[T]):
+    """
+    Lazy, chainable query for a synchronous model.
+
+    Nothing is sent to the server until the query set is iterated, indexed
+    or asked for ``all()``, ``first()``, ``count()`` or ``exists()``.
+    Slicing returns a new query set with the skip and limit applied.
+
+    Example:
+        adults = User.objects(db).filter(age={"$gte": 18}).order_by("-age")
+        for user in adults[:10]:
+            ...
+    """
+
+    def __iter__(self) -> Iterator[T]:
+        """Stream matching models, ``batch_size`` documents at a time."""
+        if self._empty:
+            return iter(())
+        return SyncMongoImplementation.iter_find(
+            self.model_class,
+            self.db,
+            self.query,
+            self._projection,
+            self._sort,
+            self._skip,
+            self._limit,
+            self._batch_size,
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "SyncQuerySet[T]": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, "SyncQuerySet[T]"]:
+        """
+        Slice the query set, or fetch the model at a position.
+
+        Args:
+            index: Slice (lazy) or position (runs the query)
+
+        Returns:
+            New query set, or the model at the position
+        """
+        if isinstance(index, slice):
+            return self._slice(index)
+        if index < 0:
+            raise ValueError("Query set slices do not support negative indexes")
+        model = self._slice(slice(index, index + 1)).first()
+        if model is None:
+            raise IndexError("Query set index out of range")
+        return model
+
+    def all(self) -> List[T]:
+        """
+        Fetch every matching model.
+
+        Returns:
+            Model instances
+        """
+        if self._empty:
+            return []
+        return SyncMongoImplementation.find(
+            self.model_class,
+            self.db,
+            self.query,
+            self._projection,
+            self._sort,
+            self._skip,
+            self._limit,
+        )
+
+    def first(self) -> Optional[T]:
+        """
+        Fetch the first matching model.
+
+        Returns:
+            Model instance, or None if nothing matches
+        """
+        models = self.limit(1).all()
+        return models[0] if models else None
+
+    def count(self) -> int:
+        """
+        Count matching documents, honouring any skip and limit.
+
+        Returns:
+            Number of documents
+        """
+        if self._empty:
+            return 0
+        # Counting stops once it reaches the end of the window
+        limit = self._skip + self._limit if self._limit else 0
+        total = SyncMongoImplementation.count(
+            self.model_class,
+            self.db,
+            self.query,
+            limit,
+        )
+        return self._count_window(total)
+
+    def exists(self) -> bool:
+        """
+        Check whether any document matches, fetching only its ``_id``.
+
+        Returns:
+            True if a document matches
+        """
+        if self._empty:
+            return False
+        if not self._skip:
+            doc = SyncMongoImplementation.find_one(
+                self.model_class,
+                self.db,
+                self.query,
+                {"_id": 1},
+                as_="dict",
+            )
+            return doc is not None
+        docs = SyncMongoImplementation.find(
+            self.model_class,
+            self.db,
+            self.query,
+            {"_id": 1},
+            None,
+            self._skip,
+            1,
+            as_="dict",
+        )
+        return bool(docs)
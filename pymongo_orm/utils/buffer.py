@@ -0,0 +1,164 @@
+"""
+Write-behind buffer utilities for MongoDB ORM.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+import bson
+from pymongo import InsertOne, UpdateOne
+
+from .bulk import PlannedWrite, SaveManyResult, plan_save
+from .converters import from_doc_id, to_doc_id
+
+
+def merge_updates(first: Dict[str, Any], second: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Combine two update documents so applying the result equals applying both.
+
+    Args:
+        first: Earlier update with ``$set``/``$unset`` keys
+        second: Later update with ``$set``/``$unset`` keys
+
+    Returns:
+        Merged update document
+    """
+    set_fields = {**first.get("$set", {}), **second.get("$set", {})}
+    unset_fields = {**first.get("$unset", {}), **second.get("$unset", {})}
+
+    # The later operation wins for fields touched by both
+    for field in second.get("$set", {}):
+        unset_fields.pop(field, None)
+    for field in second.get("$unset", {}):
+        set_fields.pop(field, None)
+
+    merged: Dict[str, Any] = {}
+    if set_fields:
+        merged["$set"] = set_fields
+    if unset_fields:
+        merged["$unset"] = unset_fields
+    return merged
+
+
+def merge_writes(pending: PlannedWrite, write: PlannedWrite) -> PlannedWrite:
+    """
+    Coalesce a later write to the same document into a pending one.
+
+    An update to a document that is still waiting to be inserted is folded
+    into the inserted document; two updates are merged into one.
+
+    Args:
+        pending: Write already in the buffer
+        write: Later write for the same ``_id``
+
+    Returns:
+        Single write equivalent to both
+    """
+    update = merge_updates(pending.update, write.update)
+
+    if pending.inserted_id is not None:
+        doc = {"_id": pending.inserted_id, **update.get("$set", {})}
+        return PlannedWrite(
+            model=write.model,
+            operation=InsertOne(doc),
+            update={"$set": update.get("$set", {})},
+            size=len(bson.encode(doc)),
+            inserted_id=pending.inserted_id,
+            queued=True,
+        )
+
+    native_id = type(write.model).__model_meta__.native_id
+    query = {"_id": to_doc_id(write.model.id, native_id)}
+    return PlannedWrite(
+        model=write.model,
+        operation=UpdateOne(query, update, upsert=pending.upsert),
+        update=update,
+        size=len(bson.encode(query)) + len(bson.encode(update)),
+        queued=True,
+        upsert=pending.upsert,
+    )
+
+
+def rollback_unsent(writes: List[PlannedWrite], result: SaveManyResult) -> None:
+    """
+    Roll back buffered writes that a failed flush never got to record.
+
+    Args:
+        writes: Writes drained for the flush
+        result: Partial result recorded before the flush failed
+    """
+    settled = {id(model) for model in result.saved}
+    settled.update(id(error.model) for error in result.errors)
+    for write in writes:
+        if id(write.model) not in settled:
+            write.model._mark_unsaved(inserted=write.inserted_id is not None)
+
+
+class PendingWrites:
+    """
+    Buffered writes keyed by document ``_id``.
+
+    Not thread-safe; callers serialize access with their own lock.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self._writes: Dict[Any, PlannedWrite] = {}
+        self._oldest: Optional[float] = None
+
+    def __len__(self) -> int:
+        """Number of distinct documents with pending writes."""
+        return len(self._writes)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the oldest pending write was buffered."""
+        if self._oldest is None:
+            return 0.0
+        return time.monotonic() - self._oldest
+
+    def add(self, model: Any) -> bool:
+        """
+        Buffer a save for a model whose pre-save hooks have already run.
+
+        New models get their client-side id immediately and the model's
+        snapshot is advanced, so it can keep being modified and saved while
+        the write is pending. Later saves of the same document are merged
+        into the pending write.
+
+        Args:
+            model: Model instance to save
+
+        Returns:
+            Whether a write was buffered (False if nothing changed)
+        """
+        write = plan_save(model)
+        if write is None:
+            return False
+
+        write.queued = True
+        native_id = type(model).__model_meta__.native_id
+        if write.inserted_id is not None:
+            model.id = from_doc_id(write.inserted_id, native_id)
+            key = write.inserted_id
+        else:
+            key = to_doc_id(model.id, native_id)
+        model._mark_saved(write.update)
+
+        pending = self._writes.get(key)
+        self._writes[key] = write if pending is None else merge_writes(pending, write)
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+        return True
+
+    def drain(self) -> List[PlannedWrite]:
+        """
+        Remove and return every pending write, oldest first.
+
+        Returns:
+            Pending writes
+        """
+        writes = list(self._writes.values())
+        self._writes = {}
+        self._oldest = None
+        return writes
@@ -0,0 +1,226 @@
+"""
+Batch write utilities for MongoDB ORM.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, Iterator, List, Optional, TypeVar, Union
+
+import bson
+from bson import ObjectId
+from pymongo import InsertOne, UpdateOne
+
+from ..config import MAX_BULK_CHUNK_BYTES, MAX_BULK_OPERATIONS
+from .converters import from_doc_id, to_doc_id
+
+T = TypeVar("T")
+NOT_ATTEMPTED = "Not attempted after an earlier failure"
+WriteOp = Union[InsertOne, UpdateOne]
+
+
+@dataclass
+class SaveManyError(Generic[T]):
+    """
+    A model that could not be saved by ``save_many()``.
+
+    Attributes:
+        model: Model instance that failed
+        message: Server error message
+        code: Server error code, or None if the write was never attempted
+    """
+
+    model: T
+    message: str
+    code: Optional[int] = None
+
+
+@dataclass
+class SaveManyResult(Generic[T]):
+    """
+    Outcome of a ``save_many()`` call.
+
+    Attributes:
+        saved: Models that were inserted, updated or had nothing to update
+        errors: Models that failed, with the reason
+    """
+
+    saved: List[T] = field(default_factory=list)
+    errors: List[SaveManyError[T]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every model was saved."""
+        return not self.errors
+
+
+@dataclass
+class PlannedWrite:
+    """
+    A single model's pending write within a batch.
+
+    Writes queued in a write buffer are ``queued``: the model's id and
+    snapshot were already updated when it was buffered, so a successful
+    write leaves the model alone and a failed one rolls it back.
+    """
+
+    model: Any
+    operation: WriteOp
+    update: Dict[str, Any]
+    size: int
+    inserted_id: Optional[ObjectId] = None
+    queued: bool = False
+    upsert: bool = False
+
+
+def plan_save(model: Any) -> Optional[PlannedWrite]:
+    """
+    Build the write operation for a model that has already been prepared.
+
+    New models get a client-side ObjectId so their id is known before the
+    batch is sent. Existing models are updated with their minimal diff;
+    natively keyed models built with an id are upserted.
+
+    Args:
+        model: Model instance (pre-save hooks already run)
+
+    Returns:
+        Planned write, or None if an existing model has no changes
+    """
+    if model.id is None:
+        doc = type(model).__model_meta__.encode(model)
+        inserted_id = ObjectId()
+        doc["_id"] = inserted_id
+        return PlannedWrite(
+            model=model,
+            operation=InsertOne(doc),
+            update={"$set": {k: v for k, v in doc.items() if k != "_id"}},
+            size=len(bson.encode(doc)),
+            inserted_id=inserted_id,
+        )
+
+    native_id = type(model).__model_meta__.native_id
+    upsert = native_id and model._snapshot is None
+    update = model._get_changes()
+    if not update:
+        return None
+    query = {"_id": to_doc_id(model.id, native_id)}
+    return PlannedWrite(
+        model=model,
+        operation=UpdateOne(query, update, upsert=upsert),
+        update=update,
+        size=len(bson.encode(query)) + len(bson.encode(update)),
+        upsert=upsert,
+    )
+
+
+def chunk_writes(
+    writes: List[PlannedWrite],
+    chunk_size: int,
+    max_bytes: int = MAX_BULK_CHUNK_BYTES,
+) -> Iterator[List[PlannedWrite]]:
+    """
+    Split planned writes into chunks within the server's batch limits.
+
+    Args:
+        writes: Planned writes
+        chunk_size: Maximum operations per chunk (capped at 100,000)
+        max_bytes: Maximum encoded bytes per chunk
+
+    Yields:
+        Lists of planned writes
+    """
+    chunk_size = max(1, min(chunk_size, MAX_BULK_OPERATIONS))
+    chunk: List[PlannedWrite] = []
+    chunk_bytes = 0
+
+    for write in writes:
+        if chunk and (len(chunk) >= chunk_size or chunk_bytes + write.size > max_bytes):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+        chunk.append(write)
+        chunk_bytes += write.size
+
+    if chunk:
+        yield chunk
+
+
+def apply_chunk_result(
+    chunk: List[PlannedWrite],
+    write_errors: List[Dict[str, Any]],
+    ordered: bool,
+    result: SaveManyResult,
+) -> List[Any]:
+    """
+    Record the outcome of a chunk and update the successfully written models.
+
+    Args:
+        chunk: Planned writes sent in one bulk_write call
+        write_errors: ``writeErrors`` from a BulkWriteError (empty on success)
+        ordered: Whether the bulk write was ordered
+        result: Result to record saved models and errors into
+
+    Returns:
+        Models written successfully, for running post-save hooks
+    """
+    errors_by_index = {error["index"]: error for error in write_errors}
+    # An ordered bulk write stops at the first error
+    stop_at = min(errors_by_index) if ordered and errors_by_index else len(chunk)
+
+    written = []
+    for index, write in enumerate(chunk):
+        error = errors_by_index.get(index)
+        if error is not None:
+            record_failure(
+                write,
+                SaveManyError(write.model, error.get("errmsg", ""), error.get("code")),
+                result,
+            )
+            continue
+        if index > stop_at:
+            record_failure(write, SaveManyError(write.model, NOT_ATTEMPTED), result)
+            continue
+
+        if not write.queued:
+            if write.inserted_id is not None:
+                write.model.id = from_doc_id(
+                    write.inserted_id,
+                    type(write.model).__model_meta__.native_id,
+                )
+            write.model._mark_saved(write.update)
+        result.saved.append(write.model)
+        written.append(write.model)
+
+    return written
+
+
+def record_failure(
+    write: PlannedWrite,
+    error: SaveManyError,
+    result: SaveManyResult,
+) -> None:
+    """
+    Record a failed write, rolling back the model if it was buffered.
+
+    Args:
+        write: Planned write that failed
+        error: Reason for the failure
+        result: Result to record the error into
+    """
+    if write.queued:
+        write.model._mark_unsaved(inserted=write.inserted_id is not None)
+    result.errors.append(error)
+
+
+def skip_remaining(
+    chunks: Iterator[List[PlannedWrite]],
+    result: SaveManyResult,
+) -> None:
+    """
+    Record every write in the remaining chunks as not attempted.
+
+    Args:
+        chunks: Chunks that will not be sent
+        result: Result to record errors into
+    """
+    for chunk in chunks:
+        for write in chunk:
+            record_failure(write, SaveManyError(write.model, NOT_ATTEMPTED), result)
@@ -0,0 +1,552 @@
+"""
+Query result cache for MongoDB ORM.
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+
+import bson
+from bson import json_util
+from bson.codec_options import DEFAULT_CODEC_OPTIONS, CodecOptions
+from bson.json_util import CANONICAL_JSON_OPTIONS
+from bson.raw_bson import RawBSONDocument
+
+from ..config import (
+    DEFAULT_CACHE_MAX_BYTES,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_COUNT_CACHE_STALE_TTL,
+    DEFAULT_COUNT_CACHE_TTL,
+)
+
+# Returned by QueryCache.get() when a key is absent or expired
+CACHE_MISS = object()
+
+# Operators whose values are lists of query documents
+_LOGICAL_OPERATORS = ("$and", "$or", "$nor")
+
+# Client attribute holding the scope its cached reads are keyed under
+CACHE_SCOPE_ATTRIBUTE = "_pymongo_orm_cache_scope"
+
+# Scopes for clients that were not created by a connection
+_anonymous_scopes = itertools.count()
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters for a model's query cache.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that went to the database
+        evictions: Entries dropped by the LRU, size or TTL limits
+        invalidations: Times the cache was cleared by a write
+        entries: Entries currently cached
+        size_bytes: Encoded size of the cached results
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache of query results with TTL expiry.
+
+    Results are stored BSON-encoded so every hit decodes fresh documents
+    and callers can never mutate a cached value. A generation counter,
+    bumped on every invalidation, stops a read that raced a write from
+    caching what it fetched before the write.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total encoded size of cached results
+            ttl: Seconds a result stays valid
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._entries: OrderedDict[str, Tuple[float, Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._size = 0
+        self._stats = CacheStats()
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented by every invalidation."""
+        return self._generation
+
+    def get(self, key: str) -> Any:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or ``CACHE_MISS``
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                self._stats.evictions += 1
+                entry = None
+
+            if entry is None:
+                self._stats.misses += 1
+                return CACHE_MISS
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any, size: int, generation: int) -> None:
+        """
+        Cache a value unless the cache was invalidated since it was read.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            size: Encoded size of the value in bytes
+            generation: ``generation`` observed before the value was read
+        """
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, value, size)
+            self._size += size
+
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats.evictions += 1
+
+    def get_docs(self, key: str, codec_options: Any) -> Any:
+        """
+        Look up cached result documents.
+
+        Args:
+            key: Cache key
+            codec_options: Codec options of the collection being read
+
+        Returns:
+            Freshly decoded documents, or ``CACHE_MISS``
+        """
+        encoded = self.get(key)
+        if encoded is CACHE_MISS:
+            return CACHE_MISS
+        return decode_docs(encoded, codec_options)
+
+    def set_docs(
+        self,
+        key: str,
+        docs: List[Any],
+        codec_options: Any,
+        generation: int,
+    ) -> None:
+        """
+        Cache result documents.
+
+        Args:
+            key: Cache key
+            docs: Documents returned by the driver
+            codec_options: Codec options of the collection they came from
+            generation: ``generation`` observed before the documents were read
+        """
+        encoded, size = encode_docs(docs, codec_options)
+        self.set(key, encoded, size, generation)
+
+    def invalidate(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._generation += 1
+            self._stats.invalidations += 1
+
+    def stats(self) -> CacheStats:
+        """
+        Get a snapshot of the cache counters.
+
+        Returns:
+            Cache statistics
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                invalidations=self._stats.invalidations,
+                entries=len(self._entries),
+                size_bytes=self._size,
+            )
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry; the caller holds the lock."""
+        _, _, size = self._entries.pop(key)
+        self._size -= size
+
+
+class CountCache:
+    """
+    Thread-safe LRU cache of document counts with stale-while-revalidate.
+
+    A count is fresh for ``ttl`` seconds, then stale for ``stale_ttl`` more
+    seconds, during which async callers get the stale value while a single
+    background refresh runs. Counts are not invalidated by writes; they are
+    meant for figures that may lag by a few seconds, such as badges.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_COUNT_CACHE_TTL,
+        stale_ttl: float = DEFAULT_COUNT_CACHE_STALE_TTL,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a count is fresh
+            stale_ttl: Seconds after ``ttl`` a count may be served while it
+                is refreshed
+            max_entries: Maximum number of cached counts
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[str, Tuple[float, int]] = OrderedDict()
+        self._refreshing: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[Any, bool]:
+        """
+        Look up a cached count.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The count (or ``CACHE_MISS``) and whether it is still fresh
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return CACHE_MISS, False
+
+            age = time.monotonic() - entry[0]
+            if age >= self.ttl + self.stale_ttl:
+                del self._entries[key]
+                return CACHE_MISS, False
+
+            self._entries.move_to_end(key)
+            return entry[1], age < self.ttl
+
+    def set(self, key: str, count: int) -> None:
+        """
+        Cache a count.
+
+        Args:
+            key: Cache key
+            count: Document count
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), count)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def start_refresh(self, key: str) -> bool:
+        """
+        Claim the refresh of a stale count.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the caller should refresh it, False if a refresh is
+            already running
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str) -> None:
+        """
+        Release a refresh claimed with ``start_refresh``.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def clear(self) -> None:
+        """Drop every cached count."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Caches are created lazily, one per model class with __cache__ configured
+_caches: Dict[type, QueryCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_query_cache(model_class: Type[Any]) -> Optional[QueryCache]:
+    """
+    Get the query cache for a model class.
+
+    Caching is enabled by setting ``__cache__`` on the model to a dict of
+    ``QueryCache`` options (``{}`` uses the defaults).
+
+    Args:
+        model_class: Model class
+
+    Returns:
+        Query cache, or None if caching is not enabled for the model
+    """
+    cache = _caches.get(model_class)
+    if cache is not None:
+        return cache
+
+    options = getattr(model_class, "__cache__", None)
+    if options is None:
+        return None
+
+    with _caches_lock:
+        cache = _caches.get(model_class)
+        if cache is None:
+            cache = _caches[model_class] = QueryCache(**options)
+        return cache
+
+
+def invalidate_query_cache(model_class: Type[Any]) -> None:
+    """
+    Invalidate the query cache of a model class after a write.
+
+    Args:
+        model_class: Model class
+    """
+    cache = _caches.get(model_class)
+    if cache is not None:
+        cache.invalidate()
+
+
+# Count caches are created lazily, one per model class with __count_cache__
+_count_caches: Dict[type, CountCache] = {}
+
+
+def get_count_cache(model_class: Type[Any]) -> Optional[CountCache]:
+    """
+    Get the count cache for a model class.
+
+    Count caching is enabled by setting ``__count_cache__`` on the model to
+    a dict of ``CountCache`` options (``{}`` uses the defaults).
+
+    Args:
+        model_class: Model class
+
+    Returns:
+        Count cache, or None if count caching is not enabled for the model
+    """
+    cache = _count_caches.get(model_class)
+    if cache is not None:
+        return cache
+
+    options = getattr(model_class, "__count_cache__", None)
+    if options is None:
+        return None
+
+    with _caches_lock:
+        cache = _count_caches.get(model_class)
+        if cache is None:
+            cache = _count_caches[model_class] = CountCache(**options)
+        return cache
+
+
+def normalize_query(query: Any) -> Any:
+    """
+    Put a query in a canonical form so equivalent queries share a cache key.
+
+    Keys of query documents and operator documents are sorted. Embedded
+    documents used as equality values keep their order, since MongoDB
+    compares them field by field.
+
+    Args:
+        query: Processed MongoDB query (or a value within one)
+
+    Returns:
+        Normalized query
+    """
+    if isinstance(query, dict):
+        return {
+            key: (
+                [normalize_query(clause) for clause in value]
+                if key in _LOGICAL_OPERATORS and isinstance(value, list)
+                else _normalize_value(value)
+            )
+            for key, value in sorted(query.items())
+        }
+    return query
+
+
+def _normalize_value(value: Any) -> Any:
+    """Normalize operator documents; leave literal values untouched."""
+    if isinstance(value, dict) and value and all(k.startswith("$") for k in value):
+        return normalize_query(value)
+    return value
+
+
+def set_cache_scope(client: Any, scope: Any) -> None:
+    """
+    Set the scope a client's cached reads are keyed under.
+
+    Connections set their registry key, so reads through any client built
+    for the same URI and options share entries, and a scope is never
+    reused by an unrelated client the way ``id()`` values are.
+
+    Args:
+        client: MongoDB client
+        scope: JSON-serializable scope
+    """
+    # vars() skips the client __getattr__, which returns databases
+    vars(client)[CACHE_SCOPE_ATTRIBUTE] = scope
+
+
+def cache_scope(client: Any) -> Any:
+    """
+    Get the scope a client's cached reads are keyed under.
+
+    Clients that were not created by a connection get a new unique scope
+    the first time they are seen.
+
+    Args:
+        client: MongoDB client
+
+    Returns:
+        Cache scope
+    """
+    attributes = vars(client)
+    scope = attributes.get(CACHE_SCOPE_ATTRIBUTE)
+    if scope is None:
+        scope = attributes.setdefault(
+            CACHE_SCOPE_ATTRIBUTE,
+            f"client-{next(_anonymous_scopes)}",
+        )
+    return scope
+
+
+def make_cache_key(
+    db: Any,
+    operation: str,
+    query: Dict[str, Any],
+    projection: Optional[Dict[str, Any]] = None,
+    sort: Optional[List[tuple]] = None,
+    skip: int = 0,
+    limit: int = 0,
+    as_: str = "model",
+) -> str:
+    """
+    Build the cache key for a read.
+
+    Args:
+        db: Database instance the read runs against
+        operation: Read operation ("find", "find_one" or "count")
+        query: Processed MongoDB query
+        projection: Fields to include/exclude
+        sort: Sort specification
+        skip: Number of documents to skip
+        limit: Maximum number of documents to return
+        as_: Result type (only "bson" changes the cached documents)
+
+    Returns:
+        Cache key
+    """
+    key = [
+        cache_scope(db.client),
+        db.name,
+        operation,
+        normalize_query(query),
+        normalize_query(projection or {}),
+        [list(item) for item in sort or []],
+        skip,
+        limit,
+        as_ == "bson",
+    ]
+    return json_util.dumps(key, json_options=CANONICAL_JSON_OPTIONS)
+
+
+def _bson_options(codec_options: Any) -> CodecOptions:
+    """Use the collection's codec options if they are PyMongo's own."""
+    if isinstance(codec_options, CodecOptions):
+        return codec_options
+    return DEFAULT_CODEC_OPTIONS
+
+
+def encode_docs(docs: List[Any], codec_options: Any) -> Tuple[List[bytes], int]:
+    """
+    Encode result documents for caching.
+
+    Args:
+        docs: Documents returned by the driver
+        codec_options: Codec options of the collection they came from
+
+    Returns:
+        Encoded documents and their total size in bytes
+    """
+    options = _bson_options(codec_options)
+    encoded = [
+        (
+            doc.raw
+            if isinstance(doc, RawBSONDocument)
+            else bson.encode(doc, codec_options=options)
+        )
+        for doc in docs
+    ]
+    return encoded, sum(len(data) for data in encoded)
+
+
+def decode_docs(encoded: List[bytes], codec_options: Any) -> List[Any]:
+    """
+    Decode cached documents into fresh driver documents.
+
+    Args:
+        encoded: Encoded documents
+        codec_options: Codec options of the collection being read
+
+    Returns:
+        Documents, as the driver would have returned them
+    """
+    options = _bson_options(codec_options)
+    return [bson.decode(data, codec_options=options) for data in encoded]
@@ -0,0 +1,310 @@
+"""
+Client registry helpers: connection fingerprints and pool usage tracking.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from pymongo.monitoring import (
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionClosedEvent,
+    ConnectionCreatedEvent,
+    ConnectionPoolListener,
+)
+
+from ..config import DEFAULT_MAX_POOL_SIZE
+
+ConnectionKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+
+# Options (lowercased names) whose string values are case-insensitive;
+# every other value, such as credentials, replica set names and file paths,
+# is compared exactly
+CASE_INSENSITIVE_OPTIONS = frozenset(
+    {
+        "w",
+        "journal",
+        "readpreference",
+        "readconcernlevel",
+        "authmechanism",
+        "uuidrepresentation",
+        "retrywrites",
+        "retryreads",
+        "directconnection",
+        "loadbalanced",
+        "tls",
+        "ssl",
+        "tlsinsecure",
+        "tlsallowinvalidcertificates",
+        "tlsallowinvalidhostnames",
+        "tlsdisableocspendpointcheck",
+        "connect",
+    },
+)
+
+
+def _freeze(value: Any, name: Optional[str] = None) -> Any:
+    """Turn an option value into a hashable, comparable form."""
+    if isinstance(value, bool):
+        # Matches the "true"/"false" spelling of URI options
+        return str(value).lower()
+    if isinstance(value, (int, float)):
+        # URI options are strings; keyword options may not be
+        return str(value)
+    if isinstance(value, str):
+        return value.lower() if name in CASE_INSENSITIVE_OPTIONS else value
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if value is None:
+        return None
+    # Listeners, codec options and similar objects match by identity
+    return (type(value).__name__, id(value))
+
+
+def connection_key(uri: str, options: Dict[str, Any]) -> ConnectionKey:
+    """
+    Build the registry key of a client from its URI and options.
+
+    Options given in the URI query string and as keywords are merged
+    (keywords win, as in PyMongo) and option names are compared
+    case-insensitively, so equivalent configurations share a client. Values
+    are compared exactly, except booleans and the options listed in
+    ``CASE_INSENSITIVE_OPTIONS``.
+
+    Args:
+        uri: MongoDB connection URI
+        options: Client keyword options
+
+    Returns:
+        Hashable key
+    """
+    parts = urlsplit(uri)
+    merged = {name.lower(): value for name, value in parse_qsl(parts.query)}
+    merged.update((name.lower(), value) for name, value in options.items())
+    base = f"{parts.scheme}://{parts.netloc}{parts.path.rstrip('/')}"
+    return base, tuple(
+        sorted((name, _freeze(value, name)) for name, value in merged.items()),
+    )
+
+
+def redact_uri(uri: str) -> str:
+    """
+    Remove the password from a connection URI, for logs and stats.
+
+    Args:
+        uri: MongoDB connection URI
+
+    Returns:
+        URI without the password
+    """
+    parts = urlsplit(uri)
+    if parts.password is None:
+        return uri
+    netloc = parts.netloc.replace(f":{parts.password}@", ":***@", 1)
+    return parts._replace(netloc=netloc).geturl()
+
+
+class PoolUsage(ConnectionPoolListener):
+    """
+    Connection pool listener counting a client's open and checked-out sockets.
+
+    Counts cover every server the client is connected to.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self._lock = threading.Lock()
+        self.open_connections = 0
+        self.checked_out = 0
+
+    @property
+    def idle(self) -> bool:
+        """Whether no connection is checked out."""
+        return self.checked_out <= 0
+
+    def connection_created(self, event: ConnectionCreatedEvent) -> None:
+        """Count a new connection."""
+        with self._lock:
+            self.open_connections += 1
+
+    def connection_closed(self, event: ConnectionClosedEvent) -> None:
+        """Count a closed connection."""
+        with self._lock:
+            self.open_connections -= 1
+
+    def connection_checked_out(self, event: ConnectionCheckedOutEvent) -> None:
+        """Count a connection in use."""
+        with self._lock:
+            self.checked_out += 1
+
+    def connection_checked_in(self, event: ConnectionCheckedInEvent) -> None:
+        """Count a connection returned to the pool."""
+        with self._lock:
+            self.checked_out -= 1
+
+    # Events that do not change the counters
+    def pool_created(self, event: Any) -> None:
+        """Ignore pool creation."""
+
+    def pool_ready(self, event: Any) -> None:
+        """Ignore pool readiness."""
+
+    def pool_cleared(self, event: Any) -> None:
+        """Ignore pool clears."""
+
+    def pool_closed(self, event: Any) -> None:
+        """Ignore pool closes."""
+
+    def connection_ready(self, event: Any) -> None:
+        """Ignore connection readiness."""
+
+    def connection_check_out_started(self, event: Any) -> None:
+        """Ignore check-out attempts."""
+
+    def connection_check_out_failed(self, event: Any) -> None:
+        """Ignore failed check-outs."""
+
+
+def with_listeners(options: Dict[str, Any], *listeners: Any) -> Dict[str, Any]:
+    """
+    Add monitoring listeners to client options.
+
+    Args:
+        options: Client keyword options
+        *listeners: Listeners to add, such as a ``PoolUsage``
+
+    Returns:
+        Options with the listeners appended to ``event_listeners``
+    """
+    existing = list(options.get("event_listeners") or [])
+    return {**options, "event_listeners": [*existing, *listeners]}
+
+
+@dataclass(frozen=True)
+class ClientStats:
+    """
+    Pool usage of one registered client.
+
+    Attributes:
+        uri: Connection URI, without the password
+        max_pool_size: Maximum connections per server
+        open_connections: Connections currently open
+        checked_out: Connections currently in use
+        idle_seconds: Seconds since the connection was last requested
+    """
+
+    uri: str
+    max_pool_size: Optional[int]
+    open_connections: int
+    checked_out: int
+    idle_seconds: float
+
+
+def pick_evictions(
+    instances: Dict[ConnectionKey, Any],
+    max_clients: int,
+) -> List[Any]:
+    """
+    Choose registered connections to close so a new client fits the limit.
+
+    The least recently used connections with no checked-out sockets are
+    chosen; busy clients are never evicted, so the limit can be exceeded
+    while every client is in use.
+
+    Args:
+        instances: Registered connections by key
+        max_clients: Maximum number of live clients
+
+    Returns:
+        Connections to evict
+    """
+    excess = len(instances) + 1 - max(1, max_clients)
+    if excess <= 0:
+        return []
+    idle = sorted(
+        (conn for conn in instances.values() if conn._usage.idle),
+        key=lambda conn: conn._last_used,
+    )
+    return idle[:excess]
+
+
+@dataclass
+class WarmUpReport:
+    """
+    Outcome of ``warm_up()``; true when the connection is ready for traffic.
+
+    Attributes:
+        ready: Whether the server answered and every model was touched
+        ping_ms: Round trip of the first ping, including server selection,
+            the handshake and authentication (None if it failed)
+        connections: Pooled connections open after warming up
+        target_connections: Connections the warm-up tried to open
+        models: Models whose collections and indexes were touched
+        elapsed_ms: Total warm-up time
+        errors: What went wrong, if anything
+    """
+
+    ready: bool
+    ping_ms: Optional[float]
+    connections: int
+    target_connections: int
+    models: int
+    elapsed_ms: float
+    errors: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Whether the connection is ready."""
+        return self.ready
+
+
+def client_pool_size(client: Any) -> int:
+    """
+    Get the ``maxPoolSize`` of a client.
+
+    Args:
+        client: MongoDB client
+
+    Returns:
+        Maximum connections per server, or the default if the client does
+        not report a limit
+    """
+    pool_options = getattr(getattr(client, "options", None), "pool_options", None)
+    size = getattr(pool_options, "max_pool_size", None)
+    return size if isinstance(size, int) and size > 0 else DEFAULT_MAX_POOL_SIZE
+
+
+def warm_up_error(stage: str, error: BaseException) -> str:
+    """
+    Describe a warm-up failure for ``WarmUpReport.errors``.
+
+    Args:
+        stage: What failed ("ping", "connections" or a model name)
+        error: The exception raised
+
+    Returns:
+        ``"<stage>: <message>"``, with the exception type for errors without
+        a message (such as timeouts)
+    """
+    return f"{stage}: {str(error) or type(error).__name__}"
+
+
+def warm_up_target(min_connections: Optional[int], options: Dict[str, Any]) -> int:
+    """
+    Resolve how many pooled connections a warm-up should open.
+
+    Args:
+        min_connections: Requested count (None uses the ``minPoolSize`` option)
+        options: Client keyword options
+
+    Returns:
+        Connection count, at least 1 and at most ``maxPoolSize``
+    """
+    if min_connections is None:
+        min_connections = options.get("minPoolSize") or 1
+    max_pool_size = options.get("maxPoolSize") or min_connections
+    return max(1, min(min_connections, max_pool_size))
@@ -2,15 +2,44 @@
 Type conversion utilities for MongoDB ORM.
 """
 
+import copy
+import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
-
-from bson import ObjectId
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from bson import Decimal128, ObjectId
+from bson.raw_bson import RawBSONDocument
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticUndefined
+
+from ..exceptions import DocumentNotFoundError
+from .encoder import get_encoder
+from .records import get_record_converter
 
 # Type aliases
 Document = Dict[str, Any]
 Query = Dict[str, Any]
 T = TypeVar("T")
+C = TypeVar("C")  # Collection type
+
+# Result modes for read operations
+RESULT_MODES = ("model", "dict", "record", "bson")
+
+# Policies for ids that find_by_ids() does not find
+MISSING_ID_POLICIES = ("skip", "none", "raise")
 
 
 def resolve_collection_name(cls: Type[T]) -> str:
@@ -32,6 +61,37 @@ def resolve_collection_name(cls: Type[T]) -> str:
     return class_name
 
 
+def bson_type_alias(value: Any) -> Optional[str]:
+    """
+    Get the ``$type`` alias of the BSON type a value is stored as.
+
+    Numbers share the "number" alias, as MongoDB compares them with each
+    other.
+
+    Args:
+        value: Python value
+
+    Returns:
+        ``$type`` alias, or None for types without one here (including
+        None and lists)
+    """
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float, Decimal128)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, (bytes, uuid.UUID)):
+        return "binData"
+    if isinstance(value, ObjectId):
+        return "objectId"
+    if isinstance(value, datetime):
+        return "date"
+    return None
+
+
 def ensure_object_id(id_value: Union[str, ObjectId, None]) -> Optional[ObjectId]:
     """
     Convert string ID to ObjectId.
@@ -49,35 +109,259 @@ def ensure_object_id(id_value: Union[str, ObjectId, None]) -> Optional[ObjectId]
     return ObjectId(id_value)
 
 
-def process_query(query: Query) -> Query:
+def ensure_object_ids(id_values: Iterable[Union[str, ObjectId]]) -> List[ObjectId]:
+    """
+    Convert a sequence of string IDs to ObjectIds.
+
+    Args:
+        id_values: ID values as strings or ObjectIds
+
+    Returns:
+        List of ObjectIds, in input order
+    """
+    return [v if isinstance(v, ObjectId) else ObjectId(v) for v in id_values]
+
+
+def uses_native_id(model_class: Type[Any]) -> bool:
+    """
+    Check whether a model class stores ``id`` as its native ``_id`` value.
+
+    ORM models answer from their compiled ``__model_meta__`` record; other
+    classes are checked for a ``__native_id__`` attribute.
+
+    Args:
+        model_class: Model class
+
+    Returns:
+        The model's ``__native_id__`` setting
+    """
+    meta = model_class.__dict__.get("__model_meta__")
+    if meta is not None:
+        return meta.native_id
+    return bool(getattr(model_class, "__native_id__", False))
+
+
+def to_doc_id(id_value: Any, native_id: bool = False) -> Any:
+    """
+    Convert a model id to the document ``_id`` value.
+
+    Args:
+        id_value: Model id
+        native_id: Whether the model stores ids natively (used as-is)
+
+    Returns:
+        ``_id`` value
+    """
+    return id_value if native_id else ensure_object_id(id_value)
+
+
+def from_doc_id(value: Any, native_id: bool = False) -> Any:
+    """
+    Convert a document ``_id`` value to the model id.
+
+    Args:
+        value: ``_id`` value
+        native_id: Whether the model stores ids natively (used as-is)
+
+    Returns:
+        Model id
+    """
+    return value if native_id else str(value)
+
+
+def _process_id_value(value: Any) -> Any:
+    """Convert string IDs in an ``_id`` value, including $in/$nin lists."""
+    if isinstance(value, str):
+        return ensure_object_id(value)
+    if isinstance(value, dict):
+        processed = dict(value)
+        for op in ("$in", "$nin"):
+            if isinstance(processed.get(op), list):
+                processed[op] = [
+                    ensure_object_id(v) if isinstance(v, str) else v
+                    for v in processed[op]
+                ]
+        for op in ("$eq", "$ne"):
+            if isinstance(processed.get(op), str):
+                processed[op] = ensure_object_id(processed[op])
+        return processed
+    return value
+
+
+class ProcessedQuery(dict):
+    """A query that ``process_query`` has already converted."""
+
+
+def process_query(query: Query, native_id: bool = False) -> Query:
     """
     Process a query dict to convert string IDs to ObjectIds.
 
+    String IDs are converted when they are the ``_id``/``id`` value itself or
+    appear in an ``$in``, ``$nin``, ``$eq`` or ``$ne`` condition on it.
+
     Args:
         query: MongoDB query dictionary
+        native_id: Whether the model stores ids natively; only ``id`` is
+            renamed to ``_id`` and values are left alone
 
     Returns:
         Processed query with ObjectIds
     """
+    if isinstance(query, ProcessedQuery):
+        return query
+
+    if native_id:
+        if "id" not in query:
+            return query
+        processed_query = query.copy()
+        processed_query["_id"] = processed_query.pop("id")
+        return processed_query
+
     processed_query = query.copy()
 
     # Handle ObjectId conversion for _id
-    if "_id" in processed_query and isinstance(processed_query["_id"], str):
-        processed_query["_id"] = ensure_object_id(processed_query["_id"])
+    if "_id" in processed_query:
+        processed_query["_id"] = _process_id_value(processed_query["_id"])
     elif "id" in processed_query:
         id_value = processed_query.pop("id")
-        processed_query["_id"] = ensure_object_id(id_value)
+        processed_query["_id"] = _process_id_value(id_value)
 
     return processed_query
 
 
-def doc_to_model(doc: Document, model_class: Type[T]) -> T:
+def should_validate(model_class: Type[T], validate: Optional[bool] = None) -> bool:
+    """
+    Resolve whether documents loaded for a model class should be validated.
+
+    Args:
+        model_class: Model class
+        validate: Per-call override (None uses the model's ``__trusted_reads__``)
+
+    Returns:
+        True if documents should go through full validation
+    """
+    if validate is not None:
+        return validate
+    meta = model_class.__dict__.get("__model_meta__")
+    if meta is not None:
+        return not meta.trusted_reads
+    return not getattr(model_class, "__trusted_reads__", False)
+
+
+@lru_cache(maxsize=None)
+def _construct_plan(model_class: Type[T]) -> Optional[Tuple[Any, ...]]:
+    """
+    Precompute what ``construct_model`` needs to build instances of a class.
+
+    Returns None when the class defines its own ``model_post_init``, in which
+    case construction falls back to pydantic's ``model_construct``.
+    """
+    post_init = getattr(model_class, "model_post_init", None)
+    if getattr(model_class, "__pydantic_post_init__", None) and (
+        getattr(post_init, "__name__", "") != "init_private_attributes"
+    ):
+        return None
+
+    defaults: Dict[str, Any] = {}
+    factories: List[Tuple[str, Callable[[], Any]]] = []
+    for name, field in model_class.model_fields.items():
+        if field.default_factory is not None:
+            factories.append((name, field.default_factory))
+        elif field.default is not PydanticUndefined:
+            defaults[name] = field.default
+
+    private_defaults = {}
+    for name, attr in model_class.__private_attributes__.items():
+        default = attr.get_default()
+        if default is not PydanticUndefined:
+            private_defaults[name] = default
+    mutable_private = tuple(
+        name
+        for name, value in private_defaults.items()
+        if isinstance(value, (list, dict, set))
+    )
+
+    allows_extra = model_class.model_config.get("extra") == "allow"
+    fields = frozenset(model_class.model_fields)
+
+    return (
+        defaults,
+        tuple(factories),
+        private_defaults,
+        mutable_private,
+        fields,
+        allows_extra,
+    )
+
+
+def construct_model(model_class: Type[T], values: Document) -> T:
+    """
+    Build a model instance from trusted data without running validation.
+
+    Equivalent to pydantic's ``model_construct`` (field defaults are applied,
+    no coercion or validators run) but with the per-class work done once.
+
+    Args:
+        model_class: Pydantic model class
+        values: Field values keyed by field name
+
+    Returns:
+        Model instance
+    """
+    plan = _construct_plan(model_class)
+    if plan is None:
+        return model_class.model_construct(**values)
+    defaults, factories, private_defaults, mutable_private, fields, allows_extra = plan
+
+    data = dict(defaults)
+    for name, factory in factories:
+        if name not in values:
+            data[name] = factory()
+
+    extra = None
+    if values.keys() <= fields:
+        data.update(values)
+        fields_set = set(values)
+    else:
+        # Unknown keys are kept as extras or dropped, like model_construct
+        known = {k: v for k, v in values.items() if k in fields}
+        data.update(known)
+        fields_set = set(known)
+        if allows_extra:
+            extra = {k: v for k, v in values.items() if k not in fields}
+    if allows_extra and extra is None:
+        extra = {}
+
+    private = dict(private_defaults)
+    for name in mutable_private:
+        private[name] = copy.copy(private[name])
+
+    instance = model_class.__new__(model_class)
+    object.__setattr__(instance, "__dict__", data)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", extra)
+    object.__setattr__(instance, "__pydantic_private__", private)
+    return instance
+
+
+def doc_to_model(
+    doc: Document,
+    model_class: Type[T],
+    validate: Optional[bool] = None,
+) -> T:
     """
     Convert MongoDB document to model instance.
 
+    When validation is disabled the instance is built ``model_construct``-style
+    (see ``construct_model``): field defaults are applied but type coercion and
+    validators are skipped. Only use it for documents written by this ORM,
+    since nested models are left as plain dicts.
+
     Args:
         doc: MongoDB document
         model_class: Model class to instantiate
+        validate: Whether to validate the document (None uses the model's
+            ``__trusted_reads__`` setting)
 
     Returns:
         Model instance
@@ -86,9 +370,165 @@ def doc_to_model(doc: Document, model_class: Type[T]) -> T:
 
     # Convert _id to id
     if "_id" in doc_copy:
-        doc_copy["id"] = str(doc_copy.pop("_id"))
+        doc_copy["id"] = from_doc_id(doc_copy.pop("_id"), uses_native_id(model_class))
+
+    if not should_validate(model_class, validate):
+        instance = construct_model(model_class, doc_copy)
+    else:
+        instance = model_class(**doc_copy)
+
+    # Let models that track changes snapshot their persisted state
+    mark_loaded = getattr(instance, "_mark_loaded", None)
+    if mark_loaded is not None:
+        mark_loaded(doc_copy)
+    return instance
+
+
+def normalize_doc_id(doc: Document, native_id: bool = False) -> Document:
+    """
+    Replace an ObjectId ``_id`` with its string form under ``id``, in place.
+
+    Args:
+        doc: MongoDB document
+        native_id: Move any ``_id`` to ``id`` as it is
+
+    Returns:
+        The same document
+    """
+    if "_id" in doc and (native_id or isinstance(doc["_id"], ObjectId)):
+        doc["id"] = from_doc_id(doc.pop("_id"), native_id)
+    return doc
+
+
+def get_result_converter(
+    model_class: Type[T],
+    as_: str = "model",
+    validate: Optional[bool] = None,
+) -> Callable[[Any], Any]:
+    """
+    Get the function that turns raw cursor documents into results.
+
+    Args:
+        model_class: Model class
+        as_: Result mode: ``"model"`` for model instances, ``"dict"`` for plain
+            dicts with a normalized ``id``, ``"record"`` for read-only records
+            (see ``utils.records``), ``"bson"`` for undecoded
+            ``RawBSONDocument`` objects returned as-is
+        validate: Whether to validate documents in ``"model"`` mode
+
+    Returns:
+        Converter callable taking a single document
+    """
+    if as_ == "model":
+        validate = should_validate(model_class, validate)
+        return lambda doc: doc_to_model(doc, model_class, validate)
+    if as_ == "dict":
+        if uses_native_id(model_class):
+            return lambda doc: normalize_doc_id(doc, True)
+        return normalize_doc_id
+    if as_ == "record":
+        return get_record_converter(model_class)
+    if as_ == "bson":
+        return lambda doc: doc
+    raise ValueError(f"as_ must be one of {RESULT_MODES}. Got: {as_!r}")
+
+
+def collection_for_result(collection: C, as_: str = "model") -> C:
+    """
+    Get a collection handle that decodes documents for the given result mode.
+
+    In ``"bson"`` mode documents are returned as ``RawBSONDocument`` objects,
+    which are only decoded when their fields are accessed.
+
+    Args:
+        collection: PyMongo or Motor collection
+        as_: Result mode
+
+    Returns:
+        Collection instance
+    """
+    if as_ != "bson":
+        return collection
+    codec_options = collection.codec_options.with_options(
+        document_class=RawBSONDocument,
+    )
+    return cast(C, collection.with_options(codec_options=codec_options))
+
+
+def get_row_converter(
+    as_: str = "dict",
+    output_model: Optional[Type[T]] = None,
+    validate: Optional[bool] = None,
+) -> Callable[[Any], Any]:
+    """
+    Get the function that turns aggregation rows into results.
+
+    With an ``output_model`` each row's ``_id`` is moved to ``id`` (ObjectIds
+    become strings, other group keys are kept as they are) and the row is
+    built into the model in place, without the copy ``doc_to_model`` makes.
+    Unless validation is requested the model is built with
+    ``construct_model``, so only use it for rows whose shape the pipeline
+    guarantees.
+
+    Args:
+        as_: Result type without an output model: "dict" or "bson"
+        output_model: Pydantic model to build from each row
+        validate: Whether to validate rows (None uses the output model's
+            ``__trusted_reads__``, defaulting to no validation)
+
+    Returns:
+        Converter callable taking a single row
+    """
+    if as_ not in ("dict", "bson"):
+        raise ValueError(f"as_ must be 'dict' or 'bson' for aggregate. Got: {as_!r}")
+    if output_model is None:
+        return normalize_doc_id if as_ == "dict" else lambda doc: doc
+    if as_ != "dict":
+        raise ValueError("output_model can only be used with as_='dict'")
+
+    if validate is None:
+        validate = not getattr(output_model, "__trusted_reads__", True)
+
+    def convert(row: Document) -> T:
+        if "_id" in row:
+            value = row.pop("_id")
+            row["id"] = str(value) if isinstance(value, ObjectId) else value
+        if validate:
+            return output_model.model_validate(row)
+        return construct_model(output_model, row)
+
+    return convert
+
+
+def aggregate_options(
+    allow_disk_use: Optional[bool] = None,
+    batch_size: int = 0,
+    max_time_ms: Optional[int] = None,
+    hint: Optional[Union[str, List[tuple]]] = None,
+) -> Dict[str, Any]:
+    """
+    Build the driver options for an aggregation, leaving out unset ones.
 
-    return model_class(**doc_copy)
+    Args:
+        allow_disk_use: Let stages spill to temporary files past the memory limit
+        batch_size: Number of rows fetched per server round trip (0 uses the
+            server default)
+        max_time_ms: Server-side time limit in milliseconds
+        hint: Index name or specification to use
+
+    Returns:
+        Keyword arguments for ``Collection.aggregate``
+    """
+    options: Dict[str, Any] = {}
+    if allow_disk_use is not None:
+        options["allowDiskUse"] = allow_disk_use
+    if batch_size:
+        options["batchSize"] = batch_size
+    if max_time_ms is not None:
+        options["maxTimeMS"] = max_time_ms
+    if hint is not None:
+        options["hint"] = hint
+    return options
 
 
 def model_to_doc(model: Any, exclude_id: bool = False) -> Document:
@@ -102,28 +542,167 @@ def model_to_doc(model: Any, exclude_id: bool = False) -> Document:
     Returns:
         MongoDB document
     """
-    exclude = {"id"} if exclude_id else set()
-    doc: Document = model.model_dump(exclude=exclude)
+    doc: Document = get_encoder(type(model), ("id",))(model)
 
-    # Convert id to _id if present and not excluded
-    if not exclude_id and "id" in doc and doc["id"] is not None:
-        doc["_id"] = ensure_object_id(doc.pop("id"))
+    # Store a present id as the _id
+    id_value = getattr(model, "id", None)
+    if not exclude_id and id_value is not None:
+        doc["_id"] = to_doc_id(id_value, uses_native_id(type(model)))
 
     return doc
 
 
-def docs_to_models(docs: List[Document], model_class: Type[T]) -> List[T]:
+@lru_cache(maxsize=None)
+def get_list_adapter(model_class: Type[T]) -> Optional[TypeAdapter]:
+    """
+    Get the cached ``TypeAdapter(List[model_class])`` used to validate batches.
+
+    Returns None for classes that are not plain pydantic models (or that
+    override ``__init__``), which are validated one document at a time.
+
+    Args:
+        model_class: Model class
+
+    Returns:
+        List adapter, or None
+    """
+    if not (isinstance(model_class, type) and issubclass(model_class, BaseModel)):
+        return None
+    if model_class.__init__ is not BaseModel.__init__:
+        return None
+    return TypeAdapter(List[model_class])  # type: ignore[valid-type]
+
+
+def docs_to_models(
+    docs: List[Document],
+    model_class: Type[T],
+    validate: Optional[bool] = None,
+) -> List[T]:
     """
     Convert a list of MongoDB documents to model instances.
 
+    Unlike ``doc_to_model`` the documents are not copied: each ``_id`` is
+    moved to ``id`` in place, then the whole list is validated in one call
+    to a cached ``TypeAdapter(List[model_class])``, so the per-document
+    loop runs inside pydantic-core.
+
     Args:
-        docs: List of MongoDB documents
+        docs: List of MongoDB documents (modified in place)
         model_class: Model class to instantiate
+        validate: Whether to validate the documents (None uses the model's
+            ``__trusted_reads__`` setting)
 
     Returns:
         List of model instances
     """
-    return [doc_to_model(doc, model_class) for doc in docs]
+    native_id = uses_native_id(model_class)
+    for doc in docs:
+        if "_id" in doc:
+            doc["id"] = doc.pop("_id") if native_id else str(doc.pop("_id"))
+
+    if not should_validate(model_class, validate):
+        models = [construct_model(model_class, doc) for doc in docs]
+    else:
+        adapter = get_list_adapter(model_class)
+        if adapter is not None:
+            models = adapter.validate_python(docs)
+        else:
+            models = [model_class(**doc) for doc in docs]
+
+    # Let models that track changes snapshot their persisted state
+    if models and hasattr(models[0], "_mark_loaded"):
+        for model, doc in zip(models, docs):
+            model._mark_loaded(doc)  # type: ignore[attr-defined]
+    return models
+
+
+def get_batch_converter(
+    model_class: Type[T],
+    as_: str = "model",
+    validate: Optional[bool] = None,
+) -> Callable[[List[Any]], List[Any]]:
+    """
+    Get the function that turns a list of raw cursor documents into results.
+
+    The batch counterpart of ``get_result_converter``: in ``"model"`` mode
+    the list goes through ``docs_to_models``.
+
+    Args:
+        model_class: Model class
+        as_: Result mode: "model", "dict", "record" or "bson"
+        validate: Whether to validate documents in ``"model"`` mode
+
+    Returns:
+        Converter callable taking a list of documents
+    """
+    if as_ == "model":
+        validate = should_validate(model_class, validate)
+        return lambda docs: docs_to_models(docs, model_class, validate)
+    if as_ == "dict":
+        native_id = uses_native_id(model_class)
+        return lambda docs: [normalize_doc_id(doc, native_id) for doc in docs]
+    if as_ == "record":
+        convert = get_record_converter(model_class)
+        return lambda docs: [convert(doc) for doc in docs]
+    if as_ == "bson":
+        return list
+    raise ValueError(f"as_ must be one of {RESULT_MODES}. Got: {as_!r}")
+
+
+def check_missing_policy(missing: str, preserve_order: bool) -> None:
+    """
+    Validate the ``missing`` and ``preserve_order`` arguments of an id lookup.
+
+    Args:
+        missing: Policy for ids that are not found
+        preserve_order: Whether results follow the order of the ids
+
+    Raises:
+        ValueError: If the policy is unknown or needs ``preserve_order``
+    """
+    if missing not in MISSING_ID_POLICIES:
+        raise ValueError(
+            f"Unsupported missing policy '{missing}', "
+            f"expected one of {MISSING_ID_POLICIES}",
+        )
+    if missing == "none" and not preserve_order:
+        raise ValueError("missing='none' requires preserve_order=True")
+
+
+def order_by_ids(
+    ids: List[ObjectId],
+    found: Dict[ObjectId, T],
+    preserve_order: bool = True,
+    missing: str = "skip",
+    collection_name: str = "",
+) -> List[Optional[T]]:
+    """
+    Arrange documents fetched by id according to the requested ids.
+
+    Args:
+        ids: Requested ids, in input order
+        found: Fetched results keyed by ``_id``
+        preserve_order: Return results in the order of ``ids`` (duplicates
+            included) instead of the order they were fetched
+        missing: What to do with ids that were not found: "skip" leaves
+            them out, "none" puts None in their place, "raise" raises
+            DocumentNotFoundError
+        collection_name: Collection name, for error messages
+
+    Returns:
+        Results
+    """
+    check_missing_policy(missing, preserve_order)
+
+    if missing == "raise" and len(found) < len(set(ids)):
+        missing_ids = [id_value for id_value in ids if id_value not in found]
+        raise DocumentNotFoundError(collection_name, {"_id": {"$in": missing_ids}})
+
+    if not preserve_order:
+        return list(found.values())
+    if missing == "none":
+        return [found.get(id_value) for id_value in ids]
+    return [found[id_value] for id_value in ids if id_value in found]
 
 
 def format_timestamp(dt: Optional[datetime] = None) -> str:
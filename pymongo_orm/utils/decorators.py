@@ -5,7 +5,9 @@ Decorator utilities for MongoDB ORM.
 import logging
 import time
 from functools import wraps
-from typing import Any, Callable, TypeVar, cast
+from typing import Any, Callable, Tuple, TypeVar, cast
+
+from .metrics import operation_metrics
 
 # Setup logger
 logger = logging.getLogger("pymongo_orm.decorators")
@@ -18,6 +20,9 @@ def timing_decorator(func: F) -> F:
     """
     Decorator to measure and log function execution time.
 
+    Nothing is measured unless DEBUG logging is enabled. The implementations
+    use ``instrumented`` instead.
+
     Args:
         func: The function to be timed
 
@@ -27,9 +32,11 @@ def timing_decorator(func: F) -> F:
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        start_time = time.time()
+        if not logger.isEnabledFor(logging.DEBUG):
+            return func(*args, **kwargs)
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        end_time = time.perf_counter()
         logger.debug(f"{func.__name__} took {end_time - start_time:.4f}s to execute")
         return result
 
@@ -40,6 +47,9 @@ def async_timing_decorator(func: AsyncF) -> AsyncF:
     """
     Decorator to measure and log async function execution time.
 
+    Nothing is measured unless DEBUG logging is enabled. The implementations
+    use ``async_instrumented`` instead.
+
     Args:
         func: The async function to be timed
 
@@ -49,15 +59,92 @@ def async_timing_decorator(func: AsyncF) -> AsyncF:
 
     @wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
-        start_time = time.time()
+        if not logger.isEnabledFor(logging.DEBUG):
+            return await func(*args, **kwargs)
+        start_time = time.perf_counter()
         result = await func(*args, **kwargs)
-        end_time = time.time()
+        end_time = time.perf_counter()
         logger.debug(f"{func.__name__} took {end_time - start_time:.4f}s to execute")
         return result
 
     return cast(AsyncF, wrapper)
 
 
+def _model_name(args: Tuple[Any, ...]) -> str:
+    """Get the model class name from an implementation method's arguments."""
+    # Implementation methods take (cls, model_class or model, ...)
+    if len(args) < 2:
+        return ""
+    target = args[1]
+    return target.__name__ if isinstance(target, type) else type(target).__name__
+
+
+def instrumented(func: F) -> F:
+    """
+    Decorator publishing implementation method timings to ``operation_metrics``.
+
+    Timings are keyed by model and method name and measured with
+    ``perf_counter_ns``. While nothing is subscribed, the call costs one
+    flag check.
+
+    Args:
+        func: Implementation method (below ``@classmethod``)
+
+    Returns:
+        The wrapped function
+    """
+    operation = func.__name__
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not operation_metrics.active:
+            return func(*args, **kwargs)
+        failed = True
+        start = time.perf_counter_ns()
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            duration_ns = time.perf_counter_ns() - start
+            operation_metrics.publish(_model_name(args), operation, duration_ns, failed)
+
+    return cast(F, wrapper)
+
+
+def async_instrumented(func: AsyncF) -> AsyncF:
+    """
+    Decorator publishing async method timings to ``operation_metrics``.
+
+    Timings are keyed by model and method name and measured with
+    ``perf_counter_ns``. While nothing is subscribed, the call costs one
+    flag check.
+
+    Args:
+        func: Async implementation method (below ``@classmethod``)
+
+    Returns:
+        The wrapped async function
+    """
+    operation = func.__name__
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not operation_metrics.active:
+            return await func(*args, **kwargs)
+        failed = True
+        start = time.perf_counter_ns()
+        try:
+            result = await func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            duration_ns = time.perf_counter_ns() - start
+            operation_metrics.publish(_model_name(args), operation, duration_ns, failed)
+
+    return cast(AsyncF, wrapper)
+
+
 def retry(
     max_attempts: int = 3,
     delay: float = 1.0,
@@ -0,0 +1,278 @@
+"""
+Compiled model-to-document encoders for MongoDB ORM.
+"""
+
+import datetime
+import decimal
+import types
+import uuid
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from bson import ObjectId
+from bson.decimal128 import Decimal128
+from bson.int64 import Int64
+from bson.regex import Regex
+from pydantic import BaseModel
+
+NoneType = type(None)
+
+# X | Y annotations (Python 3.10+)
+_UNION_TYPES = tuple(t for t in (Union, getattr(types, "UnionType", None)) if t)
+
+Encoder = Callable[[Any], Dict[str, Any]]
+
+# Field types whose values go into documents as they are
+_PLAIN_TYPES = frozenset(
+    {
+        str,
+        int,
+        float,
+        bool,
+        bytes,
+        NoneType,
+        datetime.datetime,
+        datetime.date,
+        decimal.Decimal,
+        uuid.UUID,
+        ObjectId,
+        Decimal128,
+        Int64,
+        Regex,
+    },
+)
+
+# Serializer annotations that change what model_dump() produces
+_SERIALIZER_METADATA = ("PlainSerializer", "WrapSerializer")
+_JSON_ONLY = ("json", "json-unless-none")
+
+
+def encode_value(value: Any) -> Any:
+    """
+    Encode a value of unknown type the way ``model_dump`` would.
+
+    Containers are copied so documents never share them with the model,
+    and nested models are encoded with their own compiled encoders.
+
+    Args:
+        value: Field value
+
+    Returns:
+        Document-ready value
+    """
+    cls = type(value)
+    if cls in _PLAIN_TYPES:
+        return value
+    # Exact dicts and lists first; scalar items skip the recursive call
+    if cls is dict:
+        return {
+            key: item if type(item) in _PLAIN_TYPES else encode_value(item)
+            for key, item in value.items()
+        }
+    if cls is list:
+        return [
+            item if type(item) in _PLAIN_TYPES else encode_value(item) for item in value
+        ]
+    if isinstance(value, BaseModel):
+        return get_encoder(cls)(value)
+    if isinstance(value, dict):
+        return {key: encode_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [encode_value(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(encode_value(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value)(encode_value(item) for item in value)
+    return value
+
+
+def _is_union(annotation: Any) -> bool:
+    """Check for ``Union[...]``, ``Optional[...]`` and ``X | Y`` annotations."""
+    return get_origin(annotation) in _UNION_TYPES or isinstance(
+        annotation,
+        _UNION_TYPES[1:],
+    )
+
+
+def _is_plain(annotation: Any) -> bool:
+    """Check whether values of a type can be copied into documents as-is."""
+    if annotation in _PLAIN_TYPES:
+        return True
+    if _is_union(annotation):
+        return all(_is_plain(arg) for arg in get_args(annotation))
+    if get_origin(annotation) is Literal:
+        return True
+    if get_origin(annotation) is Annotated:
+        # e.g. ObjectIdField: the value is kept unless a serializer changes it
+        base, *metadata = get_args(annotation)
+        return _is_plain(base) and not any(map(_serializes_python, metadata))
+    # model_dump() keeps enum members and str/int subclasses as they are
+    return isinstance(annotation, type) and issubclass(annotation, (str, int, Enum))
+
+
+def _model_converter(model_class: Type[BaseModel]) -> Callable[[Any], Any]:
+    """Build the converter for a nested model field."""
+
+    def convert(value: Any) -> Any:
+        # Unvalidated (constructed) models may hold plain dicts here
+        if isinstance(value, model_class):
+            return get_encoder(model_class)(value)
+        return encode_value(value)
+
+    return convert
+
+
+def _optional_converter(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wrap a converter so None passes through."""
+    return lambda value: None if value is None else convert(value)
+
+
+def _field_converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Pick the cheapest converter for a field type.
+
+    Returns:
+        Converter, or None if values can be used as they are
+    """
+    if _is_plain(annotation):
+        return None
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if _is_union(annotation):
+        # Optional[X] where X has a specific converter
+        others = [arg for arg in args if arg is not NoneType]
+        if len(others) == 1 and len(args) == 2:
+            convert = _field_converter(others[0])
+            return None if convert is None else _optional_converter(convert)
+        return encode_value
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _model_converter(annotation)
+
+    if origin is list and args and _is_plain(args[0]):
+        return lambda value: list(value) if type(value) is list else encode_value(value)
+    if origin is dict and len(args) == 2 and _is_plain(args[1]):
+        return lambda value: dict(value) if type(value) is dict else encode_value(value)
+
+    return encode_value
+
+
+def _serializes_python(metadata: Any) -> bool:
+    """Check for a serializer annotation that applies outside JSON output."""
+    if type(metadata).__name__ not in _SERIALIZER_METADATA:
+        return False
+    return getattr(metadata, "when_used", "always") not in _JSON_ONLY
+
+
+def _needs_model_dump(model_class: Type[BaseModel]) -> bool:
+    """Check for serialization customizations a compiled encoder would skip."""
+    decorators = model_class.__pydantic_decorators__
+    if decorators.field_serializers or decorators.model_serializers:
+        return True
+    if model_class.model_computed_fields:
+        return True
+    if model_class.model_dump is not BaseModel.model_dump:
+        return True
+    for field in model_class.model_fields.values():
+        if field.exclude:
+            return True
+        if any(_serializes_python(item) for item in field.metadata):
+            return True
+    return False
+
+
+@lru_cache(maxsize=None)
+def get_encoder(
+    model_class: Type[BaseModel],
+    exclude: Tuple[str, ...] = (),
+) -> Encoder:
+    """
+    Get the compiled encoder of a model class.
+
+    The encoder produces what ``model.model_dump(exclude=...)`` would, but
+    is generated once per class from the field types: fields of scalar
+    types are copied straight from the instance, lists and dicts of scalars
+    are shallow-copied and only fields of other types are converted.
+    Classes with custom serializers, computed fields or excluded fields,
+    and other classes with a ``model_dump`` method, use ``model_dump``.
+
+    Args:
+        model_class: Pydantic model class
+        exclude: Field names to leave out
+
+    Returns:
+        Function turning an instance into a document
+    """
+    if not issubclass(model_class, BaseModel) or _needs_model_dump(model_class):
+        excluded = set(exclude)
+        return lambda model: model.model_dump(exclude=excluded)
+
+    fields: List[Tuple[str, Optional[Callable[[Any], Any]]]] = [
+        (name, _field_converter(field.annotation))
+        for name, field in model_class.model_fields.items()
+        if name not in exclude
+    ]
+    allows_extra = model_class.model_config.get("extra") == "allow"
+
+    def encode_partial(model: Any) -> Dict[str, Any]:
+        # Constructed models may lack fields; model_dump() leaves them out
+        d = model.__dict__
+        doc = {
+            name: d[name] if convert is None else convert(d[name])
+            for name, convert in fields
+            if name in d
+        }
+        if allows_extra and model.__pydantic_extra__:
+            doc.update(encode_value(model.__pydantic_extra__))
+        return doc
+
+    # The generated function builds the document in one dict display, in
+    # model_dump() field order, with no per-field calls for scalar fields
+    namespace: Dict[str, Any] = {
+        "encode_value": encode_value,
+        "encode_partial": encode_partial,
+    }
+    items = []
+    for index, (name, convert) in enumerate(fields):
+        if convert is None:
+            items.append(f"{name!r}: d[{name!r}]")
+        else:
+            namespace[f"convert_{index}"] = convert
+            items.append(f"{name!r}: convert_{index}(d[{name!r}])")
+
+    lines = [
+        "def encode(model):",
+        "    d = model.__dict__",
+        "    try:",
+        f"        doc = {{{', '.join(items)}}}",
+        "    except KeyError:",
+        "        return encode_partial(model)",
+    ]
+    if allows_extra:
+        lines += [
+            "    extra = model.__pydantic_extra__",
+            "    if extra:",
+            "        doc.update(encode_value(extra))",
+        ]
+    lines.append("    return doc")
+
+    exec("\n".join(lines), namespace)  # noqa: S102
+    encode: Encoder = namespace["encode"]
+    encode.__qualname__ = f"encode_{model_class.__name__}"
+    return encode
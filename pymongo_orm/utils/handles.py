@@ -0,0 +1,121 @@
+"""
+Cached, per-model collection handles for MongoDB ORM.
+"""
+
+from typing import Any, Dict, Tuple, Type
+
+from pymongo import ReadPreference
+from pymongo.read_concern import ReadConcern
+from pymongo.write_concern import WriteConcern
+
+from ..config import DEFAULT_COLLECTION_CACHE_SIZE
+from .converters import resolve_collection_name
+
+# Read preference names, as used in connection strings
+READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primarypreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondarypreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST,
+}
+
+# Handles keyed by (client id, database name, model class). Each entry keeps
+# its database alive, so the client id cannot be reused while it is cached.
+_handles: Dict[Tuple[int, str, type], Tuple[Any, Any]] = {}
+
+
+def collection_options(model_class: Type[Any]) -> Dict[str, Any]:
+    """
+    Build the ``with_options`` arguments for a model's collection settings.
+
+    ``__read_preference__`` is a read preference name ("secondaryPreferred",
+    "secondary_preferred", ...) or a pymongo read preference,
+    ``__write_concern__`` a dict of ``WriteConcern`` options or a
+    ``WriteConcern`` and ``__read_concern__`` a read concern level or a
+    ``ReadConcern``. Settings left as None inherit the database's.
+
+    Args:
+        model_class: Model class
+
+    Returns:
+        Keyword arguments for ``Collection.with_options``
+    """
+    options: Dict[str, Any] = {}
+
+    read_preference = getattr(model_class, "__read_preference__", None)
+    if isinstance(read_preference, str):
+        name = read_preference.replace("_", "").lower()
+        if name not in READ_PREFERENCES:
+            raise ValueError(
+                f"Unknown __read_preference__ for {model_class.__name__}: "
+                f"{read_preference!r}",
+            )
+        read_preference = READ_PREFERENCES[name]
+    if read_preference is not None:
+        options["read_preference"] = read_preference
+
+    write_concern = getattr(model_class, "__write_concern__", None)
+    if isinstance(write_concern, dict):
+        write_concern = WriteConcern(**write_concern)
+    if write_concern is not None:
+        options["write_concern"] = write_concern
+
+    read_concern = getattr(model_class, "__read_concern__", None)
+    if isinstance(read_concern, str):
+        read_concern = ReadConcern(read_concern)
+    if read_concern is not None:
+        options["read_concern"] = read_concern
+
+    return options
+
+
+def _same_database(cached: Any, db: Any) -> bool:
+    """Check whether a cached handle's database is equivalent to ``db``."""
+    if cached is db:
+        return True
+    return cached.client is db.client and (
+        cached.codec_options,
+        cached.read_preference,
+        cached.write_concern,
+        cached.read_concern,
+    ) == (db.codec_options, db.read_preference, db.write_concern, db.read_concern)
+
+
+def get_model_collection(model_class: Type[Any], db: Any) -> Any:
+    """
+    Get the collection for a model, with the model's settings applied.
+
+    The handle is built once per (database, model class) and reused, so
+    repeated calls skip resolving the collection name and creating a new
+    collection object. Settings are read when the handle is first built;
+    call ``clear_collection_handles`` after changing them at runtime.
+
+    Args:
+        model_class: Model class
+        db: Database instance
+
+    Returns:
+        Collection instance
+    """
+    key = (id(db.client), db.name, model_class)
+    entry = _handles.get(key)
+    if entry is not None and _same_database(entry[0], db):
+        return entry[1]
+
+    # An invalid __collection__ leaves no compiled name; resolving it raises
+    name = model_class.__model_meta__.collection_name
+    collection = db[name or resolve_collection_name(model_class)]
+    options = collection_options(model_class)
+    if options:
+        collection = collection.with_options(**options)
+
+    if len(_handles) >= DEFAULT_COLLECTION_CACHE_SIZE:
+        _handles.clear()
+    _handles[key] = (db, collection)
+    return collection
+
+
+def clear_collection_handles() -> None:
+    """Drop every cached collection handle."""
+    _handles.clear()
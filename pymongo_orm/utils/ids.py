@@ -0,0 +1,41 @@
+"""
+Id field types for models that store ``id`` natively.
+"""
+
+from typing import Any
+
+from bson import ObjectId
+from pydantic import PlainSerializer, PlainValidator, WithJsonSchema
+from typing_extensions import Annotated
+
+
+def validate_object_id(value: Any) -> ObjectId:
+    """
+    Accept an ObjectId or its 24-character hex string form.
+
+    Args:
+        value: Input value
+
+    Returns:
+        ObjectId instance
+
+    Raises:
+        ValueError: If the value is not a valid ObjectId
+    """
+    if isinstance(value, ObjectId):
+        return value
+    if isinstance(value, str) and ObjectId.is_valid(value):
+        return ObjectId(value)
+    raise ValueError(f"Invalid ObjectId: {value!r}")
+
+
+# An ObjectId kept as-is in Python and serialized as a string in JSON output.
+# Use it as the id type of models with __native_id__ = True:
+#
+#     id: Optional[ObjectIdField] = None
+ObjectIdField = Annotated[
+    ObjectId,
+    PlainValidator(validate_object_id),
+    PlainSerializer(str, return_type=str, when_used="json"),
+    WithJsonSchema({"type": "string", "pattern": "^[0-9a-f]{24}$"}),
+]
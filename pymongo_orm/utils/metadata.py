@@ -0,0 +1,122 @@
+"""
+Per-class model metadata, compiled once when a model class is created.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Type
+
+from pymongo import ASCENDING, IndexModel
+
+from .converters import doc_to_model, resolve_collection_name
+from .encoder import get_encoder
+
+
+@dataclass(frozen=True)
+class ModelMeta:
+    """
+    Everything the implementations need to know about a model class.
+
+    Attributes:
+        collection_name: Collection name, or None if ``__collection__`` is
+            invalid (``get_collection`` raises the error when it is used)
+        index_models: ``IndexModel`` objects built from ``__indexes__``
+        native_id: Whether ``id`` holds the ``_id`` value as it is stored
+            (``__native_id__``) instead of its string form
+        field_names: Names of the model fields
+        allows_extra: Whether the model keeps fields it does not declare
+        trusted_reads: The model's ``__trusted_reads__`` setting
+        encode: Compiled encoder turning a model into a document without
+            its ``_id``
+        decode: Turns a document into a model (``decode(doc, validate)``)
+    """
+
+    collection_name: Optional[str]
+    index_models: Tuple[IndexModel, ...]
+    native_id: bool
+    field_names: FrozenSet[str]
+    allows_extra: bool
+    trusted_reads: bool
+    encode: Callable[[Any], Dict[str, Any]]
+    decode: Callable[[Dict[str, Any], Optional[bool]], Any]
+
+
+def build_index_models(index_configs: List[Dict[str, Any]]) -> List[IndexModel]:
+    """
+    Turn ``__indexes__`` entries into ``IndexModel`` objects.
+
+    Args:
+        index_configs: Index configs with a ``fields`` list (field names or
+            ``(field, direction)`` tuples) and ``create_index`` options
+
+    Returns:
+        Index models
+    """
+    index_models = []
+    for index_config in index_configs:
+        fields = index_config.get("fields", [])
+        kwargs = {k: v for k, v in index_config.items() if k != "fields"}
+
+        # Field names without a direction default to ascending
+        keys = [
+            field if isinstance(field, tuple) else (field, ASCENDING)
+            for field in fields
+        ]
+        index_models.append(IndexModel(keys, **kwargs))
+    return index_models
+
+
+def compile_model_meta(model_class: Type[Any]) -> ModelMeta:
+    """
+    Compile the metadata record of a model class.
+
+    Args:
+        model_class: Model class
+
+    Returns:
+        Metadata record
+    """
+    try:
+        collection_name: Optional[str] = resolve_collection_name(model_class)
+    except ValueError:
+        # Abstract bases have no collection of their own
+        collection_name = None
+
+    if model_class.__pydantic_complete__:
+        encode = get_encoder(model_class, ("id",))
+    else:
+        # Forward references are not resolved yet; compile on first use
+        def encode(model: Any) -> Dict[str, Any]:
+            return get_encoder(model_class, ("id",))(model)
+
+    def decode(doc: Dict[str, Any], validate: Optional[bool] = None) -> Any:
+        return doc_to_model(doc, model_class, validate)
+
+    return ModelMeta(
+        collection_name=collection_name,
+        index_models=tuple(
+            build_index_models(getattr(model_class, "__indexes__", [])),
+        ),
+        native_id=bool(getattr(model_class, "__native_id__", False)),
+        field_names=frozenset(model_class.model_fields),
+        allows_extra=model_class.model_config.get("extra") == "allow",
+        trusted_reads=bool(getattr(model_class, "__trusted_reads__", False)),
+        encode=encode,
+        decode=decode,
+    )
+
+
+def get_model_meta(model_class: Type[Any]) -> ModelMeta:
+    """
+    Get the metadata record of a model class, compiling it if needed.
+
+    Args:
+        model_class: Model class
+
+    Returns:
+        Metadata record
+    """
+    meta = model_class.__dict__.get("__model_meta__")
+    if meta is None:
+        meta = compile_model_meta(model_class)
+        model_class.__model_meta__ = meta
+    return meta
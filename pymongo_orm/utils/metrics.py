@@ -0,0 +1,599 @@
+"""
+In-process metrics.
+
+Connection metrics are collected through PyMongo monitoring listeners:
+enable them per connection with ``SyncMongoConnection(uri, metrics=True)``
+(or ``AsyncMongoConnection``) and read them with ``connection.stats()``.
+
+Operation metrics time the CRUD methods of the implementations by model and
+operation, and are published to the subscribers of ``operation_metrics``.
+"""
+
+import bisect
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pymongo.monitoring import (
+    CommandFailedEvent,
+    CommandListener,
+    CommandStartedEvent,
+    CommandSucceededEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent,
+    PoolClearedEvent,
+    ServerHeartbeatFailedEvent,
+    ServerHeartbeatListener,
+    ServerHeartbeatStartedEvent,
+    ServerHeartbeatSucceededEvent,
+)
+
+from .connections import PoolUsage
+from .logging import get_logger
+
+logger = get_logger("metrics")
+
+# Called with (model name, operation, duration in nanoseconds, failed)
+OperationListener = Callable[[str, str, int, bool], None]
+
+# Upper bounds, in milliseconds, of the latency histogram buckets; the last
+# bucket holds everything slower
+LATENCY_BUCKETS_MS = (
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+)
+
+# Collection reported for commands that do not target one (ping, hello, ...)
+NO_COLLECTION = "$cmd"
+
+# Commands whose argument is not a collection name
+_COLLECTION_ARGUMENT_COMMANDS = {"getMore": "collection"}
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """
+    Latency distribution of a set of operations.
+
+    Percentiles are estimated from the bucket bounds, capped at the
+    slowest observed value.
+
+    Attributes:
+        count: Operations measured
+        errors: Operations that failed (included in ``count``)
+        mean_ms: Mean latency
+        max_ms: Slowest latency
+        p50_ms: Estimated median latency
+        p95_ms: Estimated 95th percentile latency
+        p99_ms: Estimated 99th percentile latency
+        buckets: Operation counts by bucket upper bound (``inf`` last)
+    """
+
+    count: int
+    errors: int
+    mean_ms: float
+    max_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    buckets: Dict[float, int]
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram; not thread-safe on its own.
+    """
+
+    __slots__ = ("counts", "count", "errors", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, duration_ms: float, failed: bool = False) -> None:
+        """
+        Add one measurement.
+
+        Args:
+            duration_ms: Latency in milliseconds
+            failed: Whether the operation failed
+        """
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        if failed:
+            self.errors += 1
+
+    def _percentile(self, fraction: float) -> float:
+        """Estimate a percentile from the bucket bounds."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS_MS, self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def snapshot(self) -> HistogramSnapshot:
+        """
+        Get the current distribution.
+
+        Returns:
+            Histogram snapshot
+        """
+        bounds = (*LATENCY_BUCKETS_MS, float("inf"))
+        return HistogramSnapshot(
+            count=self.count,
+            errors=self.errors,
+            mean_ms=self.total_ms / self.count if self.count else 0.0,
+            max_ms=self.max_ms,
+            p50_ms=self._percentile(0.50),
+            p95_ms=self._percentile(0.95),
+            p99_ms=self._percentile(0.99),
+            buckets=dict(zip(bounds, self.counts)),
+        )
+
+
+@dataclass(frozen=True)
+class PoolSnapshot:
+    """
+    Connection pool metrics, summed over every server of the client.
+
+    Attributes:
+        max_pool_size: Maximum connections per server
+        open_connections: Connections currently open
+        checked_out: Connections currently in use
+        peak_checked_out: Most connections in use at once
+        saturation: ``checked_out / max_pool_size`` (None without a limit)
+        checkout_wait: Time spent waiting to check out a connection
+        checkout_failures: Failed check-outs by reason (e.g. ``timeout``)
+        clears: Times a pool was cleared after a network error
+    """
+
+    max_pool_size: Optional[int]
+    open_connections: int
+    checked_out: int
+    peak_checked_out: int
+    saturation: Optional[float]
+    checkout_wait: HistogramSnapshot
+    checkout_failures: Dict[str, int]
+    clears: int
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """
+    Point-in-time copy of a connection's metrics.
+
+    Attributes:
+        commands: Command latency by ``(collection, command name)``
+        command_errors: Failed commands by server error name
+        pool: Connection pool metrics
+        heartbeats: Server monitoring round trips (awaited streaming
+            heartbeats are excluded, as their duration is mostly waiting)
+        heartbeat_failures: Failed server heartbeats
+    """
+
+    commands: Dict[Tuple[str, str], HistogramSnapshot]
+    command_errors: Dict[str, int]
+    pool: PoolSnapshot
+    heartbeats: HistogramSnapshot
+    heartbeat_failures: int
+
+    def by_command(self) -> Dict[str, HistogramSnapshot]:
+        """
+        Get command latency summed over collections.
+
+        Returns:
+            Histogram snapshot by command name
+        """
+        totals: Dict[str, LatencyHistogram] = {}
+        for (_, command_name), snapshot in self.commands.items():
+            histogram = totals.setdefault(command_name, LatencyHistogram())
+            _merge(histogram, snapshot)
+        return {name: histogram.snapshot() for name, histogram in totals.items()}
+
+
+def _merge(histogram: LatencyHistogram, snapshot: HistogramSnapshot) -> None:
+    """Add a snapshot's measurements to a histogram."""
+    for index, bucket_count in enumerate(snapshot.buckets.values()):
+        histogram.counts[index] += bucket_count
+    histogram.count += snapshot.count
+    histogram.errors += snapshot.errors
+    histogram.total_ms += snapshot.mean_ms * snapshot.count
+    histogram.max_ms = max(histogram.max_ms, snapshot.max_ms)
+
+
+def _command_collection(event: CommandStartedEvent) -> str:
+    """Get the collection a command targets."""
+    argument = _COLLECTION_ARGUMENT_COMMANDS.get(event.command_name)
+    target = event.command.get(argument or event.command_name)
+    return target if isinstance(target, str) else NO_COLLECTION
+
+
+class MetricsRegistry:
+    """
+    Thread-safe metrics of one client, updated by its monitoring listeners.
+    """
+
+    def __init__(self, max_pool_size: Optional[int] = None) -> None:
+        """
+        Initialize empty metrics.
+
+        Args:
+            max_pool_size: Maximum connections per server, for saturation
+        """
+        self.max_pool_size = max_pool_size
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Tuple[Any, int], str] = {}
+        # Also the client's PoolUsage, so pool events are counted once
+        self.pool = PoolMetrics(self)
+        self._reset()
+
+    def _reset(self) -> None:
+        """Clear the latency histograms and counters."""
+        self._commands: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._command_errors: Dict[str, int] = {}
+        self._peak_checked_out = self.pool.checked_out
+        self._checkout_wait = LatencyHistogram()
+        self._checkout_failures: Dict[str, int] = {}
+        self._clears = 0
+        self._heartbeats = LatencyHistogram()
+        self._heartbeat_failures = 0
+
+    def listeners(self) -> List[Any]:
+        """
+        Build the monitoring listeners feeding this registry.
+
+        Returns:
+            Command, connection pool and server heartbeat listeners
+        """
+        return [CommandMetrics(self), self.pool, HeartbeatMetrics(self)]
+
+    def snapshot(self, reset: bool = False) -> MetricsSnapshot:
+        """
+        Copy the current metrics.
+
+        Args:
+            reset: Whether to clear the latency histograms and counters
+                afterwards (current pool usage is kept)
+
+        Returns:
+            Metrics snapshot
+        """
+        with self._lock:
+            max_pool_size = self.max_pool_size
+            checked_out = self.pool.checked_out
+            snapshot = MetricsSnapshot(
+                commands={
+                    key: histogram.snapshot()
+                    for key, histogram in self._commands.items()
+                },
+                command_errors=dict(self._command_errors),
+                pool=PoolSnapshot(
+                    max_pool_size=max_pool_size,
+                    open_connections=self.pool.open_connections,
+                    checked_out=checked_out,
+                    peak_checked_out=self._peak_checked_out,
+                    saturation=checked_out / max_pool_size if max_pool_size else None,
+                    checkout_wait=self._checkout_wait.snapshot(),
+                    checkout_failures=dict(self._checkout_failures),
+                    clears=self._clears,
+                ),
+                heartbeats=self._heartbeats.snapshot(),
+                heartbeat_failures=self._heartbeat_failures,
+            )
+            if reset:
+                self._reset()
+        return snapshot
+
+    def command_started(self, key: Tuple[Any, int], collection: str) -> None:
+        """Remember the collection of a running command."""
+        with self._lock:
+            self._in_flight[key] = collection
+
+    def command_finished(
+        self,
+        key: Tuple[Any, int],
+        command_name: str,
+        duration_micros: int,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record a finished command, with the error name if it failed."""
+        with self._lock:
+            collection = self._in_flight.pop(key, NO_COLLECTION)
+            histogram = self._commands.get((collection, command_name))
+            if histogram is None:
+                histogram = LatencyHistogram()
+                self._commands[(collection, command_name)] = histogram
+            histogram.record(duration_micros / 1000, failed=error is not None)
+            if error is not None:
+                self._command_errors[error] = self._command_errors.get(error, 0) + 1
+
+    def checked_out(self, checked_out: int, wait_ms: float) -> None:
+        """Record a check-out, the sockets now in use and the wait for it."""
+        with self._lock:
+            if checked_out > self._peak_checked_out:
+                self._peak_checked_out = checked_out
+            self._checkout_wait.record(wait_ms)
+
+    def checkout_failed(self, reason: str, wait_ms: float) -> None:
+        """Record a failed check-out."""
+        with self._lock:
+            self._checkout_failures[reason] = self._checkout_failures.get(reason, 0) + 1
+            self._checkout_wait.record(wait_ms, failed=True)
+
+    def pool_cleared(self) -> None:
+        """Record a pool clear."""
+        with self._lock:
+            self._clears += 1
+
+    def heartbeat(self, duration_ms: Optional[float], failed: bool) -> None:
+        """Record a heartbeat (``duration_ms`` None for awaited ones)."""
+        with self._lock:
+            if duration_ms is not None:
+                self._heartbeats.record(duration_ms, failed=failed)
+            if failed:
+                self._heartbeat_failures += 1
+
+
+def _error_name(failure: Any) -> str:
+    """Get the server error name of a failed command reply."""
+    if isinstance(failure, dict):
+        if failure.get("codeName"):
+            return str(failure["codeName"])
+        if "code" in failure:
+            return f"code {failure['code']}"
+    return "error"
+
+
+class CommandMetrics(CommandListener):
+    """Command listener recording latency by collection and command."""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        """
+        Initialize the listener.
+
+        Args:
+            registry: Metrics to update
+        """
+        self.registry = registry
+
+    def started(self, event: CommandStartedEvent) -> None:
+        """Remember which collection the command targets."""
+        self.registry.command_started(
+            (event.connection_id, event.request_id),
+            _command_collection(event),
+        )
+
+    def succeeded(self, event: CommandSucceededEvent) -> None:
+        """Record the command latency."""
+        self.registry.command_finished(
+            (event.connection_id, event.request_id),
+            event.command_name,
+            event.duration_micros,
+        )
+
+    def failed(self, event: CommandFailedEvent) -> None:
+        """Record the command latency and error."""
+        self.registry.command_finished(
+            (event.connection_id, event.request_id),
+            event.command_name,
+            event.duration_micros,
+            _error_name(event.failure),
+        )
+
+
+class PoolMetrics(PoolUsage):
+    """
+    Connection pool listener recording usage, check-out waits and failures.
+
+    Extends the client's ``PoolUsage`` counts, so a connection with metrics
+    registers this listener in place of its ``PoolUsage``.
+    """
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        """
+        Initialize the listener.
+
+        Args:
+            registry: Metrics to update
+        """
+        super().__init__()
+        self.registry = registry
+
+    def connection_checked_out(self, event: ConnectionCheckedOutEvent) -> None:
+        """Count a connection in use and record the check-out wait."""
+        with self._lock:
+            self.checked_out += 1
+            checked_out = self.checked_out
+        self.registry.checked_out(checked_out, event.duration * 1000)
+
+    def connection_check_out_failed(
+        self,
+        event: ConnectionCheckOutFailedEvent,
+    ) -> None:
+        """Record a failed check-out."""
+        self.registry.checkout_failed(str(event.reason), event.duration * 1000)
+
+    def pool_cleared(self, event: PoolClearedEvent) -> None:
+        """Count a pool clear."""
+        self.registry.pool_cleared()
+
+
+class HeartbeatMetrics(ServerHeartbeatListener):
+    """Server heartbeat listener recording monitoring round trips."""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        """
+        Initialize the listener.
+
+        Args:
+            registry: Metrics to update
+        """
+        self.registry = registry
+
+    def started(self, event: ServerHeartbeatStartedEvent) -> None:
+        """Ignore heartbeat starts."""
+
+    def succeeded(self, event: ServerHeartbeatSucceededEvent) -> None:
+        """Record the heartbeat round trip."""
+        duration_ms = None if event.awaited else event.duration * 1000
+        self.registry.heartbeat(duration_ms, failed=False)
+
+    def failed(self, event: ServerHeartbeatFailedEvent) -> None:
+        """Count a failed heartbeat."""
+        duration_ms = None if event.awaited else event.duration * 1000
+        self.registry.heartbeat(duration_ms, failed=True)
+
+
+class OperationMetrics:
+    """
+    Subscribers to the timings of model operations, with optional histograms.
+
+    The instrumented methods only read ``active`` while nothing is
+    subscribed, so unused metrics cost a single attribute check per call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no subscribers."""
+        self.active = False
+        self._lock = threading.Lock()
+        self._listeners: Tuple[OperationListener, ...] = ()
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+
+    def subscribe(self, listener: OperationListener) -> None:
+        """
+        Start publishing operation timings to a listener.
+
+        Args:
+            listener: Callable taking the model name, the operation, the
+                duration in nanoseconds and whether the operation failed
+        """
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners = (*self._listeners, listener)
+            self.active = True
+
+    def unsubscribe(self, listener: OperationListener) -> None:
+        """
+        Stop publishing operation timings to a listener.
+
+        Args:
+            listener: Listener passed to ``subscribe()``
+        """
+        with self._lock:
+            self._listeners = tuple(
+                subscribed for subscribed in self._listeners if subscribed != listener
+            )
+            self.active = bool(self._listeners)
+
+    def enable(self) -> None:
+        """Record operation timings in histograms, read with ``snapshot()``."""
+        self.subscribe(self._record)
+
+    def disable(self) -> None:
+        """Stop recording histograms (recorded timings are kept)."""
+        self.unsubscribe(self._record)
+
+    def publish(
+        self,
+        model_name: str,
+        operation: str,
+        duration_ns: int,
+        failed: bool,
+    ) -> None:
+        """
+        Send an operation timing to every listener.
+
+        Listener errors are logged, never raised into the operation.
+
+        Args:
+            model_name: Model class name
+            operation: Implementation method name
+            duration_ns: Duration in nanoseconds
+            failed: Whether the operation raised
+        """
+        for listener in self._listeners:
+            try:
+                listener(model_name, operation, duration_ns, failed)
+            except Exception:  # noqa: BLE001
+                logger.exception(f"Operation metrics listener {listener!r} failed")
+
+    def _record(
+        self,
+        model_name: str,
+        operation: str,
+        duration_ns: int,
+        failed: bool,
+    ) -> None:
+        """Add an operation timing to its histogram."""
+        key = (model_name, operation)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(duration_ns / 1_000_000, failed=failed)
+
+    def snapshot(self, reset: bool = False) -> Dict[Tuple[str, str], HistogramSnapshot]:
+        """
+        Get the recorded operation latencies.
+
+        Args:
+            reset: Whether to clear the histograms afterwards
+
+        Returns:
+            Histogram snapshot by ``(model name, operation)``
+        """
+        with self._lock:
+            snapshot = {
+                key: histogram.snapshot() for key, histogram in self._histograms.items()
+            }
+            if reset:
+                self._histograms = {}
+        return snapshot
+
+
+def log_operation(
+    model_name: str,
+    operation: str,
+    duration_ns: int,
+    failed: bool,
+) -> None:
+    """
+    Operation listener logging each timing at DEBUG level.
+
+    Args:
+        model_name: Model class name
+        operation: Implementation method name
+        duration_ns: Duration in nanoseconds
+        failed: Whether the operation raised
+    """
+    logger.debug(
+        f"{model_name}.{operation} took {duration_ns / 1_000_000:.3f}ms"
+        f"{' (failed)' if failed else ''}",
+    )
+
+
+# Shared by every instrumented implementation method
+operation_metrics = OperationMetrics()
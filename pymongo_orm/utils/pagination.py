@@ -0,0 +1,334 @@
+"""
+Keyset pagination utilities for MongoDB ORM.
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from bson import json_util
+from bson.json_util import CANONICAL_JSON_OPTIONS
+
+from .converters import bson_type_alias
+
+# Type aliases
+Document = Dict[str, Any]
+Query = Dict[str, Any]
+SortSpec = List[Tuple[str, int]]
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    A single page of results returned by ``paginate()``.
+
+    Attributes:
+        items: Models on this page
+        next_token: Opaque token for the next page, or None on the last page
+    """
+
+    items: List[T]
+    next_token: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        """Whether another page is available."""
+        return self.next_token is not None
+
+
+def normalize_sort(sort: Optional[SortSpec]) -> SortSpec:
+    """
+    Normalize a sort specification for keyset pagination.
+
+    ``id`` is mapped to ``_id`` and ``_id`` is appended as a tiebreaker
+    (in the direction of the last sort key) so every document has a unique
+    position in the ordering.
+
+    Args:
+        sort: Sort specification
+
+    Returns:
+        Sort specification ending with ``_id``
+    """
+    normalized: SortSpec = []
+    for field, direction in sort or []:
+        if direction not in (1, -1):
+            raise ValueError(f"Unsupported sort direction for '{field}': {direction}")
+        normalized.append(("_id" if field == "id" else field, direction))
+
+    if not any(field == "_id" for field, _ in normalized):
+        direction = normalized[-1][1] if normalized else 1
+        normalized.append(("_id", direction))
+
+    return normalized
+
+
+def get_sort_values(doc: Document, sort: SortSpec) -> List[Any]:
+    """
+    Extract the values of the sort keys from a raw document.
+
+    Args:
+        doc: MongoDB document
+        sort: Normalized sort specification
+
+    Returns:
+        Sort key values (dotted paths are resolved, missing values are None)
+    """
+    values = []
+    for field, _ in sort:
+        value: Any = doc
+        for part in field.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        values.append(value)
+    return values
+
+
+def encode_page_token(values: List[Any], sort: SortSpec) -> str:
+    """
+    Encode sort key values as an opaque, URL-safe continuation token.
+
+    The sort specification is stored with the values, so the token cannot
+    be replayed with a different sort.
+
+    Args:
+        values: Sort key values of the last document on a page
+        sort: Normalized sort specification of the page
+
+    Returns:
+        URL-safe token string
+    """
+    payload = json_util.dumps(
+        {"sort": [[field, direction] for field, direction in sort], "values": values},
+        json_options=CANONICAL_JSON_OPTIONS,
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_page_token(token: str) -> Tuple[SortSpec, List[Any]]:
+    """
+    Decode a continuation token produced by ``encode_page_token``.
+
+    Args:
+        token: Token string
+
+    Returns:
+        Sort specification and sort key values
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        data = json_util.loads(payload, json_options=CANONICAL_JSON_OPTIONS)
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid page token: {e}")
+
+    if (
+        not isinstance(data, dict)
+        or not isinstance(data.get("sort"), list)
+        or not isinstance(data.get("values"), list)
+    ):
+        raise ValueError("Invalid page token: expected a sort and its values")
+    try:
+        sort = [(str(field), int(direction)) for field, direction in data["sort"]]
+    except (TypeError, ValueError):
+        raise ValueError("Invalid page token: malformed sort specification")
+    return sort, data["values"]
+
+
+# BSON types in the order MongoDB sorts them, by ``$type`` alias. Null (and
+# missing fields) sort first and are matched with ``None`` instead. Arrays
+# sort by their elements, and timestamps and regular expressions are not
+# supported as sort keys.
+_TYPE_ORDER = (
+    "number",
+    "string",
+    "object",
+    "binData",
+    "objectId",
+    "bool",
+    "date",
+)
+
+
+def _type_rank(value: Any) -> int:
+    """Get the position of a sort value's type in ``_TYPE_ORDER``."""
+    alias = bson_type_alias(value)
+    if alias not in _TYPE_ORDER:
+        raise ValueError(
+            f"Unsupported sort value for keyset pagination: {type(value).__name__}",
+        )
+    return _TYPE_ORDER.index(alias)
+
+
+def _after_conditions(field: str, direction: int, value: Any) -> List[Query]:
+    """
+    Build the alternatives matching values of ``field`` after ``value``.
+
+    MongoDB compares ``$gt``/``$lt`` only against values of the same type,
+    so values of the types sorted after ``value``, including null, are
+    matched separately.
+    """
+    if isinstance(value, list):
+        raise ValueError(
+            f"Keyset pagination does not support array values in sort field "
+            f"'{field}'",
+        )
+
+    if value is None:
+        # Null sorts first: every non-null value comes after it ascending,
+        # and nothing does descending
+        return [{field: {"$ne": None}}] if direction == 1 else []
+
+    rank = _type_rank(value)
+    if direction == 1:
+        conditions: List[Query] = [{field: {"$gt": value}}]
+        others = _TYPE_ORDER[rank + 1 :]
+    else:
+        conditions = [{field: {"$lt": value}}]
+        if field != "_id":  # _id is never null or missing
+            conditions.append({field: None})
+        others = _TYPE_ORDER[:rank]
+    # One branch per type, as not every backend accepts a list for $type
+    conditions.extend({field: {"$type": alias}} for alias in others)
+    return conditions
+
+
+def build_keyset_query(sort: SortSpec, values: List[Any]) -> Query:
+    """
+    Build a range predicate selecting documents after the given sort position.
+
+    For a sort on ``(a, 1), (b, -1), (_id, -1)`` with string values this
+    produces::
+
+        {"$or": [
+            {"$or": [
+                {"a": {"$gt": va}},
+                {"a": {"$type": "object"}},  # ...and every later type
+            ]},
+            {"a": va, "$or": [
+                {"b": {"$lt": vb}},
+                {"b": None},
+                {"b": {"$type": "number"}},  # every earlier type
+            ]},
+            {"a": va, "b": vb, "$or": [
+                {"_id": {"$lt": vid}},
+                {"_id": {"$type": "number"}},  # ...
+            ]},
+        ]}
+
+    Null and missing values sort before every other type, as in MongoDB,
+    and fields mixing types are ordered by BSON type first. Array values
+    are not supported.
+
+    Args:
+        sort: Normalized sort specification
+        values: Sort key values of the last document on the previous page
+
+    Returns:
+        MongoDB query
+
+    Raises:
+        ValueError: If the values do not match the sort or cannot be compared
+    """
+    if len(values) != len(sort):
+        raise ValueError(
+            f"Invalid page token: expected {len(sort)} sort values, got {len(values)}",
+        )
+
+    clauses = []
+    for i, (field, direction) in enumerate(sort):
+        conditions = _after_conditions(field, direction, values[i])
+        if not conditions:
+            continue
+        clause: Query = {sort[j][0]: values[j] for j in range(i)}
+        if len(conditions) == 1:
+            clause.update(conditions[0])
+        else:
+            clause["$or"] = conditions
+        clauses.append(clause)
+
+    if not clauses:
+        # Nothing sorts after this position
+        return {"_id": {"$exists": False}}
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+def _overlaps(path: str, field: str) -> bool:
+    """Check whether projecting ``path`` affects the value of ``field``."""
+    return path == field or field.startswith(f"{path}.") or path.startswith(f"{field}.")
+
+
+def include_sort_keys(
+    projection: Optional[Dict[str, Any]],
+    sort: SortSpec,
+) -> Optional[Dict[str, Any]]:
+    """
+    Make sure a projection returns the fields needed for the token.
+
+    Sort keys are added to inclusion projections, and exclusions of a sort
+    key (or of a field above or below it) are dropped, so excluded sort keys
+    are returned too.
+
+    Args:
+        projection: Fields to include/exclude
+        sort: Normalized sort specification
+
+    Returns:
+        Projection returning every sort key
+    """
+    if not projection:
+        return projection
+
+    is_inclusion = any(v for k, v in projection.items() if k != "_id")
+    if not is_inclusion:
+        projection = {
+            name: value
+            for name, value in projection.items()
+            if not any(_overlaps(name, field) for field, _ in sort)
+        }
+        return projection or None
+
+    projection = dict(projection)
+    for field, _ in sort:
+        parts = field.split(".")
+        prefixes = {".".join(parts[: i + 1]) for i in range(len(parts))}
+        if not any(projection.get(prefix) for prefix in prefixes):
+            projection[field] = 1
+    return projection
+
+
+def keyset_page_query(
+    query: Query,
+    sort: SortSpec,
+    token: Optional[str],
+) -> Query:
+    """
+    Combine a processed query with the range predicate encoded in ``token``.
+
+    Raises ``ValueError`` if the token is malformed or was issued for a
+    different sort.
+
+    Args:
+        query: Processed MongoDB query
+        sort: Normalized sort specification
+        token: Continuation token (None for the first page)
+
+    Returns:
+        MongoDB query for the requested page
+    """
+    if not token:
+        return query
+
+    token_sort, values = decode_page_token(token)
+    if token_sort != list(sort):
+        raise ValueError(
+            f"Invalid page token: it was issued for sort {token_sort}, not {sort}",
+        )
+    range_query = build_keyset_query(sort, values)
+    if not query:
+        return range_query
+    return {"$and": [query, range_query]}
@@ -0,0 +1,227 @@
+"""
+Lazy, chainable query builder shared by the sync and async query sets.
+"""
+
+from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
+
+from pymongo import ASCENDING, DESCENDING
+from typing_extensions import Self
+
+from ..config import DEFAULT_BATCH_SIZE
+from .converters import ProcessedQuery, process_query
+
+# Type variables
+T = TypeVar("T")
+Query = Dict[str, Any]
+SortKey = Union[str, Tuple[str, int]]
+
+
+def merge_queries(base: Query, extra: Query) -> Query:
+    """
+    Combine two processed queries so documents must match both.
+
+    Queries on different fields are merged into one document; anything
+    that would overwrite a condition is combined with ``$and`` instead.
+
+    Args:
+        base: Processed MongoDB query
+        extra: Processed MongoDB query to add
+
+    Returns:
+        Combined query
+    """
+    if not base:
+        return dict(extra)
+    if not extra:
+        return dict(base)
+    if base.keys().isdisjoint(extra):
+        return {**base, **extra}
+    return {"$and": [base, extra]}
+
+
+def sort_spec(keys: Tuple[SortKey, ...]) -> List[Tuple[str, int]]:
+    """
+    Turn ``order_by`` arguments into a sort specification.
+
+    Args:
+        keys: Field names (prefixed with ``-`` for descending order) or
+            ``(field, direction)`` tuples
+
+    Returns:
+        Sort specification
+    """
+    sort = []
+    for key in keys:
+        if isinstance(key, tuple):
+            field, direction = key
+        elif key.startswith("-"):
+            field, direction = key[1:], DESCENDING
+        else:
+            field, direction = key.lstrip("+"), ASCENDING
+        sort.append(("_id" if field == "id" else field, direction))
+    return sort
+
+
+class BaseQuerySet(Generic[T]):
+    """
+    Immutable description of a query that runs only when it is consumed.
+
+    Every chaining method returns a new query set, so a partially built
+    query can be stored and reused. Subclasses provide the methods that
+    actually talk to the database.
+    """
+
+    def __init__(self, model_class: Type[T], db: Any) -> None:
+        """
+        Initialize a query set matching every document.
+
+        Args:
+            model_class: Model class
+            db: Database instance
+        """
+        self.model_class = model_class
+        self.db = db
+
+        self._query: Query = {}
+        self._projection: Optional[Dict[str, Any]] = None
+        self._sort: Optional[List[Tuple[str, int]]] = None
+        self._skip = 0
+        self._limit = 0
+        self._batch_size = DEFAULT_BATCH_SIZE
+        # Set when slicing leaves nothing to return (a limit of 0 means "all")
+        self._empty = False
+        self._processed: Optional[ProcessedQuery] = None
+
+    def __repr__(self) -> str:
+        """Describe the query without running it."""
+        return f"<{type(self).__name__} {self.model_class.__name__} {self._query}>"
+
+    @property
+    def query(self) -> ProcessedQuery:
+        """The processed MongoDB query, built once per query set."""
+        if self._processed is None:
+            self._processed = ProcessedQuery(self._query)
+        return self._processed
+
+    def filter(self, query: Optional[Query] = None, **fields: Any) -> Self:
+        """
+        Narrow the query set to documents matching extra conditions.
+
+        Args:
+            query: MongoDB query
+            **fields: Field equality conditions
+
+        Returns:
+            New query set
+        """
+        clone = self._clone()
+        native_id = self.model_class.__model_meta__.native_id
+        for extra in (query, fields):
+            if extra:
+                extra = process_query(extra, native_id)
+                clone._query = merge_queries(clone._query, extra)
+        return clone
+
+    def only(self, *fields: str) -> Self:
+        """
+        Load only the given fields (``id`` is always loaded).
+
+        Args:
+            *fields: Field names
+
+        Returns:
+            New query set
+        """
+        clone = self._clone()
+        clone._projection = {field: 1 for field in fields if field != "id"}
+        return clone
+
+    def order_by(self, *keys: SortKey) -> Self:
+        """
+        Sort the results.
+
+        Args:
+            *keys: Field names (prefixed with ``-`` for descending order) or
+                ``(field, direction)`` tuples
+
+        Returns:
+            New query set
+        """
+        clone = self._clone()
+        clone._sort = sort_spec(keys) or None
+        return clone
+
+    def skip(self, count: int) -> Self:
+        """
+        Skip the first results.
+
+        Args:
+            count: Number of documents to skip
+
+        Returns:
+            New query set
+        """
+        return self._slice(slice(count, None))
+
+    def limit(self, count: int) -> Self:
+        """
+        Return at most ``count`` results.
+
+        As in PyMongo, a limit of 0 means no limit: the query set is
+        returned unchanged. Use ``qs[:0]`` for an empty query set.
+
+        Args:
+            count: Maximum number of documents to return (0 for no limit)
+
+        Returns:
+            New query set
+        """
+        if count == 0:
+            return self._clone()
+        return self._slice(slice(None, count))
+
+    def batch_size(self, count: int) -> Self:
+        """
+        Set how many documents iteration fetches per server round trip.
+
+        Args:
+            count: Batch size
+
+        Returns:
+            New query set
+        """
+        clone = self._clone()
+        clone._batch_size = count
+        return clone
+
+    def _clone(self) -> Self:
+        """Copy the query set; the processed query is rebuilt on demand."""
+        clone = type(self).__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone._processed = None
+        return clone
+
+    def _slice(self, window: slice) -> Self:
+        """Apply a slice on top of the current skip and limit."""
+        if window.step not in (None, 1):
+            raise ValueError("Query set slices do not support steps")
+        start = window.start or 0
+        stop = window.stop
+        if start < 0 or (stop is not None and stop < 0):
+            raise ValueError("Query set slices do not support negative indexes")
+
+        if self._limit:
+            stop = self._limit if stop is None else min(stop, self._limit)
+
+        clone = self._clone()
+        clone._skip = self._skip + start
+        clone._limit = 0 if stop is None else max(stop - start, 0)
+        clone._empty = self._empty or (stop is not None and stop <= start)
+        return clone
+
+    def _count_window(self, total: int) -> int:
+        """Apply the skip and limit to the number of matching documents."""
+        if self._empty:
+            return 0
+        count = max(total - self._skip, 0)
+        return min(count, self._limit) if self._limit else count
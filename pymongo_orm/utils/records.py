@@ -0,0 +1,165 @@
+"""
+Lightweight read-only records for hot read paths.
+
+A record holds a document's field values in a tuple subclass with one
+attribute per model field, without pydantic's per-instance state. Use
+``find(..., as_="record")`` to load them and ``to_model()`` to get the full
+model for a record that needs to be modified.
+"""
+
+import copy
+import datetime
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Optional, Type
+from uuid import UUID
+
+from bson import ObjectId
+from pydantic_core import PydanticUndefined
+
+# Default values of these types can be shared by every record
+_IMMUTABLE_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    Decimal,
+    Enum,
+    UUID,
+    ObjectId,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+)
+
+
+class Record:
+    """
+    Methods shared by the generated record classes.
+
+    Record classes are named tuples of the model fields, in model field
+    order, with ``id`` holding the document ``_id`` (as a string unless the
+    model uses ``__native_id__``). Fields missing from the document hold
+    their default, or None if they have none.
+    """
+
+    __slots__ = ()
+
+    model_class: Type[Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the record's values keyed by field name.
+
+        Returns:
+            Field values
+        """
+        return dict(zip(self._fields, self))  # type: ignore[attr-defined]
+
+    def to_model(self, validate: Optional[bool] = None) -> Any:
+        """
+        Build the full model instance, ready to be modified and saved.
+
+        Args:
+            validate: Whether to validate the values (None uses the model's
+                ``__trusted_reads__`` setting)
+
+        Returns:
+            Model instance
+        """
+        return self.model_class.__model_meta__.decode(self.to_dict(), validate)
+
+
+@lru_cache(maxsize=None)
+def get_record_class(model_class: Type[Any]) -> Type[Record]:
+    """
+    Get the record class generated for a model class.
+
+    Args:
+        model_class: Model class
+
+    Returns:
+        Record class named ``<Model>Record``
+    """
+    name = f"{model_class.__name__}Record"
+    fields = [(field, Any) for field in model_class.model_fields]
+    base = NamedTuple(name, fields)  # type: ignore[misc]
+    return type(  # type: ignore[return-value]
+        name,
+        (base, Record),
+        {
+            "__slots__": (),
+            "__module__": model_class.__module__,
+            "model_class": model_class,
+        },
+    )
+
+
+def _is_immutable(value: Any) -> bool:
+    """Check whether a default value is safe to share between records."""
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_immutable(item) for item in value)
+    return isinstance(value, _IMMUTABLE_TYPES)
+
+
+def _str_id(value: Any) -> Any:
+    """Convert an ``_id`` to the string form used for ``id``."""
+    return None if value is None else str(value)
+
+
+@lru_cache(maxsize=None)
+def get_record_converter(model_class: Type[Any]) -> Callable[[Any], Record]:
+    """
+    Get the compiled function that turns a raw document into a record.
+
+    Args:
+        model_class: Model class
+
+    Returns:
+        Converter callable taking a single document
+    """
+    record_class = get_record_class(model_class)
+    native_id = model_class.__model_meta__.native_id
+
+    # The generated function builds the tuple in one expression, reading
+    # each field with its default instead of looping over the fields
+    namespace: Dict[str, Any] = {
+        "new": tuple.__new__,
+        "copy": copy.deepcopy,
+        "record_class": record_class,
+        "convert_id": (lambda value: value) if native_id else _str_id,
+    }
+    items = []
+    for index, (name, field) in enumerate(model_class.model_fields.items()):
+        if name == "id":
+            items.append("convert_id(get('_id'))")
+        elif field.default_factory is not None:
+            namespace[f"factory_{index}"] = field.default_factory
+            items.append(f"doc[{name!r}] if {name!r} in doc else factory_{index}()")
+        elif field.default is PydanticUndefined or field.default is None:
+            items.append(f"get({name!r})")
+        elif _is_immutable(field.default):
+            namespace[f"default_{index}"] = field.default
+            items.append(f"get({name!r}, default_{index})")
+        else:
+            # Mutable defaults are copied for each record, as pydantic does
+            namespace[f"default_{index}"] = field.default
+            items.append(
+                f"doc[{name!r}] if {name!r} in doc else copy(default_{index})",
+            )
+
+    source = "\n".join(
+        [
+            "def convert(doc):",
+            "    get = doc.get",
+            f"    return new(record_class, ({''.join(f'{item}, ' for item in items)}))",
+        ],
+    )
+    exec(source, namespace)  # noqa: S102
+    convert: Callable[[Any], Record] = namespace["convert"]
+    convert.__qualname__ = f"convert_{record_class.__name__}"
+    return convert
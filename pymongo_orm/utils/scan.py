@@ -0,0 +1,154 @@
+"""
+Parallel collection scan utilities for MongoDB ORM.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+
+from .converters import bson_type_alias
+
+# Type aliases
+Query = Dict[str, Any]
+
+# Ways of choosing the _id boundaries between partitions
+SCAN_SPLIT_MODES = ("sample", "timestamp")
+
+# Queued by a merged scan once every partition is finished
+SCAN_DONE = object()
+
+
+class ScanStoppedError(Exception):
+    """Raised in scan workers when the consumer stopped reading results."""
+
+
+@dataclass
+class ScanFailure:
+    """An error raised by a scan worker, passed on to the consumer."""
+
+    error: BaseException
+
+
+def sample_pipeline(query: Query, size: int) -> List[Dict[str, Any]]:
+    """
+    Build the pipeline that samples ``_id`` values of matching documents.
+
+    Args:
+        query: Processed MongoDB query
+        size: Number of ids to sample
+
+    Returns:
+        Aggregation pipeline
+    """
+    pipeline: List[Dict[str, Any]] = [{"$match": query}] if query else []
+    pipeline += [{"$sample": {"size": size}}, {"$project": {"_id": 1}}]
+    return pipeline
+
+
+def sample_boundaries(sampled_ids: List[Any], partitions: int) -> List[Any]:
+    """
+    Pick partition boundaries at evenly spaced quantiles of sampled ids.
+
+    Range filters only match ``_id`` values of the bound's BSON type, so
+    boundaries are taken from the most common type in the sample only;
+    ``partition_queries`` scans the other types separately.
+
+    Args:
+        sampled_ids: ``_id`` values from a random sample
+        partitions: Number of partitions wanted
+
+    Returns:
+        Sorted, distinct boundaries of one BSON type (at most
+        ``partitions - 1``)
+    """
+    by_type: Dict[str, List[Any]] = {}
+    for value in sampled_ids:
+        alias = bson_type_alias(value)
+        if alias is not None:
+            by_type.setdefault(alias, []).append(value)
+    if not by_type or partitions < 2:
+        return []
+
+    try:
+        ids = sorted(set(max(by_type.values(), key=len)))
+    except TypeError:
+        # Values such as documents or Decimal128 cannot be ordered here
+        return []
+    if len(ids) < 2:
+        return []
+
+    boundaries = [ids[len(ids) * i // partitions] for i in range(1, partitions)]
+    return sorted(set(boundaries))
+
+
+def timestamp_boundaries(
+    min_id: Optional[ObjectId],
+    max_id: Optional[ObjectId],
+    partitions: int,
+) -> List[ObjectId]:
+    """
+    Split the ObjectId keyspace into evenly spaced creation-time ranges.
+
+    Args:
+        min_id: Smallest ``_id`` of the matching documents
+        max_id: Largest ``_id`` of the matching documents
+        partitions: Number of partitions wanted
+
+    Returns:
+        Sorted, distinct boundaries (at most ``partitions - 1``)
+    """
+    if not isinstance(min_id, ObjectId) or not isinstance(max_id, ObjectId):
+        return []
+
+    start = min_id.generation_time.timestamp()
+    end = max_id.generation_time.timestamp()
+    step = (end - start) / max(partitions, 1)
+    if step <= 0:
+        return []
+
+    boundaries = {
+        ObjectId.from_datetime(datetime.fromtimestamp(start + step * i, timezone.utc))
+        for i in range(1, partitions)
+    }
+    return sorted(b for b in boundaries if min_id < b <= max_id)
+
+
+def partition_queries(query: Query, boundaries: List[Any]) -> List[Query]:
+    """
+    Build one query per ``_id`` range between consecutive boundaries.
+
+    The first and last ranges are open-ended, but range filters only match
+    ``_id`` values of the boundaries' BSON type, so one more query matches
+    every other type. Together the queries cover every matching document
+    exactly once.
+
+    Args:
+        query: Processed MongoDB query
+        boundaries: Sorted, distinct ``_id`` boundaries of one BSON type
+
+    Returns:
+        Queries, one per partition
+    """
+    if not boundaries:
+        return [query]
+
+    alias = bson_type_alias(boundaries[0])
+    if alias is None or any(bson_type_alias(b) != alias for b in boundaries):
+        raise ValueError("Scan boundaries must all have the same BSON type")
+
+    edges: List[Optional[Any]] = [None, *boundaries, None]
+    id_filters: List[Dict[str, Any]] = []
+    for low, high in zip(edges, edges[1:]):
+        id_range: Dict[str, Any] = {}
+        if low is not None:
+            id_range["$gte"] = low
+        if high is not None:
+            id_range["$lt"] = high
+        id_filters.append(id_range)
+    id_filters.append({"$not": {"$type": alias}})
+
+    if not query:
+        return [{"_id": id_filter} for id_filter in id_filters]
+    return [{"$and": [query, {"_id": id_filter}]} for id_filter in id_filters]
@@ -2,10 +2,18 @@
 Tests for the asynchronous MongoDB model implementation.
 """
 
+import asyncio
+from typing import Optional
+
 import pytest
+from bson import ObjectId
+from pydantic import BaseModel
 from pymongo import ASCENDING
+from pymongo.errors import PyMongoError
 
+from pymongo_orm import ObjectIdField
 from pymongo_orm.async_model.model import AsyncMongoModel
+from pymongo_orm.exceptions import QueryError
 
 
 class TestUser(AsyncMongoModel):
@@ -19,6 +27,53 @@ class TestUser(AsyncMongoModel):
     age: int
 
 
+class TestCachedUser(AsyncMongoModel):
+    """Test model with the query cache enabled."""
+
+    __collection__ = "cached_users"
+    __cache__ = {}
+
+    name: str
+    email: str
+    age: int
+
+
+class TestCountedUser(AsyncMongoModel):
+    """Test model whose cached counts are immediately stale."""
+
+    __collection__ = "counted_users"
+    __count_cache__ = {"ttl": 0, "stale_ttl": 60}
+
+    name: str
+
+
+class TestNativeUser(AsyncMongoModel):
+    """Test model storing its id as a native ObjectId."""
+
+    __collection__ = "native_users"
+    __native_id__ = True
+
+    id: Optional[ObjectIdField] = None
+    name: str
+
+
+class TestKeyedUser(AsyncMongoModel):
+    """Test model keyed by an integer _id."""
+
+    __collection__ = "keyed_users"
+    __native_id__ = True
+
+    id: Optional[int] = None
+    name: str
+
+
+class AgeSummary(BaseModel):
+    """Aggregation output model."""
+
+    id: str
+    total: int
+
+
 class TestAsyncModel:
     """Tests for asynchronous MongoDB models."""
 
@@ -192,6 +247,107 @@ class TestAsyncModel:
             test_data["users"],
         )
 
+    @pytest.mark.asyncio
+    async def test_aggregate_iter(self, async_db, test_data):
+        """Test streaming aggregation results."""
+        for user_data in test_data["users"]:
+            await TestUser(**user_data).save(async_db)
+
+        pipeline = [{"$group": {"_id": "$name", "total": {"$sum": "$age"}}}]
+        rows = TestUser.aggregate_iter(
+            async_db,
+            pipeline,
+            allow_disk_use=True,
+            batch_size=1,
+            output_model=AgeSummary,
+        )
+        summaries = {row.id: row.total async for row in rows}
+        assert summaries == {u["name"]: u["age"] for u in test_data["users"]}
+
+    @pytest.mark.asyncio
+    async def test_objects(self, async_db):
+        """Test lazy, chainable query sets."""
+        await TestUser.save_many(
+            async_db,
+            [
+                TestUser(name=f"User {i}", email=f"user{i}@example.com", age=i)
+                for i in range(10)
+            ],
+        )
+
+        adults = TestUser.objects(async_db).filter(age={"$gte": 3})
+        by_age = adults.order_by("-age")
+        assert [user.age async for user in by_age[:3]] == [9, 8, 7]
+        assert (await by_age[1]).age == 8
+        assert await adults.count() == 7
+        assert await adults.exists()
+        assert not await adults.filter(name="User 1").exists()
+        assert [user.age async for user in adults[3:3]] == []
+
+    @pytest.mark.asyncio
+    async def test_count_modes(self, async_db, test_data):
+        """Test limited counts and stale-while-revalidate count caching."""
+        for user_data in test_data["users"]:
+            await TestUser(**user_data).save(async_db)
+
+        assert await TestUser.count(async_db) == len(test_data["users"])
+        assert await TestUser.count(async_db, {"age": {"$gte": 0}}, limit=1) == 1
+
+        await TestCountedUser(name="first").save(async_db)
+        assert await TestCountedUser.count(async_db) == 1
+        await TestCountedUser(name="second").save(async_db)
+
+        # The stale count is returned while a refresh runs in the background
+        assert await TestCountedUser.count(async_db) == 1
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert await TestCountedUser.count(async_db) == 2
+
+    @pytest.mark.asyncio
+    async def test_native_id(self, async_db):
+        """Test models that keep id as the stored _id value."""
+        user = await TestNativeUser(name="Ada").save(async_db)
+        assert isinstance(user.id, ObjectId)
+
+        found = await TestNativeUser.find_one(async_db, {"id": user.id})
+        assert found.id == user.id
+        assert (await TestNativeUser.find_by_ids(async_db, [user.id]))[0].id == user.id
+        assert (await TestNativeUser.loader(async_db).load(user.id)).id == user.id
+        assert f'"id":"{user.id}"' in user.model_dump_json()
+
+        found.name = "Grace"
+        await found.save(async_db)
+        assert (
+            await TestNativeUser.find_one(async_db, {"id": user.id})
+        ).name == "Grace"
+        assert await found.delete(async_db)
+
+        # A new model built with its id is upserted
+        await TestKeyedUser(id=7, name="seven").save(async_db)
+        keyed = await TestKeyedUser.find_one(async_db, {"id": 7})
+        assert keyed.id == 7
+        keyed.name = "Seven"
+        await keyed.save(async_db)
+        assert (await TestKeyedUser.find(async_db, as_="dict"))[0]["name"] == "Seven"
+
+    @pytest.mark.asyncio
+    async def test_find_records(self, async_db, test_data):
+        """Test loading read-only records."""
+        for user_data in test_data["users"]:
+            await TestUser(**user_data).save(async_db)
+
+        records = await TestUser.find(async_db, sort=[("age", ASCENDING)], as_="record")
+        assert [record.name for record in records] == [
+            user["name"] for user in sorted(test_data["users"], key=lambda u: u["age"])
+        ]
+        with pytest.raises(AttributeError):
+            records[0].age = 1
+
+        user = records[0].to_model()
+        user.age = 99
+        await user.save(async_db)
+        assert (await TestUser.find_one(async_db, {"id": user.id})).age == 99
+
     @pytest.mark.asyncio
     async def test_hooks(self, async_db, test_data):
         """Test pre and post save hooks."""
@@ -220,3 +376,247 @@ class TestAsyncModel:
         # Check that hooks were called
         assert hook_tracker["pre_save_called"] is True
         assert hook_tracker["post_save_called"] is True
+
+        # Hooks added to a single instance run too
+        calls = []
+
+        async def instance_hook(model):
+            calls.append(model)
+
+        user = TestUserWithHooks(**test_data["users"][1])
+        user._pre_save_hooks = [*user._pre_save_hooks, instance_hook]
+        await user.save(async_db)
+        assert calls == [user]
+
+    @pytest.mark.asyncio
+    async def test_iter_find(self, async_db, test_data):
+        """Test streaming documents with iter_find."""
+        # Create and save multiple users
+        for user_data in test_data["users"]:
+            user = TestUser(**user_data)
+            await user.save(async_db)
+
+        # Iterate lazily over all users
+        ages = [
+            user.age
+            async for user in TestUser.iter_find(
+                async_db,
+                sort=[("age", 1)],
+                batch_size=1,
+            )
+        ]
+        assert ages == sorted(u["age"] for u in test_data["users"])
+
+        # Stop early and close the generator
+        users = TestUser.iter_find(async_db, {"age": {"$gte": 30}})
+        first = await users.__anext__()
+        assert isinstance(first, TestUser)
+        assert first.age >= 30
+        await users.aclose()
+
+    @pytest.mark.asyncio
+    async def test_paginate(self, async_db, test_data):
+        """Test keyset pagination."""
+        # Create and save multiple users
+        for user_data in test_data["users"]:
+            user = TestUser(**user_data)
+            await user.save(async_db)
+
+        first = await TestUser.paginate(async_db, sort=[("age", -1)], limit=2)
+        assert [u.age for u in first.items] == [35, 30]
+        assert first.has_more
+
+        second = await TestUser.paginate(
+            async_db,
+            sort=[("age", -1)],
+            limit=2,
+            token=first.next_token,
+        )
+        assert [u.age for u in second.items] == [25]
+        assert not second.has_more
+
+        with pytest.raises(ValueError, match="at least 1"):
+            await TestUser.paginate(async_db, sort=[("age", -1)], limit=0)
+
+    @pytest.mark.asyncio
+    async def test_save_without_changes(self, async_db, test_data):
+        """Test that unchanged models are not written again."""
+        await TestUser(**test_data["users"][0]).save(async_db)
+        user = await TestUser.find_one(async_db, {"email": "user1@example.com"})
+        updated_at = user.updated_at
+
+        await user.save(async_db)
+        assert user.updated_at == updated_at
+
+        user.age = 40
+        await user.save(async_db)
+        assert user.updated_at != updated_at
+
+        found = await TestUser.find_one(async_db, {"id": user.id})
+        assert found.age == 40
+
+    @pytest.mark.asyncio
+    async def test_save_many(self, async_db, test_data):
+        """Test saving models in batches."""
+        users = [TestUser(**user_data) for user_data in test_data["users"]]
+        result = await TestUser.save_many(async_db, users, chunk_size=2)
+
+        assert result.ok
+        assert result.saved == users
+        assert all(user.id is not None for user in users)
+        assert await TestUser.count(async_db) == len(users)
+
+    @pytest.mark.asyncio
+    async def test_write_buffer(self, async_db, test_data):
+        """Test buffering saves and draining them on close."""
+        async with TestUser.write_buffer(async_db, max_age=0.01) as buffer:
+            user = await buffer.save(TestUser(**test_data["users"][0]))
+            user.age = 31
+            await buffer.save(user)
+            assert len(buffer) == 1
+
+            # The background task flushes writes once they are max_age old
+            await asyncio.sleep(0.05)
+            assert len(buffer) == 0
+
+            await buffer.save(TestUser(**test_data["users"][1]))
+
+        assert await TestUser.count(async_db) == 2
+        stored = await TestUser.find_one(async_db, {"id": user.id})
+        assert stored.age == 31
+
+    @pytest.mark.asyncio
+    async def test_query_cache(self, async_db, test_data):
+        """Test cached reads and write-driven invalidation."""
+        TestCachedUser.clear_cache()
+        user = await TestCachedUser(**test_data["users"][0]).save(async_db)
+
+        assert await TestCachedUser.find_one(async_db, {"id": user.id}) is not None
+        assert await TestCachedUser.find_one(async_db, {"id": user.id}) is not None
+        assert TestCachedUser.cache_stats().hits == 1
+
+        await user.delete(async_db)
+        assert await TestCachedUser.find_one(async_db, {"id": user.id}) is None
+
+    @pytest.mark.asyncio
+    async def test_loader(self, async_db, test_data, monkeypatch):
+        """Test batching id lookups made in the same tick."""
+        users = [TestUser(**data) for data in test_data["users"]]
+        await TestUser.save_many(async_db, users)
+
+        collection = TestUser.get_collection(async_db)
+        queries = []
+        original_find = collection.find
+
+        def recording_find(query, *args, **kwargs):
+            queries.append(query)
+            return original_find(query, *args, **kwargs)
+
+        monkeypatch.setattr(collection, "find", recording_find)
+        monkeypatch.setattr(TestUser, "get_collection", lambda db: collection)
+
+        loader = TestUser.loader(async_db)
+        missing = "507f1f77bcf86cd799439011"
+        results = await asyncio.gather(
+            loader.load(users[0].id),
+            loader.load(users[1].id),
+            loader.load(users[0].id),
+            loader.load(missing),
+        )
+
+        assert len(queries) == 1
+        assert len(queries[0]["_id"]["$in"]) == 3
+        assert [user.email for user in results[:3]] == [
+            users[0].email,
+            users[1].email,
+            users[0].email,
+        ]
+        assert results[0] is results[2]
+        assert results[3] is None
+
+        # Memoized ids are not fetched again
+        assert (await loader.load_many([users[1].id, users[2].id]))[1].name == "User 3"
+        assert len(queries) == 2
+        assert len(queries[1]["_id"]["$in"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_find_by_ids(self, async_db, test_data):
+        """Test bulk lookups by id with concurrent chunks."""
+        users = [TestUser(**data) for data in test_data["users"]]
+        await TestUser.save_many(async_db, users)
+
+        ids = [user.id for user in reversed(users)]
+        found = await TestUser.find_by_ids(async_db, ids, chunk_size=1)
+        assert [user.id for user in found] == ids
+
+        with pytest.raises(ValueError, match="Unsupported missing policy"):
+            await TestUser.find_by_ids(async_db, ids, missing="ignore")
+
+    @pytest.mark.asyncio
+    async def test_find_by_ids_concurrency(self, async_db, monkeypatch):
+        """Test chunks share half the pool and stop at the first failure."""
+        collection = TestUser.get_collection(async_db)
+        running = []
+        peak = []
+        finished = []
+
+        class FailingCursor:
+            def __init__(self, chunk):
+                self.chunk = chunk
+
+            async def to_list(self, length=None):
+                running.append(self)
+                peak.append(len(running))
+                try:
+                    await asyncio.sleep(0 if self.chunk[0] == ids[0] else 1)
+                    if self.chunk[0] == ids[0]:
+                        raise PyMongoError("chunk failed")
+                    finished.append(self)
+                    return []
+                finally:
+                    running.remove(self)
+
+        def find(query, projection=None):
+            return FailingCursor(query["_id"]["$in"])
+
+        monkeypatch.setattr(collection, "find", find)
+        monkeypatch.setattr(TestUser, "get_collection", lambda db: collection)
+        monkeypatch.setattr(
+            "pymongo_orm.async_model.implementation.client_pool_size",
+            lambda client: 6,
+        )
+
+        ids = [ObjectId() for _ in range(10)]
+        with pytest.raises(QueryError, match="chunk failed"):
+            await TestUser.find_by_ids(async_db, ids, chunk_size=1)
+
+        # The other chunks were cancelled instead of running to completion
+        await asyncio.sleep(0)
+        assert max(peak) == 3
+        assert running == []
+        assert finished == []
+
+    @pytest.mark.asyncio
+    async def test_parallel_scan(self, async_db):
+        """Test scanning a collection with concurrent tasks."""
+        await TestUser.save_many(
+            async_db,
+            [
+                TestUser(name=f"User {i}", email=f"user{i}@example.com", age=i)
+                for i in range(30)
+            ],
+        )
+
+        ages = [
+            user.age async for user in TestUser.parallel_scan(async_db, partitions=3)
+        ]
+        assert sorted(ages) == list(range(30))
+
+        partitions = set()
+
+        async def record(partition, user):
+            partitions.add(partition)
+
+        count = await TestUser.parallel_scan_each(async_db, record, partitions=3)
+        assert count == 30
+        assert len(partitions) > 1
@@ -2,11 +2,37 @@
 Tests for the MongoDB connection classes.
 """
 
+import asyncio
+
+import mongomock
+import pytest
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo import MongoClient
+from pymongo.errors import ServerSelectionTimeoutError
 
+from pymongo_orm.abstract import connection as abstract_connection
 from pymongo_orm.async_model.connection import AsyncMongoConnection
+from pymongo_orm.async_model.model import AsyncMongoModel
 from pymongo_orm.sync_model.connection import SyncMongoConnection
+from pymongo_orm.sync_model.model import SyncMongoModel
+from pymongo_orm.utils.connections import connection_key, redact_uri
+
+
+class WarmSyncUser(SyncMongoModel):
+    """Sync model touched by warm-up tests."""
+
+    __collection__ = "warm_users"
+    __indexes__ = [{"fields": ["name"]}]
+
+    name: str
+
+
+class WarmAsyncUser(AsyncMongoModel):
+    """Async model touched by warm-up tests."""
+
+    __collection__ = "warm_users"
+
+    name: str
 
 
 class TestConnections:
@@ -161,3 +187,245 @@ class TestConnections:
 
         # Clean up
         AsyncMongoConnection._instances.clear()
+
+    def test_connection_key(self):
+        """Test equivalent configurations share a registry key."""
+        uri = "mongodb://localhost:27017"
+        assert connection_key(uri, {"maxPoolSize": 5}) == connection_key(
+            uri + "/?maxpoolsize=5",
+            {},
+        )
+        assert connection_key(uri, {"maxPoolSize": 5}) != connection_key(
+            uri,
+            {"maxPoolSize": 10},
+        )
+        assert connection_key(uri, {"w": "Majority", "tls": True}) == (
+            connection_key(uri + "/?w=majority&tls=TRUE", {})
+        )
+        assert redact_uri("mongodb://app:secret@db:27017/x") == (
+            "mongodb://app:***@db:27017/x"
+        )
+
+    def test_credentials_are_case_sensitive(self, monkeypatch):
+        """Test credentials differing only in case get separate clients."""
+        monkeypatch.setattr(
+            MongoClient,
+            "__new__",
+            lambda cls, *args, **kwargs: mongomock.MongoClient(),
+        )
+        uri = "mongodb://localhost:27017"
+        try:
+            first = SyncMongoConnection(
+                uri,
+                username="u",
+                password="Secret",
+                replicaSet="RS0",
+            )
+            second = SyncMongoConnection(
+                uri,
+                username="u",
+                password="secret",
+                replicaSet="rs0",
+            )
+            assert first is not second
+            assert first.get_client() is not second.get_client()
+        finally:
+            SyncMongoConnection._instances.clear()
+
+    def test_registry_options_and_eviction(self, monkeypatch):
+        """Test clients are keyed by options and idle ones evicted LRU."""
+        closed = []
+
+        def make_client(cls, *args, **kwargs):
+            client = mongomock.MongoClient()
+            client.close = lambda: closed.append(args[0])
+            return client
+
+        monkeypatch.setattr(MongoClient, "__new__", make_client)
+        monkeypatch.setattr(SyncMongoConnection, "max_clients", 2)
+        try:
+            small = SyncMongoConnection("mongodb://tenant-a", maxPoolSize=5)
+            large = SyncMongoConnection("mongodb://tenant-a", maxPoolSize=50)
+            assert small is not large
+            assert SyncMongoConnection("mongodb://tenant-a", maxPoolSize=5) is small
+
+            # The least recently used idle client makes room for a new one
+            large._usage.checked_out = 1
+            other = SyncMongoConnection("mongodb://tenant-b")
+            assert closed == ["mongodb://tenant-a"]
+            assert set(SyncMongoConnection._instances.values()) == {large, other}
+            large._usage.checked_out = 0
+
+            # Busy clients are kept even past the limit
+            large._usage.checked_out = 1
+            other._usage.checked_out = 1
+            SyncMongoConnection("mongodb://tenant-c")
+            assert len(SyncMongoConnection._instances) == 3
+
+            stats = SyncMongoConnection.pool_stats()
+            assert stats[0].uri == "mongodb://tenant-c"
+            assert {s.max_pool_size for s in stats} == {50, 100}
+            assert sum(s.checked_out for s in stats) == 2
+        finally:
+            SyncMongoConnection._instances.clear()
+
+    def test_evicted_connection_is_closed(self, monkeypatch):
+        """Test evicted clients are closed and held connections reopened."""
+        closed = []
+
+        def make_client(cls, *args, **kwargs):
+            client = mongomock.MongoClient()
+            client.close = lambda: closed.append(args[0])
+            return client
+
+        monkeypatch.setattr(MongoClient, "__new__", make_client)
+        monkeypatch.setattr(SyncMongoConnection, "max_clients", 1)
+        try:
+            held = SyncMongoConnection("mongodb://tenant-a")
+            evicted_client = held.get_client()
+
+            other = SyncMongoConnection("mongodb://tenant-b")
+            assert set(SyncMongoConnection._instances.values()) == {other}
+            assert closed == ["mongodb://tenant-a"]
+
+            # Using the held connection reopens it, evicting the idle one
+            assert held.get_db(db_name="x").command("ping")["ok"]
+            assert held.get_client() is not evicted_client
+            assert SyncMongoConnection("mongodb://tenant-a") is held
+            assert set(SyncMongoConnection._instances.values()) == {held}
+            assert closed == ["mongodb://tenant-a", "mongodb://tenant-b"]
+
+            # A client that got busy while being evicted is closed once idle
+            held._usage.checked_out = 1
+            with SyncMongoConnection._lock:
+                del SyncMongoConnection._instances[held._key]
+                held._retire()
+            assert len(closed) == 2
+            held._usage.checked_out = 0
+            SyncMongoConnection("mongodb://tenant-c")
+            assert closed[2:] == ["mongodb://tenant-a"]
+
+            # Closing an evicted connection does not close its client twice
+            held.close()
+            assert len(closed) == 3
+        finally:
+            SyncMongoConnection._instances.clear()
+            SyncMongoConnection._retiring.clear()
+
+    def test_rebuild_after_fork(self, monkeypatch):
+        """Test clients inherited through a fork are replaced before use."""
+        monkeypatch.setattr(
+            MongoClient,
+            "__new__",
+            lambda cls, *args, **kwargs: mongomock.MongoClient(),
+        )
+        try:
+            conn = SyncMongoConnection("mongodb://localhost:27017")
+            inherited = conn.get_client()
+            inherited_lock = SyncMongoConnection._lock
+
+            # What os.register_at_fork runs in the child
+            abstract_connection._reset_after_fork()
+
+            assert SyncMongoConnection._lock is not inherited_lock
+            assert conn.get_client() is not inherited
+            assert conn.get_db(db_name="test_db").client is conn.get_client()
+            assert SyncMongoConnection("mongodb://localhost:27017") is conn
+        finally:
+            SyncMongoConnection._instances.clear()
+
+    def test_async_connection_per_loop(self, monkeypatch):
+        """Test async connections are not shared across event loops."""
+        closed = []
+
+        def make_client(cls, *args, **kwargs):
+            client = mongomock.MongoClient()
+            client.close = lambda: closed.append(client)
+            return client
+
+        monkeypatch.setattr(AsyncIOMotorClient, "__new__", make_client)
+
+        async def connect():
+            first = AsyncMongoConnection("mongodb://localhost:27017")
+            second = AsyncMongoConnection("mongodb://localhost:27017")
+            assert first is second
+            return first
+
+        try:
+            loop_a, loop_b = asyncio.new_event_loop(), asyncio.new_event_loop()
+            conn_a = loop_a.run_until_complete(connect())
+            conn_b = loop_b.run_until_complete(connect())
+            assert conn_a is not conn_b
+            assert loop_a.run_until_complete(connect()) is conn_a
+            loop_a.close()
+
+            # Connecting from a new loop closes the closed loop's client
+            loop_c = asyncio.new_event_loop()
+            conn_c = loop_c.run_until_complete(connect())
+            assert closed == [conn_a._client]
+            assert set(AsyncMongoConnection._instances.values()) == {conn_b, conn_c}
+            loop_b.close()
+            loop_c.close()
+        finally:
+            AsyncMongoConnection._instances.clear()
+
+    def test_sync_warm_up(self, sync_connection, sync_db):
+        """Test warming up a sync connection and touching model collections."""
+        WarmSyncUser.ensure_indexes(sync_db)
+
+        report = sync_connection.warm_up(
+            min_connections=4,
+            models=[WarmSyncUser],
+            db_name="test_db",
+        )
+
+        assert report
+        assert report.ping_ms is not None
+        assert report.target_connections == 4
+        assert report.models == 1
+        assert report.errors == []
+
+        # Models need a database
+        report = sync_connection.warm_up(models=[WarmSyncUser])
+        assert not report
+        assert report.models == 0
+
+    def test_sync_warm_up_unreachable(self, sync_connection, monkeypatch):
+        """Test a failed ping is reported instead of raised."""
+
+        def ping(*args, **kwargs):
+            raise ServerSelectionTimeoutError("no servers")
+
+        monkeypatch.setattr(sync_connection.get_client().admin, "command", ping)
+
+        report = sync_connection.warm_up(timeout=0.1, models=[WarmSyncUser])
+
+        assert not report
+        assert report.ping_ms is None
+        assert report.models == 0
+        assert report.errors == ["ping: no servers"]
+
+    @pytest.mark.asyncio
+    async def test_async_warm_up(self, async_connection, monkeypatch):
+        """Test warming up an async connection and touching model collections."""
+        report = await async_connection.warm_up(
+            min_connections=3,
+            models=[WarmAsyncUser],
+            db_name="test_db",
+        )
+
+        assert report
+        assert report.target_connections == 3
+        assert report.models == 1
+
+        # A ping slower than the timeout is reported as a timeout
+        async def slow_ping(*args, **kwargs):
+            await asyncio.sleep(1)
+
+        admin = async_connection.get_client().admin
+        monkeypatch.setattr(type(admin), "command", slow_ping)
+        report = await async_connection.warm_up(timeout=0.01)
+
+        assert not report
+        assert report.ping_ms is None
+        assert report.errors == ["ping: TimeoutError"]
@@ -2,6 +2,8 @@
 Tests for bulk operations in synchronous MongoDB model.
 """
 
+import time
+
 from pymongo import ASCENDING, DeleteOne, InsertOne, UpdateOne
 
 from pymongo_orm.sync_model.model import SyncMongoModel
@@ -212,3 +214,128 @@ class TestBulkOperations:
 
         # Restore original method
         monkeypatch.setattr(collection_mock, "bulk_write", original_bulk_write)
+
+    def test_save_many(self, sync_db, test_data):
+        """Test saving new and existing models in batches."""
+        TestUser.ensure_indexes(sync_db)
+        existing = TestUser(**test_data["users"][0]).save(sync_db)
+        existing.age = 99
+
+        users = [existing] + [TestUser(**data) for data in test_data["users"][1:]]
+        result = TestUser.save_many(sync_db, users, chunk_size=1)
+
+        assert result.ok
+        assert len(result.saved) == 3
+        assert all(user.id is not None for user in users)
+        assert TestUser.count(sync_db) == 3
+        assert TestUser.find_one(sync_db, {"id": existing.id}).age == 99
+        assert TestUser.find_one(sync_db, {"id": users[1].id}).name == "User 2"
+
+    def test_save_many_reports_failures(self, sync_db, test_data):
+        """Test that one failing document does not abort the batch."""
+        TestUser.ensure_indexes(sync_db)
+        users = [
+            TestUser(**test_data["users"][0]),
+            TestUser(**test_data["users"][0]),  # Duplicate email
+            TestUser(**test_data["users"][1]),
+        ]
+
+        result = TestUser.save_many(sync_db, users)
+        assert not result.ok
+        assert [error.model for error in result.errors] == [users[1]]
+        assert result.errors[0].code == 11000
+        assert users[1].id is None
+        assert TestUser.count(sync_db) == 2
+
+        # Ordered batches stop at the first failure
+        users = [
+            TestUser(**test_data["users"][2]),
+            TestUser(**test_data["users"][2]),  # Duplicate email
+            TestUser(name="User 4", email="user4@example.com", age=40),
+        ]
+        result = TestUser.save_many(sync_db, users, ordered=True, chunk_size=2)
+        assert result.saved == [users[0]]
+        assert [error.model for error in result.errors] == users[1:]
+        assert result.errors[1].code is None
+        assert TestUser.count(sync_db) == 3
+
+    def test_write_buffer(self, sync_db, test_data, monkeypatch):
+        """Test coalescing buffered saves into bulk writes."""
+        collection = sync_db[TestUser.__collection__]
+        calls = []
+        original_bulk_write = collection.bulk_write
+
+        def counting_bulk_write(operations, ordered=True):
+            calls.append(list(operations))
+            return original_bulk_write(operations, ordered=ordered)
+
+        monkeypatch.setattr(collection, "bulk_write", counting_bulk_write)
+        monkeypatch.setattr(TestUser, "get_collection", lambda db: collection)
+
+        with TestUser.write_buffer(sync_db, max_size=2, max_age=60) as buffer:
+            user = buffer.save(TestUser(**test_data["users"][0]))
+            assert user.id is not None
+            user.age = 31
+            buffer.save(user)
+            assert len(buffer) == 1
+            assert calls == []
+
+            # Reaching max_size flushes in the saving thread
+            buffer.save(TestUser(**test_data["users"][1]))
+            assert len(calls) == 1
+            assert [type(op) for op in calls[0]] == [InsertOne, InsertOne]
+
+            user.age = 32
+            buffer.save(user)
+            user.name = "Renamed"
+            buffer.save(user)
+
+        # Closing drains the remaining merged update
+        assert len(calls) == 2
+        assert len(calls[1]) == 1
+        assert calls[1][0]._doc["$set"]["age"] == 32
+        assert calls[1][0]._doc["$set"]["name"] == "Renamed"
+        stored = TestUser.find_one(sync_db, {"id": user.id})
+        assert (stored.name, stored.age) == ("Renamed", 32)
+
+    def test_write_buffer_failures(self, sync_db, test_data):
+        """Test that failed buffered writes are reported and rolled back."""
+        TestUser.ensure_indexes(sync_db)
+        TestUser(**test_data["users"][0]).save(sync_db)
+        failures = []
+
+        buffer = TestUser.write_buffer(sync_db, on_error=failures.append)
+        duplicate = buffer.save(TestUser(**test_data["users"][0]))
+        buffer.save(TestUser(**test_data["users"][1]))
+        result = buffer.close()
+
+        assert failures == [result]
+        assert [error.model for error in result.errors] == [duplicate]
+        assert duplicate.id is None
+        assert TestUser.count(sync_db) == 2
+
+    def test_write_buffer_survives_errors(self, sync_db, test_data):
+        """Test that the background flusher keeps running after an error."""
+        TestUser.ensure_indexes(sync_db)
+        TestUser(**test_data["users"][0]).save(sync_db)
+
+        def failing_handler(result):
+            raise RuntimeError("handler failed")
+
+        with TestUser.write_buffer(
+            sync_db,
+            max_age=0.01,
+            on_error=failing_handler,
+        ) as buffer:
+            buffer.save(TestUser(**test_data["users"][0]))
+            deadline = time.monotonic() + 2
+            while len(buffer) and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            # The duplicate's handler raised; the next save is still flushed
+            buffer.save(TestUser(**test_data["users"][1]))
+            while TestUser.count(sync_db) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert buffer._thread.is_alive()
+
+        assert TestUser.count(sync_db) == 2
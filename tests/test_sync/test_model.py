@@ -2,9 +2,18 @@
 Tests for the synchronous MongoDB model implementation.
 """
 
-from pymongo import ASCENDING
+from typing import Any, Dict, List, Optional
 
+import pytest
+from bson import ObjectId
+from pydantic import BaseModel, Field
+from pymongo import ASCENDING, InsertOne
+
+from pymongo_orm import ObjectIdField
+from pymongo_orm.exceptions import DocumentNotFoundError, MongoORMError
 from pymongo_orm.sync_model.model import SyncMongoModel
+from pymongo_orm.utils.metrics import operation_metrics
+from pymongo_orm.utils.records import get_record_converter
 
 
 class TestUser(SyncMongoModel):
@@ -18,6 +27,72 @@ class TestUser(SyncMongoModel):
     age: int
 
 
+class TestProfile(SyncMongoModel):
+    """Test model with mutable fields for change tracking."""
+
+    __collection__ = "profiles"
+
+    name: str
+    roles: List[str] = Field(default_factory=list)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class TestScore(SyncMongoModel):
+    """Test model whose sort field can be null, missing or of mixed types."""
+
+    __collection__ = "scores"
+
+    name: str
+    score: Any = None
+
+
+class TestCachedUser(SyncMongoModel):
+    """Test model with the query cache enabled."""
+
+    __collection__ = "cached_users"
+    __cache__ = {"max_entries": 2}
+
+    name: str
+    email: str
+    age: int
+
+
+class TestCountedUser(SyncMongoModel):
+    """Test model with the count cache enabled."""
+
+    __collection__ = "counted_users"
+    __count_cache__ = {"ttl": 60}
+
+    name: str
+
+
+class TestNativeUser(SyncMongoModel):
+    """Test model storing its id as a native ObjectId."""
+
+    __collection__ = "native_users"
+    __native_id__ = True
+
+    id: Optional[ObjectIdField] = None
+    name: str
+
+
+class TestKeyedUser(SyncMongoModel):
+    """Test model keyed by an integer _id."""
+
+    __collection__ = "keyed_users"
+    __native_id__ = True
+
+    id: Optional[int] = None
+    name: str
+
+
+class AgeSummary(BaseModel):
+    """Aggregation output model."""
+
+    id: str
+    total: int
+
+
 class TestSyncModel:
     """Tests for synchronous MongoDB models."""
 
@@ -181,6 +256,203 @@ class TestSyncModel:
             test_data["users"],
         )
 
+    def test_aggregate_iter(self, sync_db, test_data):
+        """Test streaming aggregation results."""
+        for user_data in test_data["users"]:
+            TestUser(**user_data).save(sync_db)
+
+        pipeline = [{"$group": {"_id": "$name", "total": {"$sum": "$age"}}}]
+        rows = TestUser.aggregate_iter(
+            sync_db,
+            pipeline,
+            allow_disk_use=True,
+            batch_size=1,
+            max_time_ms=1000,
+            output_model=AgeSummary,
+        )
+        summaries = {row.id: row.total for row in rows}
+        assert summaries == {u["name"]: u["age"] for u in test_data["users"]}
+
+        users = list(TestUser.aggregate_iter(sync_db, [{"$sort": {"age": 1}}]))
+        assert isinstance(users[0]["id"], str)
+        assert "_id" not in users[0]
+
+        with pytest.raises(ValueError):
+            list(
+                TestUser.aggregate_iter(
+                    sync_db,
+                    [],
+                    output_model=AgeSummary,
+                    as_="bson",
+                ),
+            )
+
+    def test_objects(self, sync_db):
+        """Test lazy, chainable query sets."""
+        TestUser.save_many(
+            sync_db,
+            [
+                TestUser(name=f"User {i}", email=f"user{i}@example.com", age=i)
+                for i in range(10)
+            ],
+        )
+
+        adults = TestUser.objects(sync_db).filter({"age": {"$gte": 3}})
+        by_age = adults.order_by("-age")
+        assert [user.age for user in by_age[:3]] == [9, 8, 7]
+        assert [user.age for user in by_age.skip(2).limit(5)[1:3]] == [6, 5]
+        assert by_age[0].age == 9
+        assert by_age.first().age == 9
+        assert adults.count() == 7
+        assert adults[5:].count() == 2
+        assert adults[5:5].all() == []
+        # As in PyMongo, limit(0) means no limit
+        assert adults.limit(0).count() == 7
+        assert by_age[:3].limit(0).count() == 3
+        assert adults.exists()
+        assert adults.skip(6).exists()
+        assert not adults.skip(7).exists()
+        assert not adults.filter(name="User 1").exists()
+
+        user = adults.filter(name="User 4").only("name", "email", "age").first()
+        assert user.name == "User 4"
+        assert user.id is not None
+        assert TestUser.objects(sync_db).filter(id=user.id).count() == 1
+
+        with pytest.raises(IndexError):
+            by_age[20]
+
+    def test_count_modes(self, sync_db, test_data):
+        """Test estimated, limited and cached counts."""
+        for user_data in test_data["users"]:
+            TestUser(**user_data).save(sync_db)
+        total = len(test_data["users"])
+
+        assert TestUser.count(sync_db) == total
+        assert TestUser.count(sync_db, approximate=True) == total
+        assert TestUser.count(sync_db, approximate=False) == total
+        assert TestUser.count(sync_db, limit=1) == 1
+        assert TestUser.count(sync_db, {"age": {"$gte": 0}}, limit=total + 1) == total
+        with pytest.raises(ValueError):
+            TestUser.count(sync_db, {"age": 30}, approximate=True)
+
+        TestCountedUser(name="first").save(sync_db)
+        assert TestCountedUser.count(sync_db) == 1
+        TestCountedUser(name="second").save(sync_db)
+        # Cached counts lag behind writes until they expire
+        assert TestCountedUser.count(sync_db) == 1
+        TestCountedUser.clear_cache()
+        assert TestCountedUser.count(sync_db) == 2
+
+    def test_native_id(self, sync_db):
+        """Test models that keep id as the stored _id value."""
+        user = TestNativeUser(name="Ada").save(sync_db)
+        assert isinstance(user.id, ObjectId)
+        assert sync_db.native_users.find_one({"_id": user.id})["name"] == "Ada"
+
+        found = TestNativeUser.find_one(sync_db, {"id": user.id})
+        assert found.id == user.id
+        assert TestNativeUser.find_by_ids(sync_db, [user.id])[0].id == user.id
+        assert TestNativeUser.find(sync_db, as_="dict")[0]["id"] == user.id
+        assert TestNativeUser.objects(sync_db).filter(id=user.id).count() == 1
+
+        # JSON output still uses the string form
+        assert f'"id":"{user.id}"' in user.model_dump_json()
+
+        found.name = "Grace"
+        found.save(sync_db)
+        assert TestNativeUser.find_one(sync_db, {"id": user.id}).name == "Grace"
+        assert found.delete(sync_db)
+        assert TestNativeUser.count(sync_db) == 0
+
+    def test_native_id_custom_type(self, sync_db):
+        """Test natively keyed models with user-supplied ids."""
+        # A new model built with its id is upserted
+        TestKeyedUser(id=7, name="seven").save(sync_db)
+        assert sync_db.keyed_users.find_one({"_id": 7})["name"] == "seven"
+
+        user = TestKeyedUser.find_one(sync_db, {"id": 7})
+        assert user.id == 7
+        user.name = "Seven"
+        user.save(sync_db)
+        assert TestKeyedUser.find_one(sync_db, {"_id": 7}).name == "Seven"
+
+        result = TestKeyedUser.save_many(
+            sync_db,
+            [TestKeyedUser(id=8, name="eight"), TestKeyedUser(id=9, name="nine")],
+        )
+        assert result.ok
+        assert [u.id for u in TestKeyedUser.find(sync_db, sort=[("_id", 1)])] == [
+            7,
+            8,
+            9,
+        ]
+
+    def test_operation_metrics(self, sync_db, test_data):
+        """Test CRUD timings are recorded by model and operation."""
+        operation_metrics.enable()
+        try:
+            for user_data in test_data["users"]:
+                TestUser(**user_data).save(sync_db)
+            TestUser.find(sync_db)
+            stats = operation_metrics.snapshot(reset=True)
+        finally:
+            operation_metrics.disable()
+
+        assert stats[("TestUser", "save")].count == len(test_data["users"])
+        assert stats[("TestUser", "find")].count == 1
+        assert stats[("TestUser", "find")].errors == 0
+
+    def test_find_records(self, sync_db, test_data):
+        """Test loading read-only records."""
+        for user_data in test_data["users"]:
+            TestUser(**user_data).save(sync_db)
+
+        records = TestUser.find(sync_db, sort=[("age", ASCENDING)], as_="record")
+        assert len(records) == len(test_data["users"])
+        record = records[0]
+        assert record.name == test_data["users"][0]["name"]
+        assert isinstance(record.id, str)
+        assert record.to_dict()["email"] == record.email
+        with pytest.raises(AttributeError):
+            record.name = "Changed"
+
+        # Projected-out fields fall back to None
+        record = TestUser.find_one(
+            sync_db,
+            {"age": record.age},
+            {"name": 1},
+            as_="record",
+        )
+        assert record.email is None
+
+        # The full model can be loaded from a record and saved
+        user = records[0].to_model()
+        user.name = "Changed"
+        user.save(sync_db)
+        assert TestUser.find_one(sync_db, {"id": user.id}).name == "Changed"
+
+    def test_record_mutable_defaults(self):
+        """Test that records and their models never share mutable defaults."""
+
+        class Tagged(SyncMongoModel):
+            __collection__ = "tagged"
+
+            tags: List[str] = []
+            labels: Dict[str, str] = {}
+            kind: str = "post"
+
+        first = get_record_converter(Tagged)({"_id": ObjectId()})
+        second = get_record_converter(Tagged)({"_id": ObjectId()})
+        first.tags.append("a")
+        first.labels["a"] = "b"
+        assert (second.tags, second.labels, second.kind) == ([], {}, "post")
+
+        model = second.to_model(validate=False)
+        model.tags.append("b")
+        assert Tagged.model_fields["tags"].default == []
+        assert get_record_converter(Tagged)({"_id": ObjectId()}).tags == []
+
     def test_hooks(self, sync_db, test_data):
         """Test pre and post save hooks."""
 
@@ -206,3 +478,330 @@ class TestSyncModel:
         # Check that hooks were called
         assert TestUserWithHooks._pre_save_called is True
         assert TestUserWithHooks._post_save_called is True
+
+        # Hooks added to a single instance run too
+        calls = []
+        user = TestUserWithHooks(**test_data["users"][1])
+        user._pre_save_hooks = [
+            *user._pre_save_hooks,
+            lambda model: calls.append(model),
+        ]
+        user.save(sync_db)
+        assert calls == [user]
+
+    def test_iter_find(self, sync_db, test_data):
+        """Test streaming documents with iter_find."""
+        # Create and save multiple users
+        for user_data in test_data["users"]:
+            user = TestUser(**user_data)
+            user.save(sync_db)
+
+        # Iterate lazily over all users
+        users = TestUser.iter_find(sync_db, sort=[("age", 1)], batch_size=1)
+        assert not isinstance(users, list)
+        ages = [user.age for user in users]
+        assert ages == sorted(u["age"] for u in test_data["users"])
+
+        # Stop early and close the generator
+        users = TestUser.iter_find(sync_db, {"age": {"$gte": 30}})
+        first = next(users)
+        assert isinstance(first, TestUser)
+        assert first.age >= 30
+        users.close()
+
+    def test_paginate(self, sync_db):
+        """Test keyset pagination with a mixed-direction sort."""
+        # Create users with duplicate ages to exercise the tiebreakers
+        for i in range(7):
+            TestUser(
+                name=f"User {i}",
+                email=f"user{i}@example.com",
+                age=20 + i % 3,
+            ).save(
+                sync_db,
+            )
+
+        sort = [("age", -1), ("name", 1)]
+        expected = TestUser.find(sync_db, sort=sort)
+
+        # Walk all pages
+        seen = []
+        token = None
+        while True:
+            page = TestUser.paginate(sync_db, sort=sort, limit=3, token=token)
+            assert len(page.items) <= 3
+            seen.extend(page.items)
+            if not page.has_more:
+                break
+            token = page.next_token
+
+        assert [u.id for u in seen] == [u.id for u in expected]
+
+        # Pagination composes with a regular query
+        page = TestUser.paginate(sync_db, {"age": 20}, sort=sort, limit=2)
+        assert [u.name for u in page.items] == ["User 0", "User 3"]
+        page = TestUser.paginate(sync_db, {"age": 20}, sort=sort, token=page.next_token)
+        assert [u.name for u in page.items] == ["User 6"]
+        assert page.next_token is None
+
+        # Null, missing and mixed-type sort values are not skipped
+        collection = TestScore.get_collection(sync_db)
+        collection.insert_many(
+            [
+                {"name": "a", "score": 3},
+                {"name": "b", "score": None},
+                {"name": "c"},
+                {"name": "d", "score": "x"},
+                {"name": "e", "score": 1.5},
+                {"name": "f", "score": None},
+            ],
+        )
+        for direction in (1, -1):
+            score_sort = [("score", direction), ("_id", 1)]
+            expected = [doc["name"] for doc in collection.find().sort(score_sort)]
+            seen = []
+            token = None
+            while True:
+                page = TestScore.paginate(
+                    sync_db,
+                    sort=score_sort,
+                    limit=1,
+                    token=token,
+                )
+                seen.extend(score.name for score in page.items)
+                if not page.has_more:
+                    break
+                token = page.next_token
+            assert seen == expected
+
+        # Excluding the sort keys does not restart every page from the start
+        for projection in ({"_id": 0}, {"score": 0}):
+            seen = []
+            token = None
+            for _ in range(10):
+                page = TestScore.paginate(
+                    sync_db,
+                    sort=[("score", 1), ("_id", 1)],
+                    limit=2,
+                    token=token,
+                    projection=projection,
+                )
+                seen.extend(score.name for score in page.items)
+                if not page.has_more:
+                    break
+                token = page.next_token
+            assert sorted(seen) == ["a", "b", "c", "d", "e", "f"]
+
+        # Page sizes below 1 are rejected before querying
+        for limit in (0, -1):
+            with pytest.raises(ValueError, match="at least 1"):
+                TestUser.paginate(sync_db, sort=sort, limit=limit)
+
+    def test_find_without_validation(self, sync_db, test_data):
+        """Test trusted reads that skip pydantic validation."""
+        for user_data in test_data["users"]:
+            TestUser(**user_data).save(sync_db)
+
+        validated = TestUser.find(sync_db, sort=[("age", 1)])
+        trusted = TestUser.find(sync_db, sort=[("age", 1)], validate=False)
+        assert [u.model_dump() for u in trusted] == [u.model_dump() for u in validated]
+
+        found = TestUser.find_one(sync_db, {"age": 25}, validate=False)
+        assert isinstance(found, TestUser)
+        assert found.id == validated[0].id
+
+    def test_raw_results(self, sync_db, test_data):
+        """Test returning plain dicts instead of models."""
+        for user_data in test_data["users"]:
+            TestUser(**user_data).save(sync_db)
+
+        docs = TestUser.find(sync_db, sort=[("age", 1)], as_="dict")
+        assert all(type(doc) is dict for doc in docs)
+        assert "_id" not in docs[0]
+        assert isinstance(docs[0]["id"], str)
+        assert docs[0]["name"] == test_data["users"][0]["name"]
+
+        doc = TestUser.find_one(sync_db, {"id": docs[0]["id"]}, as_="dict")
+        assert doc == docs[0]
+
+        with pytest.raises(ValueError):
+            TestUser.find(sync_db, as_="xml")
+        with pytest.raises(ValueError):
+            TestUser.aggregate(sync_db, [], as_="model")
+
+    def test_save_only_changed_fields(self, sync_db, monkeypatch):
+        """Test that saving a loaded model only sends the changed fields."""
+        TestProfile(name="Jane", roles=["user"], metadata={"a": {"b": 1}}).save(
+            sync_db,
+        )
+        profile = TestProfile.find_one(sync_db, {"name": "Jane"})
+
+        collection = sync_db[TestProfile.__collection__]
+        updates = []
+        original_update_one = collection.update_one
+
+        def spy_update_one(query, update, *args, **kwargs):
+            updates.append(update)
+            return original_update_one(query, update, *args, **kwargs)
+
+        monkeypatch.setattr(collection, "update_one", spy_update_one)
+
+        # No changes: the round trip is skipped
+        profile.save(sync_db)
+        assert updates == []
+
+        # Assignment and in-place mutation of a nested value
+        profile.name = "Janet"
+        profile.metadata["a"]["b"] = 2
+        profile.save(sync_db)
+        assert len(updates) == 1
+        assert set(updates[0]) == {"$set"}
+        assert set(updates[0]["$set"]) == {"name", "metadata", "updated_at"}
+
+        # In-place list mutation after a save
+        profile.roles.append("admin")
+        profile.save(sync_db)
+        assert set(updates[1]["$set"]) == {"roles", "updated_at"}
+
+        # Saving again without changes does nothing
+        profile.save(sync_db)
+        assert len(updates) == 2
+
+        found = TestProfile.find_one(sync_db, {"id": profile.id})
+        assert found.name == "Janet"
+        assert found.roles == ["user", "admin"]
+        assert found.metadata == {"a": {"b": 2}}
+
+    def test_query_cache(self, sync_db, test_data):
+        """Test cached reads and write-driven invalidation."""
+        TestCachedUser.clear_cache()
+        for user_data in test_data["users"]:
+            TestCachedUser(**user_data).save(sync_db)
+
+        query = {"age": {"$gte": 30, "$lt": 40}, "name": {"$exists": True}}
+        first = TestCachedUser.find(sync_db, query)
+        # Equivalent queries with a different key order share an entry
+        reordered = {"name": {"$exists": True}, "age": {"$lt": 40, "$gte": 30}}
+        second = TestCachedUser.find(sync_db, reordered)
+        assert [user.email for user in second] == [user.email for user in first]
+        assert second[0] is not first[0]
+
+        stats = TestCachedUser.cache_stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+
+        # Cached results are decoded fresh, so mutating one does not leak
+        second[0].name = "Changed locally"
+        assert TestCachedUser.find(sync_db, query)[0].name == first[0].name
+
+        assert TestCachedUser.count(sync_db) == 3
+        TestCachedUser.find_one(sync_db, {"email": "user1@example.com"})
+        assert TestCachedUser.cache_stats().evictions == 1
+
+        # Any write invalidates the cache
+        user = TestCachedUser.find_one(sync_db, {"email": "user1@example.com"})
+        invalidations = TestCachedUser.cache_stats().invalidations
+        user.age = 31
+        user.save(sync_db)
+        stats = TestCachedUser.cache_stats()
+        assert stats.invalidations == invalidations + 1
+        assert stats.entries == 0
+        assert TestCachedUser.find_one(sync_db, {"id": user.id}).age == 31
+
+        TestCachedUser.delete_many(sync_db, {})
+        assert TestCachedUser.count(sync_db) == 0
+
+        assert TestUser.cache_stats() is None
+
+    def test_failed_bulk_write_invalidates_cache(self, sync_db, test_data):
+        """Test that a bulk write failing part-way still invalidates the cache."""
+        TestCachedUser.clear_cache()
+        assert TestCachedUser.find(sync_db, {}) == []
+
+        document = {"_id": ObjectId(), **test_data["users"][0]}
+        with pytest.raises(MongoORMError):
+            # The first insert is applied before the duplicate fails
+            TestCachedUser.bulk_write(
+                sync_db,
+                [InsertOne(document), InsertOne(dict(document))],
+            )
+
+        assert TestCachedUser.cache_stats().entries == 0
+        assert len(TestCachedUser.find(sync_db, {})) == 1
+
+    def test_find_by_ids(self, sync_db, test_data, monkeypatch):
+        """Test bulk lookups by id."""
+        users = [TestUser(**data).save(sync_db) for data in test_data["users"]]
+        missing = "507f1f77bcf86cd799439011"
+        ids = [users[2].id, missing, users[0].id, users[2].id]
+
+        found = TestUser.find_by_ids(sync_db, ids, chunk_size=2)
+        assert [user.email for user in found] == [
+            users[2].email,
+            users[0].email,
+            users[2].email,
+        ]
+
+        found = TestUser.find_by_ids(sync_db, ids, missing="none")
+        assert found[1] is None
+        assert found[0].id == users[2].id
+
+        found = TestUser.find_by_ids(sync_db, ids, preserve_order=False)
+        assert sorted(user.id for user in found) == sorted([users[0].id, users[2].id])
+
+        with pytest.raises(DocumentNotFoundError):
+            TestUser.find_by_ids(sync_db, ids, missing="raise")
+
+        # Bad arguments are rejected before any query runs
+        monkeypatch.setattr(
+            type(TestUser.get_collection(sync_db)),
+            "find",
+            lambda *args, **kwargs: pytest.fail("queried with bad arguments"),
+        )
+        with pytest.raises(ValueError, match="Unsupported missing policy"):
+            TestUser.find_by_ids(sync_db, ids, missing="ignore")
+        with pytest.raises(ValueError, match="preserve_order"):
+            TestUser.find_by_ids(sync_db, ids, missing="none", preserve_order=False)
+
+    def test_parallel_scan(self, sync_db):
+        """Test scanning a collection in parallel _id ranges."""
+        TestUser.save_many(
+            sync_db,
+            [
+                TestUser(name=f"User {i}", email=f"user{i}@example.com", age=i)
+                for i in range(50)
+            ],
+        )
+
+        for split in ("sample", "timestamp"):
+            users = list(
+                TestUser.parallel_scan(
+                    sync_db,
+                    {"age": {"$gte": 10}},
+                    partitions=4,
+                    batch_size=5,
+                    split=split,
+                ),
+            )
+            assert sorted(user.age for user in users) == list(range(10, 50))
+
+        seen = {}
+        count = TestUser.parallel_scan_each(
+            sync_db,
+            lambda partition, user: seen.setdefault(user.id, partition),
+            partitions=3,
+        )
+        assert count == len(seen) == 50
+
+        # Every document is scanned once even when _id types are mixed
+        TestScore.get_collection(sync_db).insert_many(
+            [{"_id": i, "name": f"int {i}"} for i in range(20)]
+            + [{"_id": f"s{i}", "name": f"str {i}"} for i in range(5)]
+            + [{"_id": ObjectId(), "name": f"oid {i}"} for i in range(5)],
+        )
+        names = [score.name for score in TestScore.parallel_scan(sync_db, partitions=4)]
+        assert len(names) == len(set(names)) == 30
+
+        # Stopping early shuts the workers down
+        scan = TestUser.parallel_scan(sync_db, partitions=4, batch_size=1)
+        assert next(scan) is not None
+        scan.close()
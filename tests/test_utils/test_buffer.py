@@ -0,0 +1,19 @@
+"""
+Tests for write buffer utilities.
+"""
+
+from pymongo_orm.utils.buffer import merge_updates
+
+
+class TestBufferUtils:
+    """Tests for write buffer utilities."""
+
+    def test_merge_updates(self):
+        """Test that later updates win when merging."""
+        merged = merge_updates(
+            {"$set": {"a": 1, "b": 2}, "$unset": {"c": ""}},
+            {"$set": {"b": 3, "c": 4}, "$unset": {"a": ""}},
+        )
+        assert merged == {"$set": {"b": 3, "c": 4}, "$unset": {"a": ""}}
+
+        assert merge_updates({"$set": {"a": 1}}, {}) == {"$set": {"a": 1}}
@@ -0,0 +1,32 @@
+"""
+Tests for batch write utilities.
+"""
+
+from pymongo import InsertOne
+
+from pymongo_orm.utils.bulk import PlannedWrite, chunk_writes
+
+
+def planned(size):
+    """Build a planned insert of the given encoded size."""
+    return PlannedWrite(model=None, operation=InsertOne({}), update={}, size=size)
+
+
+class TestBulkUtils:
+    """Tests for batch write utilities."""
+
+    def test_chunk_by_count(self):
+        """Test splitting writes by operation count."""
+        writes = [planned(10) for _ in range(5)]
+        chunks = list(chunk_writes(writes, chunk_size=2))
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+        # Chunk sizes are capped at the server's maxWriteBatchSize
+        chunks = list(chunk_writes(writes, chunk_size=10**9))
+        assert [len(chunk) for chunk in chunks] == [5]
+
+    def test_chunk_by_bytes(self):
+        """Test splitting writes by encoded size."""
+        writes = [planned(40), planned(40), planned(40), planned(200)]
+        chunks = list(chunk_writes(writes, chunk_size=100, max_bytes=100))
+        assert [len(chunk) for chunk in chunks] == [2, 1, 1]
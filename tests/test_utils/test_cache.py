@@ -0,0 +1,89 @@
+"""
+Tests for the query result cache.
+"""
+
+import time
+
+from bson import ObjectId
+from bson.codec_options import CodecOptions
+
+from pymongo_orm.utils.cache import (
+    CACHE_MISS,
+    QueryCache,
+    make_cache_key,
+    normalize_query,
+    set_cache_scope,
+)
+
+
+class TestQueryCache:
+    """Tests for the query result cache."""
+
+    def test_lru_and_size_eviction(self):
+        """Test eviction by entry count and by bytes."""
+        cache = QueryCache(max_entries=2, max_bytes=100, ttl=60)
+        cache.set("a", 1, 10, cache.generation)
+        cache.set("b", 2, 10, cache.generation)
+        assert cache.get("a") == 1  # "a" is now most recently used
+        cache.set("c", 3, 10, cache.generation)
+
+        assert cache.get("b") is CACHE_MISS
+        assert cache.get("a") == 1
+
+        cache.set("d", 4, 95, cache.generation)
+        assert cache.stats().entries == 1
+        assert cache.stats().size_bytes == 95
+
+        # Values larger than the whole cache are not stored
+        cache.set("e", 5, 101, cache.generation)
+        assert cache.get("e") is CACHE_MISS
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (2, 2, 3)
+
+    def test_ttl_and_invalidation(self):
+        """Test expiry and generation-guarded invalidation."""
+        cache = QueryCache(ttl=0.01)
+        cache.set("a", 1, 1, cache.generation)
+        time.sleep(0.02)
+        assert cache.get("a") is CACHE_MISS
+        assert cache.stats().evictions == 1
+
+        # A read that started before an invalidation is not cached
+        generation = cache.generation
+        cache.invalidate()
+        cache.set("a", 1, 1, generation)
+        assert cache.stats().entries == 0
+
+    def test_cached_docs_are_copies(self):
+        """Test that every hit decodes fresh documents."""
+        cache = QueryCache()
+        options = CodecOptions()
+        cache.set_docs("k", [{"_id": ObjectId(), "tags": ["a"]}], options, 0)
+
+        first = cache.get_docs("k", options)
+        first[0]["tags"].append("b")
+        assert cache.get_docs("k", options)[0]["tags"] == ["a"]
+
+    def test_normalize_query(self):
+        """Test that operator order does not matter but literal order does."""
+        assert normalize_query({"b": {"$lt": 2, "$gt": 1}, "a": 1}) == normalize_query(
+            {"a": 1, "b": {"$gt": 1, "$lt": 2}},
+        )
+        assert list(normalize_query({"doc": {"y": 1, "x": 2}})["doc"]) == ["y", "x"]
+
+    def test_cache_key_scope(self, mock_pymongo_client):
+        """Test keys are scoped by connection instead of by client id."""
+        db = mock_pymongo_client["test_db"]
+        key = make_cache_key(db, "find", {})
+        assert make_cache_key(db, "find", {}) == key
+
+        # A client seen for the first time never reuses another's scope
+        other = type(mock_pymongo_client)()
+        assert make_cache_key(other["test_db"], "find", {}) != key
+
+        # Connections scope their clients by registry key
+        set_cache_scope(other, ["mongodb://localhost:27017", []])
+        key = make_cache_key(other["test_db"], "find", {})
+        set_cache_scope(mock_pymongo_client, ["mongodb://localhost:27017", []])
+        assert make_cache_key(db, "find", {}) == key
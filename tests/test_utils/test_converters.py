@@ -4,13 +4,21 @@ Tests for utility converter functions.
 
 from datetime import datetime
 
-from bson import ObjectId
+import pytest
+from bson import ObjectId, encode
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from pydantic import BaseModel, Field, ValidationError
 
 from pymongo_orm.utils.converters import (
+    collection_for_result,
     doc_to_model,
     docs_to_models,
     ensure_object_id,
     format_timestamp,
+    get_batch_converter,
+    get_list_adapter,
+    get_result_converter,
     model_to_doc,
     process_query,
 )
@@ -33,6 +41,27 @@ class TestModel:
         return {k: v for k, v in self.__dict__.items() if k not in exclude}
 
 
+class TrustedModel(BaseModel):
+    """Pydantic model used to test validation-free construction."""
+
+    __trusted_reads__ = True
+
+    id: str = None
+    name: str
+    age: int = 0
+    tags: list = Field(default_factory=list)
+
+
+class FakeCollection:
+    """Minimal stand-in for a collection's codec option handling."""
+
+    def __init__(self, codec_options):
+        self.codec_options = codec_options
+
+    def with_options(self, codec_options):
+        return FakeCollection(codec_options)
+
+
 class TestUtilConverters:
     """Tests for utility converter functions."""
 
@@ -65,11 +94,24 @@ class TestUtilConverters:
         assert "id" not in processed
         assert isinstance(processed["_id"], ObjectId)
 
+        # Test with $in lists of string ids
+        query = {"id": {"$in": ["507f1f77bcf86cd799439011", ObjectId()]}}
+        processed = process_query(query)
+        assert all(isinstance(v, ObjectId) for v in processed["_id"]["$in"])
+        assert isinstance(query["id"]["$in"][0], str)
+
         # Test with other fields
         query = {"name": "Test", "age": {"$gt": 30}}
         processed = process_query(query)
         assert processed == query
 
+        # Natively keyed models only get id renamed to _id
+        query = {"id": {"$in": ["507f1f77bcf86cd799439011", 7]}}
+        processed = process_query(query, native_id=True)
+        assert processed == {"_id": {"$in": ["507f1f77bcf86cd799439011", 7]}}
+        query = {"_id": "507f1f77bcf86cd799439011"}
+        assert process_query(query, native_id=True) is query
+
     def test_doc_to_model(self):
         """Test document to model conversion."""
         # Test with _id field
@@ -87,6 +129,29 @@ class TestUtilConverters:
         assert model.name == "Test"
         assert model.age == 30
 
+    def test_doc_to_model_without_validation(self):
+        """Test trusted (validation-free) document conversion."""
+        doc = {"_id": ObjectId("507f1f77bcf86cd799439011"), "name": "Test"}
+
+        # __trusted_reads__ skips validation by default
+        model = doc_to_model(doc, TrustedModel)
+        assert model.id == "507f1f77bcf86cd799439011"
+        assert model.age == 0
+        assert model.tags == []
+        assert "_id" in doc
+
+        # Invalid data is not coerced or rejected on the trusted path
+        model = doc_to_model({"name": "Test", "age": "thirty"}, TrustedModel)
+        assert model.age == "thirty"
+
+        # Unknown keys are dropped, as with model_construct
+        model = doc_to_model({"name": "Test", "legacy": True}, TrustedModel)
+        assert model.model_dump() == {"id": None, "name": "Test", "age": 0, "tags": []}
+
+        # An explicit validate=True overrides the model setting
+        model = doc_to_model({"name": "Test", "age": "30"}, TrustedModel, validate=True)
+        assert model.age == 30
+
     def test_model_to_doc(self):
         """Test model to document conversion."""
         # Test with id field
@@ -128,6 +193,47 @@ class TestUtilConverters:
         assert models[1].name == "Test2"
         assert models[1].age == 40
 
+    def test_docs_to_models_batch_validation(self):
+        """Test whole lists are validated through a cached list adapter."""
+
+        class ValidatedModel(BaseModel):
+            id: str = None
+            name: str
+            age: int = 0
+
+        docs = [
+            {"_id": ObjectId("507f1f77bcf86cd799439011"), "name": "A", "age": "30"},
+            {"_id": ObjectId("507f1f77bcf86cd799439012"), "name": "B"},
+        ]
+        first = docs[0]
+        models = docs_to_models(docs, ValidatedModel)
+        assert [m.id for m in models] == [
+            "507f1f77bcf86cd799439011",
+            "507f1f77bcf86cd799439012",
+        ]
+        assert models[0].age == 30
+        assert models[1].age == 0
+
+        # _id is renamed in place, without copying the documents
+        assert docs[0] is first
+        assert "_id" not in first and first["id"] == models[0].id
+        assert get_list_adapter(ValidatedModel) is get_list_adapter(ValidatedModel)
+
+        # Plain classes are not batch validated
+        assert get_list_adapter(TestModel) is None
+
+        with pytest.raises(ValidationError):
+            docs_to_models([{"name": "C", "age": "old"}], ValidatedModel)
+
+        # Trusted reads skip validation
+        models = docs_to_models([{"name": "D", "age": "old"}], TrustedModel)
+        assert models[0].age == "old"
+
+        convert = get_batch_converter(ValidatedModel, "dict")
+        assert convert([{"_id": ObjectId("507f1f77bcf86cd799439011")}]) == [
+            {"id": "507f1f77bcf86cd799439011"},
+        ]
+
     def test_format_timestamp(self):
         """Test timestamp formatting."""
         # Test with specific datetime
@@ -141,3 +247,28 @@ class TestUtilConverters:
         # Basic validation - should be in ISO format
         assert "T" in formatted
         assert len(formatted) >= 19  # YYYY-MM-DDTHH:MM:SS
+
+    def test_result_modes(self):
+        """Test result converters and RawBSONDocument collections."""
+        oid = ObjectId("507f1f77bcf86cd799439011")
+
+        to_dict = get_result_converter(TrustedModel, "dict")
+        assert to_dict({"_id": oid, "name": "Test"}) == {
+            "id": "507f1f77bcf86cd799439011",
+            "name": "Test",
+        }
+        assert to_dict({"_id": "custom", "name": "Test"})["_id"] == "custom"
+
+        to_model = get_result_converter(TrustedModel, "model")
+        assert isinstance(to_model({"_id": oid, "name": "Test"}), TrustedModel)
+
+        raw = RawBSONDocument(encode({"_id": oid}))
+        assert get_result_converter(TrustedModel, "bson")(raw) is raw
+
+        with pytest.raises(ValueError):
+            get_result_converter(TrustedModel, "xml")
+
+        collection = FakeCollection(CodecOptions())
+        assert collection_for_result(collection, "model") is collection
+        raw_collection = collection_for_result(collection, "bson")
+        assert raw_collection.codec_options.document_class is RawBSONDocument
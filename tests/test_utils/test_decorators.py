@@ -10,11 +10,18 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 
 from pymongo_orm.utils.decorators import (
+    async_instrumented,
     async_retry,
     async_timing_decorator,
+    instrumented,
     retry,
     timing_decorator,
 )
+from pymongo_orm.utils.metrics import operation_metrics
+
+
+class Widget:
+    """Stand-in model class for instrumented methods."""
 
 
 class TestDecorators:
@@ -59,6 +66,67 @@ class TestDecorators:
         # assert "test_async_function took" in caplog.text
         # assert "s to execute" in caplog.text
 
+    def test_instrumented(self):
+        """Test instrumented methods publish timings only to subscribers."""
+        calls = []
+
+        class Implementation:
+            @classmethod
+            @instrumented
+            def save(cls, model, fail=False):
+                if fail:
+                    raise ValueError("save failed")
+                return "saved"
+
+        def listener(*timing):
+            calls.append(timing)
+
+        assert Implementation.save(Widget()) == "saved"
+        assert calls == []
+
+        operation_metrics.subscribe(listener)
+        try:
+            assert Implementation.save(Widget()) == "saved"
+            with pytest.raises(ValueError, match="save failed"):
+                Implementation.save(Widget(), fail=True)
+        finally:
+            operation_metrics.unsubscribe(listener)
+
+        assert [(model, op, failed) for model, op, _, failed in calls] == [
+            ("Widget", "save", False),
+            ("Widget", "save", True),
+        ]
+        assert all(isinstance(duration, int) for _, _, duration, _ in calls)
+        assert not operation_metrics.active
+
+    @pytest.mark.asyncio
+    async def test_async_instrumented(self):
+        """Test async instrumented methods and failing listeners."""
+
+        class Implementation:
+            @classmethod
+            @async_instrumented
+            async def find(cls, model_class):
+                await asyncio.sleep(0.01)
+                return []
+
+        def broken_listener(*timing):
+            raise RuntimeError("listener failed")
+
+        operation_metrics.subscribe(broken_listener)
+        operation_metrics.enable()
+        try:
+            # Listener errors never reach the caller
+            assert await Implementation.find(Widget) == []
+            stats = operation_metrics.snapshot(reset=True)
+        finally:
+            operation_metrics.unsubscribe(broken_listener)
+            operation_metrics.disable()
+
+        assert stats[("Widget", "find")].count == 1
+        assert stats[("Widget", "find")].max_ms >= 10
+        assert operation_metrics.snapshot() == {}
+
     def test_retry_decorator_success(self):
         """Test retry decorator with successful function."""
         mock_function = Mock(return_value="success")
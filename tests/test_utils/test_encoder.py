@@ -0,0 +1,117 @@
+"""
+Tests for compiled model encoders.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+from pymongo_orm.sync_model.model import SyncMongoModel
+from pymongo_orm.utils.encoder import encode_value, get_encoder
+
+
+class Status(str, Enum):
+    """Enum field type."""
+
+    ACTIVE = "active"
+    BANNED = "banned"
+
+
+class Address(BaseModel):
+    """Nested model."""
+
+    city: str
+    zip_code: Optional[str] = None
+
+
+class Profile(SyncMongoModel):
+    """Model with scalar, container and nested model fields."""
+
+    __collection__ = "profiles"
+
+    name: str
+    status: Status = Status.ACTIVE
+    seen_at: Optional[datetime] = None
+    tags: List[str] = Field(default_factory=list)
+    scores: Dict[str, int] = Field(default_factory=dict)
+    address: Optional[Address] = None
+    history: List[Address] = Field(default_factory=list)
+    extra: Dict[str, Any] = Field(default_factory=dict)
+
+
+class Loose(BaseModel):
+    """Model keeping undeclared fields."""
+
+    model_config = ConfigDict(extra="allow")
+
+    name: str
+
+
+class Masked(BaseModel):
+    """Model with a field serializer."""
+
+    secret: str
+
+    @field_serializer("secret")
+    def mask(self, value: str) -> str:
+        """Hide the secret."""
+        return "***"
+
+
+class TestEncoder:
+    """Tests for compiled model encoders."""
+
+    def test_matches_model_dump(self):
+        """Test the encoder produces what model_dump() does."""
+        profile = Profile(
+            name="Ada",
+            seen_at=datetime(2024, 1, 1),
+            tags=["a", "b"],
+            scores={"x": 1},
+            address=Address(city="London"),
+            history=[Address(city="Paris", zip_code="75001")],
+            extra={"nested": {"items": [Address(city="Rome")]}},
+        )
+        encode = get_encoder(Profile, ("id",))
+        doc = encode(profile)
+        assert doc == profile.model_dump(exclude={"id"})
+        assert list(doc) == list(profile.model_dump(exclude={"id"}))
+        assert "id" not in doc
+
+        # Containers are copied, not shared with the model
+        assert doc["tags"] is not profile.tags
+        assert doc["scores"] is not profile.scores
+        assert doc["extra"]["nested"] is not profile.extra["nested"]
+
+    def test_encoder_is_cached(self):
+        """Test encoders are compiled once per class and exclusion set."""
+        assert get_encoder(Profile, ("id",)) is get_encoder(Profile, ("id",))
+        assert get_encoder(Profile) is not get_encoder(Profile, ("id",))
+        assert Profile.__model_meta__.encode is get_encoder(Profile, ("id",))
+
+    def test_extra_fields(self):
+        """Test undeclared fields are kept for extra="allow" models."""
+        model = Loose(name="x", note="kept", nested=Address(city="Oslo"))
+        assert get_encoder(Loose)(model) == model.model_dump()
+
+    def test_constructed_model_missing_fields(self):
+        """Test fields missing from a constructed model are left out."""
+        model = Profile.model_construct(_fields_set={"name"}, name="Ada")
+        del model.__dict__["tags"]
+        doc = get_encoder(Profile, ("id",))(model)
+        assert doc == model.model_dump(exclude={"id"})
+        assert "tags" not in doc
+
+    def test_serializers_use_model_dump(self):
+        """Test classes with custom serializers fall back to model_dump()."""
+        assert get_encoder(Masked)(Masked(secret="pw")) == {"secret": "***"}
+
+    def test_encode_value(self):
+        """Test encoding values of unknown type."""
+        value = {"a": [Address(city="Oslo")], "b": ("x", {1, 2})}
+        assert encode_value(value) == {
+            "a": [{"city": "Oslo", "zip_code": None}],
+            "b": ("x", {1, 2}),
+        }
@@ -0,0 +1,69 @@
+"""
+Tests for cached collection handles.
+"""
+
+import pytest
+from pymongo import ReadPreference
+from pymongo.read_concern import ReadConcern
+from pymongo.write_concern import WriteConcern
+
+from pymongo_orm.sync_model.model import SyncMongoModel
+from pymongo_orm.utils.handles import (
+    clear_collection_handles,
+    collection_options,
+    get_model_collection,
+)
+
+
+class Metric(SyncMongoModel):
+    """Model with collection settings."""
+
+    __collection__ = "metrics"
+    __read_preference__ = "secondary_preferred"
+    __write_concern__ = {"w": 0}
+    __read_concern__ = "local"
+
+    name: str
+
+
+class Plain(SyncMongoModel):
+    """Model inheriting the database settings."""
+
+    __collection__ = "plain"
+
+    name: str
+
+
+class TestHandles:
+    """Tests for cached collection handles."""
+
+    def test_collection_options(self):
+        """Test turning model settings into collection options."""
+        assert collection_options(Plain) == {}
+        assert collection_options(Metric) == {
+            "read_preference": ReadPreference.SECONDARY_PREFERRED,
+            "write_concern": WriteConcern(w=0),
+            "read_concern": ReadConcern("local"),
+        }
+
+        class Broken(Plain):
+            __read_preference__ = "sideways"
+
+        with pytest.raises(ValueError):
+            collection_options(Broken)
+
+    def test_get_model_collection(self, sync_db):
+        """Test applying settings and caching handles."""
+        collection = get_model_collection(Metric, sync_db)
+        assert collection.name == "metrics"
+        assert collection.read_preference == ReadPreference.SECONDARY_PREFERRED
+        assert collection.write_concern == WriteConcern(w=0)
+
+        assert Metric.get_collection(sync_db) is collection
+        assert Plain.get_collection(sync_db) is not collection
+        assert Metric.get_collection(sync_db.client[sync_db.name]) is collection
+        other_db = sync_db.with_options(read_preference=ReadPreference.NEAREST)
+        assert Metric.get_collection(other_db) is not collection
+
+        clear_collection_handles()
+        assert Metric.get_collection(sync_db) is not collection
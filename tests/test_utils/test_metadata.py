@@ -0,0 +1,87 @@
+"""
+Tests for compiled model metadata.
+"""
+
+import pytest
+from pymongo import ASCENDING, DESCENDING
+
+from pymongo_orm.sync_model.model import SyncMongoModel
+from pymongo_orm.utils.converters import should_validate, uses_native_id
+from pymongo_orm.utils.metadata import build_index_models
+
+
+def audit(model):
+    """Hook used by the test model."""
+
+
+class Article(SyncMongoModel):
+    """Model with indexes and hooks."""
+
+    __collection__ = "articles"
+    __indexes__ = [{"fields": ["slug", ("published", DESCENDING)], "unique": True}]
+    __trusted_reads__ = True
+
+    _pre_save_hooks = [audit]
+
+    slug: str
+    published: bool = False
+
+
+class TestModelMeta:
+    """Tests for compiled model metadata."""
+
+    def test_compiled_at_class_creation(self):
+        """Test the record built for a model subclass."""
+        meta = Article.__model_meta__
+        assert meta.collection_name == "articles"
+        assert meta.index_models[0].document["key"] == {
+            "slug": ASCENDING,
+            "published": DESCENDING,
+        }
+        assert meta.index_models[0].document["unique"] is True
+        assert meta.field_names >= {"id", "slug", "published", "updated_at"}
+        assert meta.trusted_reads is True
+
+        doc = meta.encode(Article(id="0" * 24, slug="hello"))
+        assert "id" not in doc
+        assert doc["slug"] == "hello"
+
+        article = meta.decode({"_id": "0" * 24, "slug": "hello"}, True)
+        assert article.id == "0" * 24
+
+    def test_subclass_gets_own_record(self):
+        """Test that subclasses compile their own metadata."""
+
+        class Draft(Article):
+            __collection__ = "drafts"
+
+        assert Draft.__model_meta__.collection_name == "drafts"
+        assert Article.__model_meta__.collection_name == "articles"
+
+    def test_read_paths_use_record(self):
+        """Test that read settings come from the compiled record."""
+
+        class Event(SyncMongoModel):
+            __collection__ = "events"
+            __trusted_reads__ = True
+
+        Event.__trusted_reads__ = False
+        Event.__native_id__ = True
+        assert should_validate(Event) is False
+        assert uses_native_id(Event) is False
+
+    def test_invalid_collection_raises_on_use(self, sync_db):
+        """Test that bases without a collection fail only when used."""
+
+        class Base(SyncMongoModel):
+            name: str
+
+        assert Base.__model_meta__.collection_name is None
+        with pytest.raises(ValueError):
+            Base.get_collection(sync_db)
+
+    def test_build_index_models(self):
+        """Test normalizing index field specs."""
+        (index,) = build_index_models([{"fields": ["a", ("b", -1)], "sparse": True}])
+        assert index.document["key"] == {"a": 1, "b": -1}
+        assert index.document["sparse"] is True
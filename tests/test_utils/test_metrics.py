@@ -0,0 +1,161 @@
+"""
+Tests for the connection metrics listeners.
+"""
+
+from types import SimpleNamespace
+
+from pymongo import MongoClient
+
+from pymongo_orm.sync_model.connection import SyncMongoConnection
+from pymongo_orm.utils.metrics import (
+    NO_COLLECTION,
+    CommandMetrics,
+    HeartbeatMetrics,
+    LatencyHistogram,
+    MetricsRegistry,
+    PoolMetrics,
+)
+
+
+def command_events(listener, command, request_id, duration_micros, failure=None):
+    """Feed a started and a finished command event to a listener."""
+    name = next(iter(command))
+    listener.started(
+        SimpleNamespace(
+            command=command,
+            command_name=name,
+            connection_id=("localhost", 27017),
+            request_id=request_id,
+        ),
+    )
+    finished = SimpleNamespace(
+        command_name=name,
+        connection_id=("localhost", 27017),
+        request_id=request_id,
+        duration_micros=duration_micros,
+        failure=failure,
+    )
+    if failure is None:
+        listener.succeeded(finished)
+    else:
+        listener.failed(finished)
+
+
+class TestMetrics:
+    """Tests for the metrics registry and its listeners."""
+
+    def test_latency_histogram(self):
+        """Test bucket counts and percentile estimates."""
+        histogram = LatencyHistogram()
+        for duration_ms in [0.2] * 90 + [40.0] * 9 + [3000.0]:
+            histogram.record(duration_ms)
+
+        snapshot = histogram.snapshot()
+        assert snapshot.count == 100
+        assert snapshot.p50_ms == 0.5
+        assert snapshot.p95_ms == 50.0
+        assert snapshot.p99_ms == 50.0
+        assert snapshot.max_ms == 3000.0
+        assert snapshot.buckets[0.5] == 90
+        assert snapshot.buckets[5000.0] == 1
+        assert sum(snapshot.buckets.values()) == 100
+
+    def test_command_metrics(self):
+        """Test latency by collection and command, and error counts."""
+        registry = MetricsRegistry(max_pool_size=10)
+        listener = CommandMetrics(registry)
+
+        command_events(listener, {"find": "users"}, 1, 1500)
+        command_events(listener, {"find": "users"}, 2, 500)
+        command_events(listener, {"getMore": 123, "collection": "users"}, 3, 200)
+        command_events(listener, {"insert": "orders"}, 4, 900)
+        command_events(
+            listener,
+            {"insert": "orders"},
+            5,
+            300,
+            failure={"code": 11000, "codeName": "DuplicateKey"},
+        )
+        command_events(listener, {"ping": 1}, 6, 100)
+
+        snapshot = registry.snapshot()
+        assert snapshot.commands[("users", "find")].count == 2
+        assert snapshot.commands[("users", "find")].mean_ms == 1.0
+        assert snapshot.commands[("users", "getMore")].count == 1
+        assert snapshot.commands[("orders", "insert")].errors == 1
+        assert snapshot.commands[(NO_COLLECTION, "ping")].count == 1
+        assert snapshot.command_errors == {"DuplicateKey": 1}
+        assert snapshot.by_command()["insert"].count == 2
+
+        # Reset clears what was reported
+        registry.snapshot(reset=True)
+        assert registry.snapshot().commands == {}
+
+    def test_pool_and_heartbeat_metrics(self):
+        """Test pool usage, check-out waits, saturation and heartbeats."""
+        registry = MetricsRegistry(max_pool_size=4)
+        pool = registry.pool
+        heartbeats = HeartbeatMetrics(registry)
+        event = SimpleNamespace(duration=0.002, reason="timeout", awaited=False)
+
+        for _ in range(3):
+            pool.connection_created(event)
+            pool.connection_checked_out(event)
+        pool.connection_checked_in(event)
+        pool.connection_check_out_failed(event)
+        pool.pool_cleared(event)
+        heartbeats.succeeded(event)
+        heartbeats.succeeded(SimpleNamespace(duration=10.0, awaited=True))
+        heartbeats.failed(event)
+
+        snapshot = registry.snapshot(reset=True)
+        # The awaited heartbeat is left out of the latency histogram
+        assert snapshot.heartbeats.count == 2
+        assert snapshot.heartbeats.errors == 1
+        assert snapshot.heartbeat_failures == 1
+
+        snapshot = snapshot.pool
+        assert snapshot.open_connections == 3
+        assert snapshot.checked_out == 2
+        assert snapshot.peak_checked_out == 3
+        assert snapshot.saturation == 0.5
+        assert snapshot.checkout_wait.count == 4
+        assert snapshot.checkout_wait.p99_ms == 2.0
+        assert snapshot.checkout_failures == {"timeout": 1}
+        assert snapshot.clears == 1
+
+        # Reset keeps the current pool usage
+        after = registry.snapshot()
+        assert after.heartbeats.count == 0
+        assert after.pool.checked_out == 2
+        assert after.pool.peak_checked_out == 2
+
+    def test_connection_stats(self, monkeypatch, mock_pymongo_client):
+        """Test connections register the listeners only with metrics=True."""
+        options = []
+
+        def client(cls, *args, **kwargs):
+            options.append(kwargs)
+            return mock_pymongo_client
+
+        monkeypatch.setattr(MongoClient, "__new__", client)
+        try:
+            plain = SyncMongoConnection("mongodb://localhost:27017")
+            measured = SyncMongoConnection("mongodb://localhost:27017", metrics=True)
+
+            assert plain is not measured
+            assert plain.stats() is None
+            assert "metrics" not in options[1]
+            # The metrics pool listener also serves as the pool usage counter
+            listeners = options[1]["event_listeners"]
+            assert len(listeners) == 3
+            assert measured._usage is listeners[1]
+            assert isinstance(listeners[1], PoolMetrics)
+
+            listener = listeners[0]
+            command_events(listener, {"find": "users"}, 1, 700)
+            stats = measured.stats()
+            assert stats.commands[("users", "find")].count == 1
+            assert stats.pool.max_pool_size == measured._max_pool_size
+        finally:
+            SyncMongoConnection._instances.clear()
@@ -0,0 +1,132 @@
+"""
+Tests for keyset pagination utilities.
+"""
+
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from pymongo_orm.utils.pagination import (
+    build_keyset_query,
+    decode_page_token,
+    encode_page_token,
+    get_sort_values,
+    include_sort_keys,
+    keyset_page_query,
+    normalize_sort,
+)
+
+LATER_THAN_STRINGS = [
+    {"name": {"$type": alias}}
+    for alias in [
+        "object",
+        "binData",
+        "objectId",
+        "bool",
+        "date",
+    ]
+]
+LATER_THAN_IDS = [{"_id": {"$type": alias}} for alias in ["bool", "date"]]
+
+
+class TestPagination:
+    """Tests for keyset pagination utilities."""
+
+    def test_normalize_sort(self):
+        """Test that _id is appended as a tiebreaker."""
+        assert normalize_sort(None) == [("_id", 1)]
+        assert normalize_sort([("age", -1)]) == [("age", -1), ("_id", -1)]
+        assert normalize_sort([("age", 1), ("id", -1)]) == [("age", 1), ("_id", -1)]
+
+        with pytest.raises(ValueError):
+            normalize_sort([("age", "asc")])
+
+    def test_token_round_trip(self):
+        """Test that tokens are URL-safe and preserve BSON types and the sort."""
+        values = [datetime(2024, 1, 2, 3, 4, 5), "a/b+c", ObjectId()]
+        sort = [("created", -1), ("name", 1), ("_id", 1)]
+        token = encode_page_token(values, sort)
+
+        assert all(c.isalnum() or c in "-_" for c in token)
+        assert decode_page_token(token) == (sort, values)
+
+        with pytest.raises(ValueError):
+            decode_page_token("not a token!")
+
+    def test_token_bound_to_sort(self):
+        """Test a token cannot be replayed with a different sort."""
+        sort = [("age", 1), ("_id", 1)]
+        token = encode_page_token([30, ObjectId()], sort)
+
+        assert "$or" in keyset_page_query({}, sort, token)
+        with pytest.raises(ValueError, match="issued for sort"):
+            keyset_page_query({}, [("age", -1), ("_id", -1)], token)
+
+    def test_build_keyset_query(self):
+        """Test building a range predicate for a mixed-direction sort."""
+        oid = ObjectId()
+        sort = [("age", -1), ("name", 1), ("_id", 1)]
+        query = build_keyset_query(sort, [30, "Bob", oid])
+
+        assert query == {
+            "$or": [
+                {
+                    "$or": [
+                        {"age": {"$lt": 30}},
+                        {"age": None},
+                    ],
+                },
+                {
+                    "age": 30,
+                    "$or": [{"name": {"$gt": "Bob"}}, *LATER_THAN_STRINGS],
+                },
+                {
+                    "age": 30,
+                    "name": "Bob",
+                    "$or": [{"_id": {"$gt": oid}}, *LATER_THAN_IDS],
+                },
+            ],
+        }
+
+        with pytest.raises(ValueError):
+            build_keyset_query(sort, [30])
+        with pytest.raises(ValueError, match="array"):
+            build_keyset_query(sort, [[1, 2], "Bob", oid])
+
+    def test_build_keyset_query_nulls(self):
+        """Test null sort values continue into non-null and null values."""
+        oid = ObjectId()
+
+        # Ascending: nulls come first, so everything non-null is after them
+        query = build_keyset_query([("score", 1), ("_id", 1)], [None, oid])
+        assert query["$or"][0] == {"score": {"$ne": None}}
+        assert query["$or"][1]["score"] is None
+
+        # Descending: nothing sorts after null except the tiebreaker
+        query = build_keyset_query([("score", -1), ("_id", -1)], [None, oid])
+        assert query["score"] is None
+        assert query["$or"][0] == {"_id": {"$lt": oid}}
+        assert {"_id": None} not in query["$or"]
+
+    def test_sort_values_and_projection(self):
+        """Test extracting sort values and widening projections."""
+        oid = ObjectId()
+        doc = {"_id": oid, "profile": {"age": 30}}
+        sort = [("profile.age", 1), ("name", 1), ("_id", 1)]
+
+        assert get_sort_values(doc, sort) == [30, None, oid]
+        assert include_sort_keys({"email": 1}, sort) == {
+            "email": 1,
+            "profile.age": 1,
+            "name": 1,
+            "_id": 1,
+        }
+        assert include_sort_keys({"profile": 1}, [("profile.age", 1)]) == {
+            "profile": 1,
+        }
+        assert include_sort_keys({"bio": 0}, sort) == {"bio": 0}
+        # Excluded sort keys would be read as null, so they are fetched
+        assert include_sort_keys({"_id": 0}, sort) is None
+        assert include_sort_keys({"profile": 0, "bio": 0}, sort) == {"bio": 0}
+        assert include_sort_keys({"name.first": 0}, sort) is None
@@ -0,0 +1,28 @@
+"""
+Tests for query set helpers.
+"""
+
+from pymongo import ASCENDING, DESCENDING
+
+from pymongo_orm.utils.queryset import merge_queries, sort_spec
+
+
+class TestQuerySetUtils:
+    """Tests for query set helpers."""
+
+    def test_merge_queries(self):
+        """Test combining filters."""
+        assert merge_queries({}, {"a": 1}) == {"a": 1}
+        assert merge_queries({"a": 1}, {"b": 2}) == {"a": 1, "b": 2}
+        assert merge_queries({"a": {"$gt": 1}}, {"a": {"$lt": 5}}) == {
+            "$and": [{"a": {"$gt": 1}}, {"a": {"$lt": 5}}],
+        }
+
+    def test_sort_spec(self):
+        """Test parsing order_by keys."""
+        assert sort_spec(("-age", "name", "id", ("email", DESCENDING))) == [
+            ("age", DESCENDING),
+            ("name", ASCENDING),
+            ("_id", ASCENDING),
+            ("email", DESCENDING),
+        ]
@@ -0,0 +1,53 @@
+"""
+Tests for parallel scan utilities.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from bson import ObjectId
+
+from pymongo_orm.utils.scan import (
+    partition_queries,
+    sample_boundaries,
+    timestamp_boundaries,
+)
+
+
+class TestScanUtils:
+    """Tests for parallel scan utilities."""
+
+    def test_sample_boundaries(self):
+        """Test picking boundaries at sample quantiles."""
+        assert sample_boundaries(list(range(100)), 4) == [25, 50, 75]
+        assert sample_boundaries([1, 1, 1, 2], 4) == [1, 2]
+        assert sample_boundaries([1], 4) == []
+
+        # Mixed types: boundaries come from the most common type only
+        oids = sorted(ObjectId() for _ in range(6))
+        assert sample_boundaries([*oids, 1, "a", 2.5], 3) == [oids[2], oids[4]]
+        assert sample_boundaries([{"a": 1}, {"b": 2}], 2) == []
+
+    def test_timestamp_boundaries(self):
+        """Test splitting ObjectIds into even time ranges."""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        min_id = ObjectId.from_datetime(start)
+        max_id = ObjectId.from_datetime(start + timedelta(hours=4))
+
+        boundaries = timestamp_boundaries(min_id, max_id, 4)
+        assert [b.generation_time.hour for b in boundaries] == [1, 2, 3]
+        assert timestamp_boundaries(min_id, min_id, 4) == []
+        assert timestamp_boundaries(None, None, 4) == []
+
+    def test_partition_queries(self):
+        """Test building open-ended range queries."""
+        assert partition_queries({}, []) == [{}]
+        assert partition_queries({"a": 1}, [5]) == [
+            {"$and": [{"a": 1}, {"_id": {"$lt": 5}}]},
+            {"$and": [{"a": 1}, {"_id": {"$gte": 5}}]},
+            {"$and": [{"a": 1}, {"_id": {"$not": {"$type": "number"}}}]},
+        ]
+        assert partition_queries({}, [5, 9])[1] == {"_id": {"$gte": 5, "$lt": 9}}
+
+        with pytest.raises(ValueError, match="same BSON type"):
+            partition_queries({}, [5, "x"])